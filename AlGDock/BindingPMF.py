@@ -91,6 +91,15 @@ def HMStime(s):
   else:
     return '%d:%d:%.2f'%(int(s/3600),int(s/60%60),s%60)
 
+def systematic_resample(weights, nsamples=1):
+  """
+  Given normalized weights, returns indices of nsamples
+  drawn by systematic resampling
+  """
+  positions = (np.random.uniform() + np.arange(nsamples))/nsamples
+  return np.minimum(np.searchsorted(np.cumsum(weights), positions), \
+    len(weights)-1)
+
 class NullDevice():
   """
   A device to suppress output
@@ -112,6 +121,9 @@ class BPMF:
         kwargs[key] = None
     if kwargs['dir_grid'] is None:
       kwargs['dir_grid'] = ''
+    if kwargs['fraction_CD'] is not None:
+      print 'Warning: fraction_CD is deprecated and ignored. ' + \
+        'MixedHMC runs one constrained dynamics trial for every Cartesian trial.'
 
     mod_path = os.path.join(os.path.dirname(a.__file__),'BindingPMF.py')
     print """###########
@@ -388,10 +400,12 @@ last modified {1}
         ('T_SIMMIN',300.),
         ('T_TARGET',300.),
         ('H_mass',4.0),
-        ('fraction_CD',0.5),
         ('CD_steps_per_trial',5),
-        ('delta_t_CD',4.0),
+        ('delta_t_TD',3.0),
         ('delta_t',4.0),
+        ('GHMC_refresh',0.5),
+        ('GHMC_target_acc',0.75),
+        ('NUTS_target_acc',0.6),
         ('sampler','NUTS'),
         ('steps_per_seed',1000),
         ('seeds_per_state',50),
@@ -400,6 +414,7 @@ last modified {1}
         ('min_repX_acc',0.4),
         ('sweeps_per_cycle',1000),
         ('snaps_per_cycle',50),
+        ('max_snaps_per_cycle',None),
         ('attempts_per_sweep',25),
         ('steps_per_sweep',50),
         ('darts_per_sweep',0),
@@ -641,32 +656,38 @@ last modified {1}
       self.universe, self.molecule, True)
     from AlGDock.Integrators.ExternalMC.ExternalMC import ExternalMCIntegrator
     self.sampler['ExternalMC'] = ExternalMCIntegrator(\
-      self.universe, self.molecule, step_size=0.25*MMTK.Units.Ang)
+      self.universe, self.molecule, step_size=0.25*MMTK.Units.Ang, ntries=8)
 
+    # The torsional and Cartesian integrators for MixedHMC are only built once
+    # and are shared by both processes
+    TDintegrator = None
+    MDintegrator = None
     for p in ['cool', 'dock']:
       if self.params[p]['sampler'] == 'MixedHMC':
-        from AlGDock.Integrators.CDHMC import CDHMC
-        from AlGDock.Integrators.HamiltonianMonteCarlo.HamiltonianMonteCarlo \
-          import HamiltonianMonteCarloIntegrator
-        self.mixed_samplers = []
-        self.mixed_samplers.append(CDHMC.CDHMCIntegrator(self.universe, \
-          os.path.dirname(self._FNs['ligand_database']), \
-          os.path.dirname(self._FNs['forcefield'])))
-        self.mixed_samplers.append(HamiltonianMonteCarloIntegrator(self.universe))
-        self.sampler[p] = self._mixed_sampler2   #EU END
-#        from AlGDock.Integrators.CDHMC import CDHMC
-#        from AlGDock.Integrators.MixedHMC.MixedHMC import MixedHMCIntegrator
-#        CDIntegrator = CDHMC.CDHMCIntegrator(self.universe, \
-#          os.path.dirname(self._FNs['mol2']['L']), \
-#          os.path.dirname(self._FNs['forcefield']))
-#        self.sampler[p] = MixedHMCIntegrator(self.universe, CDIntegrator, \
-#          fraction_CD=self.params[p]['fraction_CD'], \
-#          CD_steps_per_trial=self.params[p]['CD_steps_per_trial'], \
-#          delta_t_CD=self.params[p]['delta_t_CD'])
+        from AlGDock.Integrators.MixedHMC.MixedHMC import MixedHMCIntegrator
+        if TDintegrator is None:
+          from AlGDock.Integrators.CDHMC import CDHMC
+          TDintegrator = CDHMC.CDHMCIntegrator(self.universe, \
+            os.path.dirname(self._FNs['ligand_database']), \
+            os.path.dirname(self._FNs['forcefield']))
+        self.sampler[p] = MixedHMCIntegrator(self.universe, \
+          TDintegrator, MDintegrator, \
+          CD_steps_per_trial=self.params[p]['CD_steps_per_trial'], \
+          delta_t_TD=self.params[p]['delta_t_TD'])
+        MDintegrator = self.sampler[p].MDintegrator
       elif self.params[p]['sampler'] == 'HMC':
-        from AlGDock.Integrators.HamiltonianMonteCarlo.HamiltonianMonteCarlo \
-          import HamiltonianMonteCarloIntegrator
-        self.sampler[p] = HamiltonianMonteCarloIntegrator(self.universe)
+        try:
+          # All trials run in a single compiled loop
+          from HMC import HMCIntegrator # @UnresolvedImport
+          self.sampler[p] = HMCIntegrator(self.universe)
+        except ImportError:
+          from AlGDock.Integrators.HamiltonianMonteCarlo.HamiltonianMonteCarlo \
+            import HamiltonianMonteCarloIntegrator
+          self.sampler[p] = HamiltonianMonteCarloIntegrator(self.universe)
+      elif self.params[p]['sampler'] == 'GHMC':
+        from AlGDock.Integrators.GHMC.GHMC import GHMCIntegrator
+        self.sampler[p] = GHMCIntegrator(self.universe, \
+          refresh=self.params[p]['GHMC_refresh'])
       elif self.params[p]['sampler'] == 'NUTS':
         from NUTS import NUTSIntegrator # @UnresolvedImport
         self.sampler[p] = NUTSIntegrator(self.universe)
@@ -845,9 +866,8 @@ last modified {1}
       u_n = self._u_kln([E],[lambda_n])
       du = u_n-u_o
       weights = np.exp(-du+min(du))
-      seedIndicies = np.random.choice(len(u_o), \
-        size = self.params['cool']['seeds_per_state'], \
-        p = weights/sum(weights))
+      seedIndicies = self._select_seeds(weights, \
+        self.params['cool']['seeds_per_state'], confs)
       seeds = [np.copy(confs[s]) for s in seedIndicies]
       
       # Store old data
@@ -1186,7 +1206,7 @@ last modified {1}
           for i_trans in range(n_trans_o, n_trans_n):
             self.universe.setConfiguration(conf_rot)
             self.universe.translateTo(self._random_trans[i_trans])
-            eT = self.universe.energyTerms()
+            eT = self._rigid_energyTerms(cool0_confs[c])
             for (key,value) in eT.iteritems():
               if key!='electrostatic': # For some reason, MMTK double-counts electrostatic energies
                 E[term_map[key]][c,i_rot,i_trans] += value
@@ -1372,9 +1392,11 @@ last modified {1}
       u_n = self._u_kln([E],[lambda_n])
       du = u_n-u_o
       weights = np.exp(-du+min(du))
-      seedIndicies = np.random.choice(len(u_o), \
-        size = self.params['dock']['seeds_per_state'], \
-        p=weights/sum(weights))
+      # In the first docking state, the weights are for
+      # randomly oriented copies of the configurations
+      seedIndicies = self._select_seeds(weights, \
+        self.params['dock']['seeds_per_state'], \
+        confs if len(confs)==len(weights) else None)
 
       if (not undock) and (self.params['dock']['pose'] == -1) \
           and (len(self.dock_protocol)==2):
@@ -2131,6 +2153,11 @@ last modified {1}
     if evaluator_key in self._evaluators.keys():
       self.universe._evaluator[(None,None,None)] = \
         self._evaluators[evaluator_key]
+      # Keep force field strengths consistent with the evaluator
+      for scalable in self._scalables:
+        if (scalable in lambda_n.keys()) and lambda_n[scalable]>0 and \
+            (scalable in self._forceFields.keys()):
+          self._forceFields[scalable].set_strength(lambda_n[scalable])
       return
     
     # Otherwise create a new evaluator
@@ -2322,9 +2349,57 @@ last modified {1}
     eval = ForceField.EnergyEvaluator(\
       self.universe, self.universe._forcefield, None, None, None, None)
     eval.key = evaluator_key
+    # Force fields that do not change under rigid body moves of the ligand
+    internal = [self._forceFields[key] for key in ['gaff','InternalRestraint'] \
+      if key in self._forceFields.keys()]
+    if ('OBC' in self._forceFields.keys()) and \
+        not self._forceFields['OBC'].useDesolvationGrid:
+      internal.append(self._forceFields['OBC'])
+    eval.rigid_fflists = ([ff for ff in fflist if ff in internal], \
+                          [ff for ff in fflist if ff not in internal])
     self.universe._evaluator[(None,None,None)] = eval
     self._evaluators[evaluator_key] = eval
 
+  def _rigid_energyTerms(self, internal_conf):
+    """
+    Returns the energy terms of the current configuration in rigid-move mode.
+    Terms that do not change under rotation and translation of the ligand
+    are evaluated once for each internal conformation and reused.
+    internal_conf is the ligand configuration before rotation and
+    translation. Only the external terms are recomputed.
+    """
+    eval = self.universe._evaluator[(None,None,None)]
+    if not hasattr(eval, 'rigid_evaluators'):
+      eval.rigid_evaluators = []
+      for ffs in eval.rigid_fflists:
+        if len(ffs)==0:
+          eval.rigid_evaluators.append(None)
+          continue
+        compoundFF = ffs[0]
+        for ff in ffs[1:]:
+          compoundFF += ff
+        eval.rigid_evaluators.append(ForceField.EnergyEvaluator(\
+          self.universe, compoundFF, None, None, None, None))
+      eval.rigid_internal = (None, {})
+
+    eT = {}
+    try:
+      (internal_evaluator, external_evaluator) = eval.rigid_evaluators
+      if (eval.rigid_internal[0] is None) or \
+          (not np.array_equal(eval.rigid_internal[0], internal_conf)):
+        internal_eT = {}
+        if internal_evaluator is not None:
+          self.universe._evaluator[(None,None,None)] = internal_evaluator
+          internal_eT = self.universe.energyTerms()
+        eval.rigid_internal = (np.array(internal_conf), internal_eT)
+      eT.update(eval.rigid_internal[1])
+      if external_evaluator is not None:
+        self.universe._evaluator[(None,None,None)] = external_evaluator
+        eT.update(self.universe.energyTerms())
+    finally:
+      self.universe._evaluator[(None,None,None)] = eval
+    return eT
+
   def _clear_evaluators(self):
     """
     Deletes the stored evaluators and grids to save memory
@@ -2401,57 +2476,118 @@ last modified {1}
       T_LOW, T_START, HMStime(time.time()-self.start_times['T_ramp'])) + \
       "changing energy to %.3g kcal/mol"%(e_f))
 
+  def _select_seeds(self, weights, nseeds, confs=None):
+    """
+    Returns indices of nseeds seeds, given importance weights.
+    If confs are given, a diverse subset with about the effective sample
+    size is chosen greedily, maximizing the product of the weight and the
+    RMSD to the closest selected configuration. The remaining seeds
+    duplicate the subset by systematic resampling.
+    Otherwise, all the seeds are from systematic resampling.
+    """
+    weights = np.array(weights, dtype=float)
+    weights = weights/np.sum(weights)
+    if confs is None:
+      return systematic_resample(weights, nseeds)
+
+    ndistinct = int(min(nseeds, max(1, np.floor(1./np.sum(weights*weights)))))
+    X = np.array(confs)
+    rmsd = lambda ind: np.sqrt(np.mean(np.sum((X-X[ind])**2, axis=2), axis=1))
+    selected = [np.argmax(weights)]
+    d = rmsd(selected[0])
+    nearest = np.zeros(len(weights), dtype=int)
+    while len(selected)<ndistinct:
+      score = weights*d
+      ind = np.argmax(score)
+      if score[ind]<=0.:
+        break
+      d_ind = rmsd(ind)
+      nearest[d_ind<d] = len(selected)
+      d = np.minimum(d, d_ind)
+      selected.append(ind)
+    selected = np.array(selected, dtype=int)
+    # Each selected seed carries the weight of the configurations it is
+    # closest to
+    weights_s = np.bincount(nearest, weights=weights, minlength=len(selected))
+    duplicates = selected[systematic_resample(weights_s, nseeds-len(selected))]
+    return np.concatenate([selected, duplicates])
+
   def _initial_sim_state(self, seeds, process, lambda_k):
     """
     Initializes a state, returning the configurations and potential energy.
-    Attempts simulation up to 5 times, adjusting the time step.
+    While the time step is adjusted, up to 12 times, only a pilot batch of
+    seeds is simulated. Once the acceptance target is met or the attempts
+    run out, the remaining seeds are simulated with the last time step
+    that the pilot batch ran with.
     """
     
     if not 'delta_t' in lambda_k.keys():
       lambda_k['delta_t'] = 1.*self.params[process]['delta_t']*MMTK.Units.fs
     lambda_k['steps_per_trial'] = self.params[process]['steps_per_sweep']
+    if self.params[process]['sampler'] in ['GHMC','NUTS']:
+      # Restart time step adaptation in every new state
+      lambda_k['dual_averaging'] = None
+
+    seeds = list(seeds)
+    nseeds = len(seeds)
+    npilot = min(nseeds, max(self._cores, 5))
+    results = [None]*nseeds
+    deltaEs = np.zeros(nseeds)
 
     attempts_left = 12
-    while (attempts_left>0):
+    while True:
+      if attempts_left>0:
+        inds = range(npilot)
+      else:
+        inds = [k for k in range(npilot, nseeds) if results[k] is None]
+        if len(inds)==0:
+          break
+
       # Get initial potential energy
       Es_o = []
-      for seed in seeds:
-        self.universe.setConfiguration(Configuration(self.universe, seed))
+      for k in inds:
+        self.universe.setConfiguration(Configuration(self.universe, seeds[k]))
         Es_o.append(self.universe.energy())
       Es_o = np.array(Es_o)
     
       # Perform simulation
-      results = []
       if self._cores>1:
         # Multiprocessing code
         m = multiprocessing.Manager()
         task_queue = m.Queue()
         done_queue = m.Queue()
-        for k in range(len(seeds)):
+        for k in inds:
           task_queue.put((seeds[k], process, lambda_k, True, k))
+        ncores = min(self._cores, len(inds))
         processes = [multiprocessing.Process(target=self._sim_one_state_worker, \
-            args=(task_queue, done_queue)) for p in range(self._cores)]
-        for p in range(self._cores):
+            args=(task_queue, done_queue)) for p in range(ncores)]
+        for p in range(ncores):
           task_queue.put('STOP')
         for p in processes:
           p.start()
         for p in processes:
           p.join()
-        results = [done_queue.get() for seed in seeds]
+        batch = sorted([done_queue.get() for k in inds], \
+          key=lambda d: d['reference'])
         for p in processes:
           p.terminate()
       else:
         # Single process code
-        results = [self._sim_one_state(\
-          seeds[k], process, lambda_k, True, k) for k in range(len(seeds))]
-
-      seeds = [result['confs'] for result in results]
-      Es_n = np.array([result['Etot'] for result in results])
-      deltaEs = Es_n-Es_o
+        batch = [self._sim_one_state(\
+          seeds[k], process, lambda_k, True, k) for k in inds]
+
+      for (k, result) in zip(inds, batch):
+        seeds[k] = result['confs']
+        results[k] = result
+      Es_n = np.array([result['Etot'] for result in batch])
+      deltaEs[inds] = Es_n-Es_o
+      if attempts_left==0:
+        # The remaining seeds have been simulated
+        break
       attempts_left -= 1
 
       # Get the time step
-      delta_t = np.array([result['delta_t'] for result in results])
+      delta_t = np.array([result['delta_t'] for result in batch])
       if np.std(delta_t)>1E-3:
         # If the integrator adapts the time step, take an average
         delta_t = min(max(np.mean(delta_t), \
@@ -2459,12 +2595,14 @@ last modified {1}
           self.params[process]['delta_t']*0.1*MMTK.Units.fs)
       else:
         delta_t = delta_t[0]
+      (delta_t_run, steps_per_trial_run) = \
+        (delta_t, lambda_k['steps_per_trial'])
 
       # Adjust the time step
-      if 'HamiltonianMonteCarlo' in self.sampler[process].__module__:
+      if self.params[process]['sampler']=='HMC':
         # Adjust the time step for Hamiltonian Monte Carlo
-        acc_rate = float(np.sum([r['acc_Sampler'] for r in results]))/\
-          np.sum([r['att_Sampler'] for r in results])
+        acc_rate = float(np.sum([r['acc_Sampler'] for r in batch]))/\
+          np.sum([r['att_Sampler'] for r in batch])
         if acc_rate>0.8:
           delta_t += 0.125*MMTK.Units.fs
         elif acc_rate<0.4:
@@ -2475,29 +2613,43 @@ last modified {1}
             delta_t -= 0.25*MMTK.Units.fs
         else:
           attempts_left = 0
+      elif self.params[process]['sampler'] in ['GHMC','NUTS']:
+        # Adapt the time step by dual averaging
+        acc_rate = float(np.sum([r['acc_Sampler'] for r in batch]))/\
+          np.sum([r['att_Sampler'] for r in batch])
+        (delta_t, on_target) = \
+          self._adapt_delta_t(lambda_k, acc_rate, delta_t, process)
+        if on_target:
+          attempts_left = 0
       else:
         # For other integrators, make sure the time step
         # is small enough to see changes in the energy
-        if (np.std(deltaEs)<1E-3):
+        if (np.std(deltaEs[inds])<1E-3):
           delta_t -= 0.25*MMTK.Units.fs
         else:
           attempts_left = 0
         
+      # GHMC and NUTS time steps are also bounded from above
+      # in _adapt_delta_t
       if delta_t<0.1*MMTK.Units.fs:
         delta_t = 0.1*MMTK.Units.fs
 
+      if attempts_left==0:
+        # Do not use an adjustment that the pilot batch has not tested
+        (delta_t, lambda_k['steps_per_trial']) = \
+          (delta_t_run, steps_per_trial_run)
       lambda_k['delta_t'] = delta_t
 
     sampler_metrics = ''
-    for s in ['ExternalMC', 'SmartDarting', 'Sampler']:
+    for s in ['ExternalMC', 'SmartDarting', 'Sampler', 'CD', 'MD']:
       if np.array(['acc_'+s in r.keys() for r in results]).any():
-        acc = np.sum([r['acc_'+s] for r in results])
-        att = np.sum([r['att_'+s] for r in results])
-        time = np.sum([r['time_'+s] for r in results])
+        acc = np.sum([r['acc_'+s] for r in results if 'acc_'+s in r.keys()])
+        att = np.sum([r['att_'+s] for r in results if 'att_'+s in r.keys()])
+        time = np.sum([r['time_'+s] for r in results if 'time_'+s in r.keys()])
         if att>0:
           sampler_metrics += '%s %d/%d=%.2f (%.1f s); '%(\
             s,acc,att,float(acc)/att,time)
-    return (seeds, Es_n-Es_o, delta_t, sampler_metrics)
+    return (seeds, deltaEs, delta_t, sampler_metrics)
   
   def _replica_exchange(self, process):
     """
@@ -2505,19 +2657,33 @@ last modified {1}
     """
     if not process in ['dock','cool']:
       raise Exception('Process must be dock or cool')
+
+    # For sampling importance resampling, get free energies of the
+    # thermodynamic states from the completed cycles
+    do_SIR = self.params[process]['sampling_importance_resampling']
+    if do_SIR:
+      if process=='cool':
+        self.calc_f_L(do_solvation=False)
+        f_k = self.f_L['cool_MBAR'][-1] if len(self.f_L['cool_MBAR'])>0 else []
+      elif process=='dock':
+        self.calc_f_RL(do_solvation=False)
+        f_k = self.f_RL['grid_MBAR'][-1] \
+          if len(self.f_RL['grid_MBAR'])>0 else []
+
 # GMC
     def gMC_initial_setup():
       """
       Initialize BAT converter object.
       Decide which internal coord to crossover. Here, only the soft torsions will be crossovered.
-      Produce a list of replica (state) index pairs to be swaped. Only Neighbor pairs will be swaped.
+      Produce lists of replica (state) index pairs to be swaped. Only Neighbor pairs will be swaped.
+      No state appears twice in a list, so the pairs in a list are independent.
       Assume that self.universe, self.molecule and K (number of states) exist
       as global variables when the function is called.
       """
       from AlGDock.RigidBodies import identifier
       import itertools
       BAT_converter = identifier( self.universe, self.molecule )
-      BAT = BAT_converter.BAT( extended = True )
+      BAT = BAT_converter.BAT( self.universe.configuration().array, extended = True )
       # this assumes that the torsional angles are stored in the tail of BAT
       softTorsionId = [ i + len(BAT) - BAT_converter.ntorsions for i in BAT_converter._softTorsionInd ]
       torsions_to_crossover = []
@@ -2530,96 +2696,66 @@ last modified {1}
       if len( BAT_converter.BAT_to_crossover ) == 0:
         self.tee('  GMC No BAT to crossover')
       state_indices = range( K )
-      state_indices_to_swap = zip( state_indices[0::2], state_indices[1::2] ) + \
-                      zip( state_indices[1::2], state_indices[2::2] )
+      state_pairs_to_swap = [zip( state_indices[0::2], state_indices[1::2] ), \
+                             zip( state_indices[1::2], state_indices[2::2] )]
       #
-      return BAT_converter, state_indices_to_swap
+      return BAT_converter, state_pairs_to_swap
     #
-    def do_gMC( nr_attempts, BAT_converter, state_indices_to_swap, torsion_threshold ):
+    def do_gMC( nr_attempts, BAT_converter, state_pairs_to_swap, torsion_threshold ):
       """
       Assume self.universe, confs, lambdas, state_inds, inv_state_inds exist as global variables
       when the function is called.
       If at least one of the torsions in the combination chosen for an crossover attempt
       changes more than torsion_threshold, the crossover will be attempted.
+      All the candidates for a list of state pairs are converted to
+      Cartesian coordinates and evaluated together, using multiple cores.
       The function will update confs.
       It returns the number of attempts and the number of accepted moves.
       """
-      if nr_attempts < 0:
-        raise Exception('Number of attempts must be nonnegative!')
-      if torsion_threshold < 0.:
-        raise Exception('Torsion threshold must be nonnegative!')
-      #
       if len( BAT_converter.BAT_to_crossover ) == 0:
-        return 0., 0.
+        return 0, 0
       #
-      from random import randrange
+      from AlGDock.GMC import attempt_crossovers
       # get reduced energies and BAT for all configurations in confs
-      BATs = []
+      BATs = np.array([BAT_converter.BAT( confs[c_ind], extended = True ) \
+        for c_ind in range(K)], dtype = float)
       energies = np.zeros( K, dtype = float )
       for c_ind in range(K):
         s_ind = state_inds[ c_ind ]
         self.universe.setConfiguration( Configuration( self.universe, confs[c_ind] ) )
-        BATs.append( np.array( BAT_converter.BAT( extended = True ) , dtype = float ) )
         self._set_universe_evaluator( lambdas[ s_ind ] )
-        reduced_e = self.universe.energy() / ( R*lambdas[ s_ind ]['T'] )
-        energies[ c_ind ] = reduced_e
+        energies[ c_ind ] = self.universe.energy() / ( R*lambdas[ s_ind ]['T'] )
       #
-      nr_sets_of_torsions = len( BAT_converter.BAT_to_crossover )
+      def evaluate( tasks ):
+        if self._cores>1 and len(tasks)>1:
+          for t in range(len(tasks)):
+            task_queue.put((tasks[t][0], lambdas[ tasks[t][1] ], t))
+          ncores = min(self._cores, len(tasks))
+          for p in range(ncores):
+            task_queue.put('STOP')
+          processes = [multiprocessing.Process( \
+            target=self._crossover_energy_worker, \
+            args=(BAT_converter, task_queue, done_queue)) \
+            for p in range(ncores)]
+          for p in processes:
+            p.start()
+          for p in processes:
+            p.join()
+          unordered_results = [done_queue.get() for t in range(len(tasks))]
+          results = sorted(unordered_results, key=lambda d: d['reference'])
+          for p in processes:
+            p.terminate()
+        else:
+          results = [self._crossover_energy( BAT_converter, \
+            tasks[t][0], lambdas[ tasks[t][1] ], t ) for t in range(len(tasks))]
+        return [(r['confs'], r['u']) for r in results]
       #
-      attempt_count , acc_count = 0 , 0
-      sweep_count = 0
-      while True:
-        sweep_count += 1
-        if (sweep_count * K) > (1000 * nr_attempts):
-          self.tee('  GMC Sweep too many times, but few attempted. Consider reducing torsion_threshold.')
-          return attempt_count, acc_count
-        #
-        for state_pair in state_indices_to_swap:
-          conf_ind_k0 = inv_state_inds[ state_pair[0] ]
-          conf_ind_k1 = inv_state_inds[ state_pair[1] ]
-          # check if it should attempt for this pair of states
-          ran_set_torsions = BAT_converter.BAT_to_crossover[ randrange( nr_sets_of_torsions ) ]
-          do_crossover = np.any(np.abs(BATs[conf_ind_k0][ran_set_torsions] - BATs[conf_ind_k1][ran_set_torsions]) >= torsion_threshold)
-          if do_crossover:
-            attempt_count += 1
-            # BAT and reduced energies before crossover
-            BAT_k0_be = copy.deepcopy( BATs[conf_ind_k0] )
-            BAT_k1_be = copy.deepcopy( BATs[conf_ind_k1] )
-            e_k0_be = energies[conf_ind_k0]
-            e_k1_be = energies[conf_ind_k1]
-            # BAT after crossover
-            BAT_k0_af = copy.deepcopy( BAT_k0_be )
-            BAT_k1_af = copy.deepcopy( BAT_k1_be )
-            for index in ran_set_torsions:
-              tmp = BAT_k0_af[ index ]
-              BAT_k0_af[ index ] = BAT_k1_af[ index ]
-              BAT_k1_af[ index ] = tmp
-            # Cartesian coord and reduced energies after crossover.
-            BAT_converter.Cartesian( BAT_k0_af )
-            self._set_universe_evaluator( lambdas[ state_pair[0] ] )
-            e_k0_af = self.universe.energy() / ( R*lambdas[ state_pair[0] ]['T'] )
-            conf_k0_af = copy.deepcopy( self.universe.configuration().array )
-            #
-            BAT_converter.Cartesian( BAT_k1_af )
-            self._set_universe_evaluator( lambdas[ state_pair[1] ] )
-            e_k1_af = self.universe.energy() / ( R*lambdas[ state_pair[1] ]['T'] )
-            conf_k1_af = copy.deepcopy( self.universe.configuration().array )
-            #
-            de = ( e_k0_be - e_k0_af ) + ( e_k1_be - e_k1_af )
-            # update confs, energies, BATS
-            if (de > 0) or ( np.random.uniform() < np.exp(de) ):
-              acc_count += 1
-              confs[conf_ind_k0] = conf_k0_af
-              confs[conf_ind_k1] = conf_k1_af
-              #
-              energies[conf_ind_k0] = e_k0_af
-              energies[conf_ind_k1] = e_k1_af
-              #
-              BATs[conf_ind_k0] = BAT_k0_af
-              BATs[conf_ind_k1] = BAT_k1_af
-            #
-            if attempt_count == nr_attempts:
-              return attempt_count, acc_count
+      attempt_count, acc_count = attempt_crossovers( confs, BATs, energies, \
+        inv_state_inds, state_pairs_to_swap, BAT_converter.BAT_to_crossover, \
+        torsion_threshold, nr_attempts, evaluate )
+      if attempt_count < nr_attempts:
+        self.tee('  GMC Sweep too many times, but few attempted. Consider reducing torsion_threshold.')
+      return attempt_count, acc_count
     #
     self._set_lock(process)
 
@@ -2640,6 +2776,11 @@ last modified {1}
 
     # A list of pairs of replica indicies
     K = len(lambdas)
+    if do_SIR and (len(f_k)!=K):
+      self.tee('  skipping sampling importance resampling;' + \
+        ' free energies are not available for all states')
+      do_SIR = False
+
     pairs_to_swap = []
     for interval in range(1,min(5,K)):
       lower_inds = []
@@ -2663,12 +2804,35 @@ last modified {1}
         self.confs[process]['SmartDarting'] = \
           self.sampler[process+'_SmartDarting'].confs
   
-    # storage[key][sweep_index][state_index] will contain data
-    # from the replica exchange sweeps
+    # storage[key][snapshot_index][replica_index] will contain data
+    # from the replica exchange sweeps. The arrays are preallocated and
+    # coordinates are stored in single precision. If there are more than
+    # max_snaps_per_cycle snapshots, every other stored snapshot is
+    # discarded and the interval between snapshots is doubled.
+    nsweeps = self.params[process]['sweeps_per_cycle']
+    snap_interval = self.params[process]['snaps_per_cycle']
+    max_snaps = nsweeps/snap_interval
+    if self.params[process]['max_snaps_per_cycle'] is not None:
+      max_snaps = min(max_snaps, \
+        max(self.params[process]['max_snaps_per_cycle'], 1))
+    storage_terms = list(terms)
+    if (process=='dock') and (self.params['dock']['rmsd'] is not False):
+      storage_terms.append('rmsd')
     storage = {}
-    for var in ['confs','state_inds','energies']:
-      storage[var] = []
-    
+    storage['confs'] = np.zeros(\
+      (max_snaps, K, self.universe.numberOfAtoms(), 3), dtype=np.float32)
+    storage['state_inds'] = np.zeros((max_snaps, K), dtype=int)
+    storage['energies'] = dict([(term, np.zeros((max_snaps, K), dtype=float)) \
+      for term in storage_terms])
+    nsnaps = 0
+    if do_SIR:
+      # storage['log_weights'][snapshot_index][replica_index][state_index]
+      # are normalized by log_norm[state_index], which is updated as
+      # snapshots are stored
+      from pymbar.utils import logsumexp
+      storage['log_weights'] = np.zeros((max_snaps, K, K), dtype=float)
+      log_norm = -np.inf*np.ones(K)
+
     self.start_times['repX cycle'] = time.time()
 
     if self._cores>1:
@@ -2686,12 +2850,12 @@ last modified {1}
       gMC_attempt_count = 0
       gMC_acc_count     = 0
       time_gMC = 0.0
-      BAT_converter, state_indices_to_swap = gMC_initial_setup()
+      BAT_converter, state_pairs_to_swap = gMC_initial_setup()
 
     # MC move statistics
     acc = {}
     att = {}
-    for move_type in ['ExternalMC','SmartDarting','Sampler']:
+    for move_type in ['ExternalMC','SmartDarting','Sampler','CD','MD']:
       acc[move_type] = np.zeros(K, dtype=int)
       att[move_type] = np.zeros(K, dtype=int)
       self.timings[move_type] = 0.
@@ -2702,8 +2866,6 @@ last modified {1}
     # Do replica exchange
     state_inds = range(K)
     inv_state_inds = range(K)
-    nsweeps = self.params[process]['sweeps_per_cycle']
-    nsnaps = nsweeps/self.params[process]['snaps_per_cycle']
     for sweep in range(nsweeps):
       E = {}
       for term in terms:
@@ -2729,23 +2891,24 @@ last modified {1}
         results = [self._sim_one_state(confs[k], process, \
             lambdas[state_inds[k]], False, k) for k in range(K)]
 
+      for k in range(K):
+        confs[k] = results[k]['confs']
+
       # GMC
       if do_gMC:
         time_start_gMC = time.time()
-        att_count, acc_count = do_gMC( nr_gMC_attempts, BAT_converter, state_indices_to_swap, torsion_threshold )
+        att_count, acc_count = do_gMC( nr_gMC_attempts, BAT_converter, state_pairs_to_swap, torsion_threshold )
         gMC_attempt_count += att_count
         gMC_acc_count     += acc_count
-        time_gMC =+ ( time.time() - time_start_gMC )
+        time_gMC += ( time.time() - time_start_gMC )
 
       # Store energies
-      for k in range(K):
-        confs[k] = results[k]['confs']
       mean_energies.append(np.mean([results[k]['Etot'] for k in range(K)]))
       E = self._energyTerms(confs, E, process=process)
 
       # Store MC move statistics
       for k in range(K):
-        for move_type in ['ExternalMC','SmartDarting','Sampler']:
+        for move_type in ['ExternalMC','SmartDarting','Sampler','CD','MD']:
           key = 'acc_'+move_type
           if key in results[k].keys():
             acc[move_type][state_inds[k]] += results[k][key]
@@ -2763,14 +2926,35 @@ last modified {1}
       self.timings['repX'] += (time.time()-repX_start_time)
 
       # Store data in local variables
-      if (sweep+1)%self.params[process]['snaps_per_cycle']==0:
+      if ((sweep+1)%snap_interval==0) and (nsnaps==max_snaps):
+        # Thin the stored snapshots
+        nsnaps = max_snaps/2
+        for data in [storage['confs'], storage['state_inds']] + \
+            storage['energies'].values() + \
+            ([storage['log_weights']] if do_SIR else []):
+          data[:nsnaps] = data[1:2*nsnaps:2]
+        snap_interval *= 2
+        if do_SIR:
+          log_norm = logsumexp(\
+            storage['log_weights'][:nsnaps].reshape((-1,K)), axis=0)
+      if (sweep+1)%snap_interval==0:
         if (process=='dock') and (self.params['dock']['rmsd'] is not False):
           confs_prmtop_order = [conf[self.molecule.prmtop_atom_order,:]*10. \
             for conf in confs]
           E['rmsd'] = self.get_rmsds(confs_prmtop_order)
-        storage['confs'].append(list(confs))
-        storage['state_inds'].append(list(state_inds))
-        storage['energies'].append(copy.deepcopy(E))
+        for k in range(K):
+          storage['confs'][nsnaps,k] = confs[k]
+        storage['state_inds'][nsnaps] = state_inds
+        for term in storage_terms:
+          storage['energies'][term][nsnaps] = E[term]
+        if do_SIR:
+          # MBAR weights of the new configurations in every state.
+          # All states have the same number of samples, so N_k cancels.
+          log_w = f_k - np.array(self._u_kln(E, lambdas)[0]).T
+          log_w -= logsumexp(log_w, axis=1)[:,np.newaxis]
+          storage['log_weights'][nsnaps] = log_w
+          log_norm = np.logaddexp(log_norm, logsumexp(log_w, axis=0))
+        nsnaps += 1
 
     # GMC
     if do_gMC:
@@ -2784,7 +2968,7 @@ last modified {1}
     self.tee("  completed cycle %d in %s"%(cycle, \
       HMStime(time.time()-self.start_times['repX cycle'])))
     MC_report = " "
-    for move_type in ['ExternalMC','SmartDarting','Sampler']:
+    for move_type in ['ExternalMC','SmartDarting','Sampler','CD','MD']:
       total_acc = np.sum(acc[move_type])
       total_att = np.sum(att[move_type])
       if total_att>0:
@@ -2795,7 +2979,7 @@ last modified {1}
     self.tee(MC_report)
 
     # Adapt HamiltonianMonteCarlo parameters
-    if 'HamiltonianMonteCarlo' in self.sampler[process].__module__:
+    if self.params[process]['sampler']=='HMC':
       acc_rates = np.array(acc['Sampler'],dtype=np.float)/att['Sampler']
       for k in range(K):
         acc_rate = acc_rates[k]
@@ -2811,51 +2995,41 @@ last modified {1}
             lambdas[k]['delta_t'] -= 0.25*MMTK.Units.fs
         if lambdas[k]['delta_t']<0.1*MMTK.Units.fs:
           lambdas[k]['delta_t'] = 0.1*MMTK.Units.fs
+    elif self.params[process]['sampler'] in ['GHMC','NUTS']:
+      acc_rates = np.array(acc['Sampler'],dtype=np.float)/att['Sampler']
+      for k in range(K):
+        (lambdas[k]['delta_t'], on_target) = self._adapt_delta_t(\
+          lambdas[k], acc_rates[k], lambdas[k]['delta_t'], process)
+
+    # Store final conformation of each replica
+    self.confs[process]['replicas'] = \
+      [np.copy(confs[inv_state_inds[k]]) for k in range(K)]
 
     # Get indicies for sorting by thermodynamic state, not replica
-    inv_state_inds = np.zeros((nsnaps,K),dtype=int)
-    for snap in range(nsnaps):
-      state_inds = storage['state_inds'][snap]
-      for k in range(K):
-        inv_state_inds[snap][state_inds[k]] = k
+    snaps = np.arange(nsnaps)
+    inv_state_inds = np.argsort(storage['state_inds'][:nsnaps], axis=1)
 
     # Sort energies and conformations by thermodynamic state 
     # and store in global variables 
     #   self.process_Es and self.confs[process]['samples']
-    # and also local variables 
-    #   Es_repX and confs_repX
     if (process=='dock') and (self.params['dock']['rmsd'] is not False):
       terms.append('rmsd') # Make sure to save the rmsd
-    Es_repX = []
     for k in range(K):
       E_k = {}
-      E_k_repX = {}
       if k==0:
         E_k['acc'] = acc
         E_k['att'] = att
         E_k['mean_energies'] = mean_energies
       for term in terms:
-        E_term = np.array([storage['energies'][snap][term][\
-          inv_state_inds[snap][k]] for snap in range(nsnaps)])
-        E_k[term] = E_term
-        E_k_repX[term] = E_term
+        E_k[term] = storage['energies'][term][snaps,inv_state_inds[:,k]]
       getattr(self,process+'_Es')[k].append(E_k)
-      Es_repX.append([E_k_repX])
 
-    confs_repX = []
     for k in range(K):
-      confs_k = [storage['confs'][snap][inv_state_inds[snap][k]] \
-        for snap in range(nsnaps)]
       if self.params[process]['keep_intermediate'] or \
           ((process=='cool') and (k==0)) or (k==(K-1)):
-        self.confs[process]['samples'][k].append(confs_k)
-      confs_repX.append(confs_k)
+        self.confs[process]['samples'][k].append([np.array(conf, dtype=float) \
+          for conf in storage['confs'][snaps,inv_state_inds[:,k]]])
 
-    # Store final conformation of each replica
-    self.confs[process]['replicas'] = \
-      [np.copy(storage['confs'][-1][inv_state_inds[-1][k]]) \
-       for k in range(K)]
-        
     if self.params[process]['darts_per_sweep']>0:
       self._set_universe_evaluator(getattr(self,process+'_protocol')[-1])
       confs_SmartDarting = [np.copy(conf) \
@@ -2865,52 +3039,95 @@ last modified {1}
       self.confs[process]['SmartDarting'] = \
         self.sampler[process+'_SmartDarting'].confs
 
+    # Sampling importance resampling of one replica for each state
+    if do_SIR:
+      self.confs[process]['replicas'] = []
+      for k in range(K):
+        W = np.exp(storage['log_weights'][:nsnaps,:,k].ravel() - log_norm[k])
+        (n,c) = divmod(systematic_resample(W)[0], K)
+        self.confs[process]['replicas'].append(\
+          np.array(storage['confs'][n,c], dtype=float))
+
     setattr(self,'_%s_cycle'%process,cycle + 1)
     self._save(process)
     self.tee("")
     self._clear_lock(process)
 
-    # The code below is only for sampling importance resampling
-    if not self.params[process]['sampling_importance_resampling']:
-      return
-
-    # Calculate appropriate free energy
-    if process=='cool':
-      self.calc_f_L(do_solvation=False)
-      f_k = self.f_L['cool_MBAR'][-1]
-    elif process=='dock':
-      self.calc_f_RL(do_solvation=False)
-      f_k = self.f_RL['grid_MBAR'][-1]
-
-    # Get weights for sampling importance resampling
-    # MBAR weights for replica exchange configurations
-    (u_kln,N_k) = self._u_kln(Es_repX,lambdas)
-
-    # This is a more direct way to get the weights
-    from pymbar.utils import kln_to_kn
-    u_kn = kln_to_kn(u_kln, N_k=N_k)
-
-    from pymbar.utils import logsumexp
-    log_denominator_n = logsumexp(f_k - u_kn.T, b=N_k, axis=1)
-    logW = f_k - u_kn.T - log_denominator_n[:, np.newaxis]
-    W_nl = np.exp(logW)
-    for k in range(K):
-      W_nl[:,k] = W_nl[:,k]/np.sum(W_nl[:,k])
-
-    # This is for conversion to 2 indicies: state and snapshot
-    cum_N_state = np.cumsum([0] + list(N_k))
+  def _delta_t_bounds(self, process):
+    """
+    Returns the minimum and maximum time step for adaptation
+    """
+    return (0.1*MMTK.Units.fs, 2.*self.params[process]['delta_t']*MMTK.Units.fs)
 
-    def linear_index_to_snapshot_index(ind):
-      state_index = list(ind<cum_N_state).index(True)-1
-      nis_index = ind-cum_N_state[state_index]
-      return (state_index,nis_index)
+  def _adapt_delta_t(self, lambda_k, acc_rate, delta_t, process):
+    """
+    Chooses the time step for a GHMC or NUTS sampler after a batch
+    with time step delta_t had an acceptance rate of acc_rate.
+    If acc_rate is within 0.1 of the target, delta_t is kept.
+    Otherwise, the time step is updated by dual averaging. The average
+    after one update is just the first iterate, so the averaged time step
+    is only used after more than one update.
+    Returns (delta_t, on_target).
+    """
+    target = self.params[process][self.params[process]['sampler']+'_target_acc']
+    if abs(acc_rate-target)<0.1:
+      return (delta_t, True)
+    delta_t = self._dual_average(lambda_k, acc_rate, process)
+    DA = lambda_k['dual_averaging']
+    if DA['m']>1:
+      (min_delta_t, max_delta_t) = self._delta_t_bounds(process)
+      delta_t = min(max(np.exp(DA['log_delta_t_bar']), min_delta_t), \
+        max_delta_t)
+    return (delta_t, False)
+
+  def _dual_average(self, lambda_k, acc_rate, process):
+    """
+    Updates the time step of a thermodynamic state by dual averaging
+    (Hoffman and Gelman, JMLR 15, 1593, 2014), targeting the acceptance rate
+    self.params[process][sampler+'_target_acc']. The state of the algorithm
+    is stored in lambda_k['dual_averaging'], so it is saved with the protocol.
+    Returns the current iterate of the time step.
+    """
+    DA = lambda_k.get('dual_averaging', None)
+    if DA is None:
+      # The initial time step was already adapted for a neighboring state,
+      # so iterates are shrunk toward it rather than toward ten times it
+      DA = {'mu':np.log(lambda_k['delta_t']), 'H_bar':0., \
+        'log_delta_t_bar':np.log(lambda_k['delta_t']), 'm':0}
+    # Parameters recommended by Hoffman and Gelman
+    (gamma, t0, kappa) = (0.05, 10., 0.75)
+    DA['m'] += 1
+    m = DA['m']
+    DA['H_bar'] = (1.-1./(m+t0))*DA['H_bar'] + \
+      (self.params[process][self.params[process]['sampler']+'_target_acc'] - \
+       acc_rate)/(m+t0)
+    log_delta_t = DA['mu'] - np.sqrt(m)/gamma*DA['H_bar']
+    (min_delta_t, max_delta_t) = self._delta_t_bounds(process)
+    log_delta_t = min(max(log_delta_t, np.log(min_delta_t)), \
+      np.log(max_delta_t))
+    eta = m**(-kappa)
+    DA['log_delta_t_bar'] = eta*log_delta_t + (1.-eta)*DA['log_delta_t_bar']
+    lambda_k['dual_averaging'] = DA
+    return np.exp(log_delta_t)
+
+  def _crossover_energy_worker(self, BAT_converter, input, output):
+    """
+    Evaluates crossover candidates from the queue
+    """
+    for args in iter(input.get, 'STOP'):
+      result = self._crossover_energy(BAT_converter, *args)
+      output.put(result)
 
-    # Selects new replica exchange snapshots
-    self.confs[process]['replicas'] = []
-    for k in range(K):
-      (s,n) = linear_index_to_snapshot_index(\
-        np.random.choice(range(W_nl.shape[0]), size = 1, p = W_nl[:,k])[0])
-      self.confs[process]['replicas'].append(np.copy(confs_repX[s][n]))
+  def _crossover_energy(self, BAT_converter, BAT, lambda_k, reference=0):
+    """
+    Converts BAT to Cartesian coordinates and
+    calculates the reduced energy in state lambda_k
+    """
+    conf = BAT_converter.Cartesian(BAT)
+    self.universe.setConfiguration(Configuration(self.universe, conf))
+    self._set_universe_evaluator(lambda_k)
+    return {'reference':reference, 'confs':conf, \
+      'u':self.universe.energy()/(R*lambda_k['T'])}
 
   def _sim_one_state_worker(self, input, output):
     """
@@ -2964,11 +3181,16 @@ last modified {1}
     dat = self.sampler[process](\
       steps=steps, steps_per_trial=steps_per_trial, \
       T=lambda_k['T'], delta_t=delta_t, \
-      normalize=(process=='cool'), adapt=initialize, random_seed=random_seed)
+      normalize=(process=='cool'), \
+      adapt=initialize and ('dual_averaging' not in lambda_k.keys()), \
+      random_seed=random_seed)
     results['acc_Sampler'] = dat[2]
     results['att_Sampler'] = dat[3]
     results['delta_t'] = dat[4]
     results['time_Sampler'] = (time.time() - time_start_Sampler)
+    if self.params[process]['sampler'] == 'MixedHMC':
+      # Statistics for the constrained and Cartesian components
+      results.update(self.sampler[process].stats)
 
     # Execute smart darting
     if (ndarts>0) and not ((process == 'dock') and (lambda_k['a']<0.1)):
@@ -3067,23 +3289,6 @@ last modified {1}
 
     return True # The process has completed
 
-  def _mixed_sampler2(self, steps, steps_per_trial, T, delta_t, random_seed, normalize=False, adapt=False): # EU
-    ntrials = int(steps/steps_per_trial)
-
-    (mixed_confs0, mixed_potEs0, mixed_accs0, mixed_ntrials0, mixed_dts0) = \
-      self.mixed_samplers[0].Call(ntrials*5, 5, T, 0.0030, random_seed%254, 1, 1, 0.5)
-
-    (mixed_confs1, mixed_potEs1, mixed_accs1, mixed_ntrials1, mixed_dts1) = \
-      self.mixed_samplers[1](steps=steps, steps_per_trial=steps_per_trial, T=T, delta_t=delta_t, \
-      normalize=normalize, adapt=adapt, random_seed=random_seed)
-
-    mixed_confs = mixed_confs0 + mixed_confs1
-    mixed_potEs = mixed_potEs0 + mixed_potEs1
-    mixed_accs = mixed_accs0 + mixed_accs1
-    mixed_ntrials = mixed_ntrials0 + mixed_ntrials1
-
-    return (mixed_confs, mixed_potEs, mixed_accs, mixed_ntrials, delta_t)
-
   def _insert_dock_state(self, a, clear=True):
     """
     Inserts a new thermodynamic state into the docking protocol.
@@ -3892,6 +4097,10 @@ last modified {1}
       time.strftime("%a, %d %b %Y %H:%M:%S", time.localtime()) + "\n")
     self.start_times['postprocess'] = time.time()
 
+    # Cores that are not needed by energy workers are used
+    # to split sander calculations
+    self._sander_workers = max(1, self._cores/len(incomplete))
+
     done_queue = m.Queue()
     processes = [multiprocessing.Process(target=self._energy_worker, \
         args=(task_queue, done_queue, time_per_snap)) \
@@ -3968,48 +4177,55 @@ last modified {1}
       return len(incomplete)==len(results)
 
   def _energy_worker(self, input, output, time_per_snap):
-    for args in iter(input.get, 'STOP'):
-      (confs, moiety, phase, traj_FN, outputname, debug, reference) = args
-      (p, state, c, label) = reference
-      nsnaps = len(confs)
+    # NAMD instances that stay open for the lifetime of the worker
+    self._NAMD_servers = {}
+    try:
+      for args in iter(input.get, 'STOP'):
+        (confs, moiety, phase, traj_FN, outputname, debug, reference) = args
+        (p, state, c, label) = reference
+        nsnaps = len(confs)
       
-      # Make sure there is enough time remaining
-      if self._run_type=='timed':
-        remaining_time = self.timings['max']*60 - \
-          (time.time()-self.start_times['run'])
-        if len(time_per_snap[moiety+phase])>0:
-          mean_time_per_snap = np.mean(np.mean(time_per_snap[moiety+phase]))
-          if np.isnan(mean_time_per_snap):
-            return
-          projected_time = mean_time_per_snap*nsnaps
-          self.tee("  projected cycle time for %s: %s, remaining time: %s"%(\
-            moiety+phase, \
-            HMStime(projected_time), HMStime(remaining_time)), process=p)
-          if projected_time > remaining_time:
-            return
+        # Make sure there is enough time remaining
+        if self._run_type=='timed':
+          remaining_time = self.timings['max']*60 - \
+            (time.time()-self.start_times['run'])
+          if len(time_per_snap[moiety+phase])>0:
+            mean_time_per_snap = np.mean(np.mean(time_per_snap[moiety+phase]))
+            if np.isnan(mean_time_per_snap):
+              return
+            projected_time = mean_time_per_snap*nsnaps
+            self.tee("  projected cycle time for %s: %s, remaining time: %s"%(\
+              moiety+phase, \
+              HMStime(projected_time), HMStime(remaining_time)), process=p)
+            if projected_time > remaining_time:
+              return
     
-      # Calculate the energy
-      self.start_times['energy'] = time.time()
-      for program in ['NAMD','sander','gbnsr6','OpenMM','APBS']:
-        if phase.startswith(program):
-          E = getattr(self,'_%s_Energy'%program)(*args)
-          break
-      wall_time = time.time() - self.start_times['energy']
+        # Calculate the energy
+        self.start_times['energy'] = time.time()
+        for program in ['NAMD','sander','gbnsr6','OpenMM','APBS']:
+          if phase.startswith(program):
+            E = getattr(self,'_%s_Energy'%program)(*args)
+            break
+        wall_time = time.time() - self.start_times['energy']
 
-      if not np.isinf(E).any():
-        self.tee("  postprocessed %s, state %d, cycle %d, %s in %s"%(\
-          p,state,c,label,HMStime(wall_time)))
+        if not np.isinf(E).any():
+          self.tee("  postprocessed %s, state %d, cycle %d, %s in %s"%(\
+            p,state,c,label,HMStime(wall_time)))
           
-        # Store output and timings
-        output.put((E, reference, wall_time))
+          # Store output and timings
+          output.put((E, reference, wall_time))
 
-        times_per_snap = time_per_snap[moiety+phase]
-        times_per_snap.append(wall_time/nsnaps)
-        time_per_snap[moiety+phase] = times_per_snap
-      else:
-        self.tee("  error in postprocessing %s, state %d, cycle %d, %s in %s"%(\
-          p,state,c,label,HMStime(wall_time)))
-        return
+          times_per_snap = time_per_snap[moiety+phase]
+          times_per_snap.append(wall_time/nsnaps)
+          time_per_snap[moiety+phase] = times_per_snap
+        else:
+          self.tee("  error in postprocessing %s, state %d, cycle %d, %s in %s"%(\
+            p,state,c,label,HMStime(wall_time)))
+          return
+    finally:
+      for server in self._NAMD_servers.values():
+        server.stop_energy_server()
+      self._NAMD_servers = None
 
   def _energyTerms(self, confs, E=None, process='dock', debug=DEBUG):
     """
@@ -4073,20 +4289,46 @@ last modified {1}
     # and thus the new indicies are
     # 0. BOND 1. ANGLE 2. DIHED 3. IMPRP 4. ELECT 5. VDW 6. MISC 7. POTENTIAL
     
-    # Run NAMD
-    import AlGDock.NAMD
-    energyCalc = AlGDock.NAMD.NAMD(\
-      prmtop=self._FNs['prmtop'][moiety], \
-      inpcrd=self._FNs['inpcrd'][moiety], \
-      fixed={'R':self._FNs['fixed_atoms']['R'], \
-             'L':None, \
-             'RL':self._FNs['fixed_atoms']['RL']}[moiety], \
-      solvent={'NAMD_OBC':'GBSA', 'NAMD_Gas':'Gas'}[phase], \
-      useCutoff=(phase=='NAMD_OBC'), \
-      namd_command=self._FNs['namd'])
-    E = energyCalc.energies_PE(\
-      outputname, dcd_FN, energyFields=[1, 2, 3, 4, 5, 6, 8, 12], \
-      keepScript=debug, write_energy_pkl_gz=False)
+    energyFields = [1, 2, 3, 4, 5, 6, 8, 12]
+
+    # Within an energy worker, reuse a NAMD instance for the moiety and phase
+    servers = getattr(self, '_NAMD_servers', None)
+    if (servers is not None) and (moiety+phase in servers.keys()) and \
+        servers[moiety+phase].energy_server_running():
+      energyCalc = servers[moiety+phase]
+    else:
+      if (servers is not None) and (moiety+phase in servers.keys()):
+        servers[moiety+phase].stop_energy_server()
+      # Run NAMD
+      import AlGDock.NAMD
+      energyCalc = AlGDock.NAMD.NAMD(\
+        prmtop=self._FNs['prmtop'][moiety], \
+        inpcrd=self._FNs['inpcrd'][moiety], \
+        fixed={'R':self._FNs['fixed_atoms']['R'], \
+               'L':None, \
+               'RL':self._FNs['fixed_atoms']['RL']}[moiety], \
+        solvent={'NAMD_OBC':'GBSA', 'NAMD_Gas':'Gas'}[phase], \
+        useCutoff=(phase=='NAMD_OBC'), \
+        namd_command=self._FNs['namd'])
+      if servers is not None:
+        try:
+          energyCalc.start_energy_server(os.path.join(\
+            os.path.dirname(os.path.abspath(outputname)), \
+            'NAMD_server.%s%s.%d'%(moiety, phase, os.getpid())), \
+            energyFields=energyFields, keepScript=debug)
+          servers[moiety+phase] = energyCalc
+        except Exception:
+          self.tee("  unable to start NAMD energy server for " + moiety+phase)
+
+    if energyCalc.energy_server_running():
+      try:
+        E = energyCalc.energies_PE_server(dcd_FN)
+      except Exception:
+        return np.array([np.inf])
+    else:
+      E = energyCalc.energies_PE(\
+        outputname, dcd_FN, energyFields=energyFields, \
+        keepScript=debug, write_energy_pkl_gz=False)
 
     return np.array(E, dtype=float)*MMTK.Units.kcal/MMTK.Units.mol
 
@@ -4140,27 +4382,62 @@ last modified {1}
 '''%(igb))
     script_F.close()
     
-    os.chdir(self.dir['out'])
+    # Split the trajectory among concurrent sander processes.
+    # Each process has its own scratch directory because
+    # sander writes intermediate files into the working directory.
+    prefix = '.'.join(AMBER_mdcrd_FN.split('.')[:-1])
+    nworkers = max(1, min(getattr(self,'_sander_workers',1), len(confs)))
+    if nworkers>1:
+      F = open(AMBER_mdcrd_FN,'r')
+      mdcrd_lines = F.readlines()
+      F.close()
+      lines_per_frame = (len(mdcrd_lines)-1)/len(confs)
+      if lines_per_frame*len(confs)!=(len(mdcrd_lines)-1):
+        nworkers = 1
+    if nworkers>1:
+      jobs = []
+      for (w,frames) in enumerate(np.array_split(range(len(confs)),nworkers)):
+        scratch_dir = '%s%s.sander%d'%(prefix,phase,w)
+        if not os.path.isdir(scratch_dir):
+          os.makedirs(scratch_dir)
+        mdcrd_FN = os.path.join(scratch_dir,'chunk.mdcrd')
+        F = open(mdcrd_FN,'w')
+        F.write(mdcrd_lines[0])
+        F.writelines(mdcrd_lines[1+frames[0]*lines_per_frame:\
+                                 1+(frames[-1]+1)*lines_per_frame])
+        F.close()
+        jobs.append((scratch_dir, mdcrd_FN, \
+          os.path.join(scratch_dir,'chunk.out')))
+      del mdcrd_lines
+    else:
+      jobs = [(self.dir['out'], AMBER_mdcrd_FN, out_FN)]
+
     import subprocess
-    args_list = [self._FNs['sander'], '-O','-i',script_FN,'-o',out_FN, \
-      '-p',self._FNs['prmtop'][moiety],'-c',self._FNs['inpcrd'][moiety], \
-      '-y', AMBER_mdcrd_FN, '-r',script_FN+'.restrt']
-    if debug:
-      print ' '.join(args_list)
-    p = subprocess.Popen(args_list)
-    p.wait()
+    procs = []
+    for (scratch_dir, mdcrd_FN, chunk_out_FN) in jobs:
+      args_list = [self._FNs['sander'], '-O','-i',script_FN,'-o',chunk_out_FN, \
+        '-p',self._FNs['prmtop'][moiety],'-c',self._FNs['inpcrd'][moiety], \
+        '-y', mdcrd_FN, '-r',chunk_out_FN+'.restrt']
+      if debug:
+        print ' '.join(args_list)
+      procs.append(subprocess.Popen(args_list, cwd=scratch_dir))
+    for proc in procs:
+      proc.wait()
     
-    F = open(out_FN,'r')
-    dat = F.read().strip().split(' BOND')
-    F.close()
+    # Read all energy terms for all frames, merging the chunks in order
+    import AlGDock.IO
+    IO_sander = AlGDock.IO.sander_mdout()
+    Es = [IO_sander.read(chunk_out_FN) \
+      for (scratch_dir, mdcrd_FN, chunk_out_FN) in jobs]
+    nframes = [len(E) for E in Es]
 
-    dat.pop(0)
-    if len(dat)>0:
+    if min(nframes)>0:
       # For the different models, all the terms are the same except for
       # EGB/EPB (every model is different)
       # ESURF versus ECAVITY + EDISPER
       # EEL (ALPB versus not)
-      E = np.array([rec[:rec.find('\nminimization')].replace('1-4 ','1-4').split()[1::3] for rec in dat],dtype=float)*MMTK.Units.kcal/MMTK.Units.mol
+      E = np.vstack([E.view(float).reshape(len(E),-1) for E in Es]) \
+        *MMTK.Units.kcal/MMTK.Units.mol
       if phase=='sander_Gas':
         E = np.hstack((E,np.sum(E,1)[...,None]))
       else:
@@ -4169,14 +4446,19 @@ last modified {1}
 
       if not debug and os.path.isfile(script_FN):
         os.remove(script_FN)
-      if os.path.isfile(script_FN+'.restrt'):
-        os.remove(script_FN+'.restrt')
-
-      if not debug and os.path.isfile(out_FN):
-        os.remove(out_FN)
+      for (scratch_dir, mdcrd_FN, chunk_out_FN) in jobs:
+        if os.path.isfile(chunk_out_FN+'.restrt'):
+          os.remove(chunk_out_FN+'.restrt')
+        if not debug and os.path.isfile(chunk_out_FN):
+          os.remove(chunk_out_FN)
     else:
       E = np.array([np.inf]*11)
 
+    if nworkers>1 and not debug:
+      import shutil
+      for (scratch_dir, mdcrd_FN, chunk_out_FN) in jobs:
+        shutil.rmtree(scratch_dir)
+
     os.chdir(self.dir['start'])
     return E
     # AMBER ENERGY FIELDS:
@@ -4677,9 +4959,10 @@ rank_ligands                                                 no
     return np.array(rmsds)/10.
 
   def _write_traj(self, traj_FN, confs, moiety, \
-      title='', factor=1.0/MMTK.Units.Ang):
+      title='', factor=1.0/MMTK.Units.Ang, append=False):
     """
     Writes a trajectory file
+    If append==True, confs are added to the end of an existing file
     """
     
     if traj_FN is None:
@@ -4688,7 +4971,7 @@ rank_ligands                                                 no
       return
     if traj_FN.endswith('.crd'):
       return
-    if os.path.isfile(traj_FN):
+    if os.path.isfile(traj_FN) and not append:
       return
     
     traj_dir = os.path.dirname(os.path.abspath(traj_FN))
@@ -4703,7 +4986,7 @@ rank_ligands                                                 no
         ligand_first_atom = self._ligand_first_atom)
       IO_dcd.write(traj_FN, confs,
         includeReceptor=(moiety.find('R')>-1),
-        includeLigand=(moiety.find('L')>-1))
+        includeLigand=(moiety.find('L')>-1), append=append)
     elif traj_FN.endswith('.mdcrd'):
       if (moiety.find('R')>-1):
         receptor_0 = factor*self.confs['receptor'][:self._ligand_first_atom,:]
@@ -4724,7 +5007,7 @@ rank_ligands                                                 no
       
       import AlGDock.IO
       IO_crd = AlGDock.IO.crd()
-      IO_crd.write(traj_FN, confs, title, trajectory=True)
+      IO_crd.write(traj_FN, confs, title, append=append, trajectory=True)
       self.tee("  wrote %d configurations to %s"%(len(confs), traj_FN))
     else:
       raise Exception('Unknown trajectory type')
@@ -4959,9 +5242,10 @@ rank_ligands                                                 no
       self._clear_lock(process)
 
   def __del__(self):
-    for p in ['cool', 'dock']:
-      if self.params[p]['sampler'] == 'MixedHMC':
-        self.sampler[p].TDintegrator.Clear()
+    TDintegrators = set([self.sampler[p].TDintegrator \
+      for p in ['cool', 'dock'] if self.params[p]['sampler'] == 'MixedHMC'])
+    for TDintegrator in TDintegrators:
+      TDintegrator.Clear()
     if (not DEBUG) and len(self._toClear)>0:
       print "\n>>> Clearing files"
       for FN in self._toClear:
@@ -85,18 +85,24 @@ arguments = {
   'therm_speed':{'type':float,
     'help':'Thermodynamic speed during adaptive simulation'},
   'sampler':{
-    'choices':['MixedHMC','HMC','NUTS','VV'],
+    'choices':['MixedHMC','HMC','GHMC','NUTS','VV'],
     'help':'Sampling method'},
   'MCMC_moves':{'type':int,
     'help':'Types of MCMC moves to use'},
-  'fraction_CD':{'type':float, 'default':0.5, \
-    'help':'For the MixedHMC integrator, the fraction of MD steps spent with constrained MD'},
+  'fraction_CD':{'type':float, \
+    'help':'Deprecated and ignored. The MixedHMC integrator runs one constrained dynamics trial for every Cartesian trial'},
   'CD_steps_per_trial':{'type':int, 'default':5, \
     'help':'The number of steps for constrained dynamics HMC trials'},
-  'delta_t_TD':{'type':float, 'default':4.0, \
-    'help':'The time step for constrained dynamics HMC trials'},
+  'delta_t_TD':{'type':float, 'default':3.0, \
+    'help':'The time step for constrained dynamics HMC trials, in fs'},
   'delta_t':{'type':float, 'default':3.5, \
     'help':'The default time step, in fs'},
+  'GHMC_refresh':{'type':float, 'default':0.5, \
+    'help':'For the GHMC integrator, the fraction of the kinetic energy that is redrawn before each trial'},
+  'GHMC_target_acc':{'type':float, 'default':0.75, \
+    'help':'For the GHMC integrator, the acceptance rate targeted by time step adaptation'},
+  'NUTS_target_acc':{'type':float, 'default':0.6, \
+    'help':'For the NUTS integrator, the mean acceptance probability targeted by time step adaptation'},
   'T_HIGH':{'type':float, 'default':600.0,
     'help':'High temperature'},
   'T_SIMMIN':{'type':float, 'default':300.0,
@@ -125,6 +131,8 @@ arguments = {
     'help':'Number of smart darting attempts per replica exchange sweep'},
   'snaps_per_cycle':{'type':int,
     'help':'Number of snapshots to save per cycle'},
+  'max_snaps_per_cycle':{'type':int,
+    'help':'Maximum number of snapshots to store per cycle. Beyond this, stored snapshots are thinned by half.'},
   'sampling_importance_resampling':{'action':'store_true',
     'help':'perfom sampling importance resampling'},
   'solvation':{'choices':['Desolvated','Full','Fractional'], \
@@ -175,7 +183,7 @@ for process in ['cool','dock']:
       'seeds_per_state', 'steps_per_seed', 'darts_per_seed',
       'sweeps_per_cycle', 'attempts_per_sweep',
       'steps_per_sweep', 'darts_per_sweep',
-      'snaps_per_cycle', 'keep_intermediate']:
+      'snaps_per_cycle', 'max_snaps_per_cycle', 'keep_intermediate']:
     arguments[process+'_'+key] = copy.deepcopy(arguments[key])
 
 for phase in allowed_phases:
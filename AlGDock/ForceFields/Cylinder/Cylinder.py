@@ -72,6 +72,21 @@ class CylinderForceField(ForceField):
                   self.origin, self.direction, self.max_Z, self.max_R,
                   self.name)]
 
+    def energies(self, universe, confs):
+      """
+      Returns the energy of every configuration in confs,
+      an array with shape (nconfs, natoms, 3)
+      """
+      k = 10000. # kJ/mol nm**2
+      masses = universe.masses().array
+      coms = N.dot(N.swapaxes(confs,1,2), masses)/N.sum(masses)
+      p = coms - self.origin
+      E = N.where(p[:,2]<0., k*p[:,2]*p[:,2]/2., 0.)
+      overMax = N.maximum(coms[:,2] - self.max_Z, 0.)
+      E += N.where(p[:,2]<0., 0., k*overMax*overMax/2.)
+      overMax = N.maximum(N.sqrt(p[:,0]*p[:,0] + p[:,1]*p[:,1]) - self.max_R, 0.)
+      return E + k*overMax*overMax/2.
+
     def randomPoint(self):
       """
       Returns a random point within the cylinder
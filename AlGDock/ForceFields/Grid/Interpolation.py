@@ -97,6 +97,67 @@ class InterpolationForceField(ForceField):
   def set_strength(self, strength):
     self.params['strength'] = strength
 
+  def energies(self, universe, confs):
+    """
+    Returns the energy of every configuration in confs, an array
+    with shape (nconfs, natoms, 3), in a single vectorized calculation.
+    The energy is the same as from the trilinear energy terms.
+    Other interpolation types and energy thresholds are not supported.
+    """
+    if (self.params['interpolation_type']!='Trilinear') or \
+       (self.params['energy_thresh']>0):
+      raise NotImplementedError
+    if not hasattr(self, '_scaling_factor'):
+      self._scaling_factor = np.zeros(universe.numberOfAtoms())
+      for o in universe:
+        for a in o.atomList():
+          self._scaling_factor[a.index] = \
+            o.getAtomProperty(a, self.params['scaling_property'])
+      self._scaling_factor *= self.params['scaling_prefactor']
+
+    spacing = self.grid_data['spacing']
+    counts = self.grid_data['counts']
+    vals = self.grid_data['vals'].reshape(counts)
+    hCorner = spacing*(counts-1)
+    k = 10000. # kJ/mol nm**2, the spring constant outside the grid
+
+    confs = np.asarray(confs)
+    nconfs = confs.shape[0]
+    X = confs.reshape((-1,3))
+    sf = np.tile(self._scaling_factor, nconfs)
+    E = np.zeros(X.shape[0])
+
+    inside = np.logical_and((X>0.).all(axis=1), (X<hCorner).all(axis=1))
+    Xi = X[inside]/spacing
+    ind = np.minimum(Xi.astype(int), counts-2)
+    f = Xi - ind
+    a = 1. - f
+    (ix, iy, iz) = (ind[:,0], ind[:,1], ind[:,2])
+    vmm = a[:,2]*vals[ix,iy,iz] + f[:,2]*vals[ix,iy,iz+1]
+    vmp = a[:,2]*vals[ix,iy+1,iz] + f[:,2]*vals[ix,iy+1,iz+1]
+    vpm = a[:,2]*vals[ix+1,iy,iz] + f[:,2]*vals[ix+1,iy,iz+1]
+    vpp = a[:,2]*vals[ix+1,iy+1,iz] + f[:,2]*vals[ix+1,iy+1,iz+1]
+    interpolated = a[:,0]*(a[:,1]*vmm + f[:,1]*vmp) + \
+                   f[:,0]*(a[:,1]*vpm + f[:,1]*vpp)
+    if self.params['inv_power'] is not None:
+      interpolated = interpolated**self.params['inv_power']
+    E[inside] = sf[inside]*interpolated
+
+    # Harmonic restraint outside the grid.
+    # As in the C terms, the lower bound for coordinate i is i
+    # unless the grid values are transformed.
+    Xo = X[~inside]
+    if self.params['inv_power'] is not None and self.params['inv_power']!=4:
+      lower = np.zeros(3)
+    else:
+      lower = np.arange(3.)
+    below = Xo<lower
+    above = np.logical_and(~below, Xo>hCorner)
+    E[~inside] = k/2.*(np.sum(below*Xo*Xo,1) + \
+      np.sum(above*(Xo-hCorner)*(Xo-hCorner),1))
+
+    return self.params['strength']*E.reshape((nconfs,-1)).sum(axis=1)
+
   # The following method is called by the energy evaluation engine
   # to inquire if this force field term has all the parameters it
   # requires. This is necessary for interdependent force field
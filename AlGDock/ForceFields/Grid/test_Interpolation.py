@@ -57,6 +57,20 @@ for params in param_sets:
   print 'Gradient Test'
   gradientTest(universe)
 
+  if params['interpolation_type']=='Trilinear' and \
+      params['energy_thresh']<=0:
+    # The vectorized energies should match the energy terms,
+    # including for configurations outside the grid
+    print 'Vectorized Energy Test'
+    conf0 = universe.copyConfiguration()
+    confs = np.array([conf0.array + 0.05*n for n in range(-40,40)])
+    E_terms = []
+    for conf in confs:
+      universe.setConfiguration(Configuration(universe, conf))
+      E_terms.append(sum(universe.energyTerms().values()))
+    universe.setConfiguration(conf0)
+    assert np.allclose(ForceField.energies(universe, confs), E_terms)
+
   import time
   start_time = time.time()
   
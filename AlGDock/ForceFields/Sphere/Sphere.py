@@ -58,6 +58,17 @@ class SphereForceField(ForceField):
         # Here we pass all the parameters to the code
         # that handles energy calculations.
         return [SphereTerm(universe, self.center, self.max_R, self.name)]
+
+    def energies(self, universe, confs):
+      """
+      Returns the energy of every configuration in confs,
+      an array with shape (nconfs, natoms, 3)
+      """
+      masses = universe.masses().array
+      coms = N.dot(N.swapaxes(confs,1,2), masses)/N.sum(masses)
+      r = N.sqrt(N.sum((coms - self.center)**2,1))
+      overMax = N.maximum(r - self.max_R, 0.)
+      return 10000.*overMax*overMax/2. # k is 10000 kJ/mol nm**2
   
     def randomPoint(self):
       """
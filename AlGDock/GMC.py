@@ -0,0 +1,90 @@
+"""
+Crossover of soft torsions between replicas (generalized Monte Carlo)
+"""
+
+import numpy as np
+from random import randrange
+
+def crossover_candidates(BATs, inv_state_inds, state_pairs, \
+    BAT_to_crossover, torsion_threshold, max_candidates):
+  """
+  Chooses a random set of torsions for each pair of states.
+  If at least one of the torsions differs by more than torsion_threshold,
+  the pair is a crossover candidate.
+  Returns a list of (state_pair, conf_inds, torsions, BATs after crossover).
+  At most max_candidates are generated.
+  """
+  candidates = []
+  for state_pair in state_pairs:
+    if len(candidates)==max_candidates:
+      break
+    conf_inds = [inv_state_inds[state_pair[0]], inv_state_inds[state_pair[1]]]
+    torsions = BAT_to_crossover[randrange(len(BAT_to_crossover))]
+    if np.any(np.abs(BATs[conf_inds[0],torsions] - \
+        BATs[conf_inds[1],torsions]) >= torsion_threshold):
+      # Fancy indexing returns copies, so BATs is unchanged
+      BATs_af = BATs[conf_inds,:]
+      BATs_af[:,torsions] = BATs_af[::-1,torsions]
+      candidates.append((state_pair, conf_inds, torsions, BATs_af))
+  return candidates
+
+def attempt_crossovers(confs, BATs, energies, inv_state_inds, \
+    state_pairs_to_swap, BAT_to_crossover, torsion_threshold, nr_attempts, \
+    evaluate):
+  """
+  Attempts crossovers until there have been nr_attempts.
+
+  state_pairs_to_swap is a list of lists of state index pairs.
+  Within each list, no state may appear more than once, so that all of
+  the candidates in a list can be evaluated together.
+  The candidates are tested in the same order,
+  with the same random numbers, as attempting them one at a time.
+
+  evaluate takes a list of (BAT, state_index) tuples and returns a list
+  of (Cartesian coordinates, reduced energy) tuples in the same order.
+
+  confs, BATs (a K x nBAT array), and energies are updated in place.
+  Returns the number of attempts and the number of accepted moves.
+  """
+  if nr_attempts < 0:
+    raise Exception('Number of attempts must be nonnegative!')
+  if torsion_threshold < 0.:
+    raise Exception('Torsion threshold must be nonnegative!')
+  if len(BAT_to_crossover)==0:
+    return 0, 0
+
+  K = len(energies)
+  attempt_count, acc_count = 0, 0
+  sweep_count = 0
+  while attempt_count < nr_attempts:
+    sweep_count += 1
+    if (sweep_count * K) > (1000 * nr_attempts):
+      break
+    for state_pairs in state_pairs_to_swap:
+      candidates = crossover_candidates(BATs, inv_state_inds, state_pairs, \
+        BAT_to_crossover, torsion_threshold, nr_attempts - attempt_count)
+      if len(candidates)==0:
+        continue
+      # Convert and evaluate all the candidates at once
+      tasks = []
+      for (state_pair, conf_inds, torsions, BATs_af) in candidates:
+        tasks += [(BATs_af[0], state_pair[0]), (BATs_af[1], state_pair[1])]
+      evaluated = evaluate(tasks)
+      # Metropolis acceptance
+      for n in range(len(candidates)):
+        (state_pair, conf_inds, torsions, BATs_af) = candidates[n]
+        (conf_0, e_0) = evaluated[2*n]
+        (conf_1, e_1) = evaluated[2*n+1]
+        attempt_count += 1
+        de = (energies[conf_inds[0]] - e_0) + (energies[conf_inds[1]] - e_1)
+        if (de > 0) or (np.random.uniform() < np.exp(de)):
+          acc_count += 1
+          confs[conf_inds[0]] = conf_0
+          confs[conf_inds[1]] = conf_1
+          energies[conf_inds[0]] = e_0
+          energies[conf_inds[1]] = e_1
+          BATs[conf_inds[0]] = BATs_af[0]
+          BATs[conf_inds[1]] = BATs_af[1]
+      if attempt_count == nr_attempts:
+        break
+  return attempt_count, acc_count
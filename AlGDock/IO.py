@@ -1,6 +1,46 @@
 import os
 import numpy as np
 
+# If file_cache is set to a dictionary, grids and prmtop records
+# are kept in memory after they are read, so that a process that runs
+# calculations for many ligands only reads receptor files once.
+# Entries are keyed by the file name and modification time.
+# When the arrays in the cache exceed file_cache_max_bytes,
+# the least recently used entries are removed.
+file_cache = None
+file_cache_max_bytes = 2**30
+_file_cache_order = []
+
+def _nbytes(data):
+  return sum([v.nbytes for v in data.values() if isinstance(v, np.ndarray)])
+
+def clear_file_cache():
+  global _file_cache_order
+  if file_cache is not None:
+    file_cache.clear()
+  _file_cache_order = []
+
+def _cached(key, FN, read):
+  """
+  Returns read(), a dictionary, using file_cache if it is available.
+  Arrays in the dictionary are copied so the cached values are not modified.
+  """
+  if file_cache is None:
+    return read()
+  key = key + (os.path.abspath(FN), os.path.getmtime(FN))
+  if key in _file_cache_order:
+    _file_cache_order.remove(key)
+  if not key in file_cache.keys():
+    file_cache[key] = read()
+  _file_cache_order.append(key)
+  # The most recent entry is kept even if it is larger than the limit
+  while (len(_file_cache_order)>1) and \
+      sum([_nbytes(file_cache[k]) for k in _file_cache_order]) > \
+      file_cache_max_bytes:
+    del file_cache[_file_cache_order.pop(0)]
+  return dict([(k, np.copy(v) if isinstance(v, np.ndarray) else v) \
+    for (k, v) in file_cache[key].items()])
+
 class Grid:
   """
   Class to read and write alchemical grids.
@@ -14,17 +54,24 @@ class Grid:
   def __init__(self):
     pass
 
-  def read(self, FN, multiplier=None):
+  # Number of characters read from a dx file at a time
+  _dx_read_block = 2**22
+  # Number of lines written to a dx file at a time
+  _dx_write_block = 2**16
+
+  def read(self, FN, multiplier=None, parallel=False):
     """
     Reads a grid in dx or netcdf format
     The multiplier affects the origin and spacing.
+    If parallel is True, .dx.gz files are decompressed with pigz, if available.
     """
     if FN is None:
       raise Exception('File is not defined')
     elif FN.endswith('.dx') or FN.endswith('.dx.gz'):
-      data = self._read_dx(FN)
+      data = _cached(('Grid',), FN, \
+        lambda : self._read_dx(FN, parallel=parallel))
     elif FN.endswith('.nc'):
-      data = self._read_nc(FN)
+      data = _cached(('Grid',), FN, lambda : self._read_nc(FN))
     else:
       raise Exception('File type not supported')
     if multiplier is not None:
@@ -32,16 +79,29 @@ class Grid:
       data['spacing'] = multiplier*data['spacing']
     return data
 
-  def _read_dx(self, FN):
+  def _open_dx(self, FN, parallel=False):
     """
-    Reads a grid in dx format
+    Opens a dx file for reading.
+    Returns the file object and, for pigz, the decompression process.
     """
     if FN.endswith('.dx'):
-      F = open(FN,'r')
-    else:
-      import gzip
-      F = gzip.open(FN,'r')
-        
+      return (open(FN,'r'), None)
+    if parallel:
+      from distutils.spawn import find_executable
+      pigz = find_executable('pigz')
+      if pigz is not None:
+        import subprocess
+        proc = subprocess.Popen([pigz,'-dc',FN], stdout=subprocess.PIPE)
+        return (proc.stdout, proc)
+    import gzip
+    return (gzip.open(FN,'r'), None)
+
+  def _read_dx(self, FN, parallel=False):
+    """
+    Reads a grid in dx format
+    """
+    (F, proc) = self._open_dx(FN, parallel)
+
     # Read the header
     line = F.readline()
     while line.find('object')==-1:
@@ -59,19 +119,48 @@ class Grid:
     if not (header['d0'][1]==0 and header['d0'][2]==0 and
             header['d1'][0]==0 and header['d1'][2]==0 and
             header['d2'][0]==0 and header['d2'][1]==0):
+      F.close()
+      if proc is not None:
+        proc.wait()
       raise Exception('Trilinear grid must be in original basis')
     if not (header['d0'][0]>0 and header['d1'][1]>0 and header['d2'][2]>0):
+      F.close()
+      if proc is not None:
+        proc.wait()
       raise Exception('Trilinear grid must have positive coordinates')
 
-    # Read the data
+    # Read the data in blocks,
+    #   carrying over any number that is split between blocks
     vals = np.ndarray(shape=header['npts'], dtype=float)
     index = 0
+    remainder = ''
     while index<header['npts']:
-      line = F.readline()[:-1]
-      items = [float(item) for item in line.split()]
-      vals[index:index+len(items)] = items
-      index = index + len(items)
+      block = F.read(self._dx_read_block)
+      last_block = (block=='')
+      block = remainder + block
+      # The data are followed by text records
+      end_data = [block.find(key) for key in ['object','attribute']]
+      end_data = [e for e in end_data if e>-1]
+      if len(end_data)>0:
+        block = block[:min(end_data)]
+        last_block = True
+      if last_block:
+        remainder = ''
+      else:
+        split = max(block.rfind(' '),block.rfind('\n'))+1
+        (block, remainder) = (block[:split], block[split:])
+      items = np.fromstring(block, dtype=float, sep=' ')
+      n_items = min(len(items), header['npts']-index)
+      vals[index:index+n_items] = items[:n_items]
+      index = index + n_items
+      if last_block:
+        break
     F.close()
+    if proc is not None:
+      proc.wait()
+    if index<header['npts']:
+      raise Exception('dx file %s has %d of %d points'%(\
+        FN, index, header['npts']))
 
     data = {
       'origin':np.array(header['origin']), \
@@ -132,8 +221,14 @@ object 2 class gridconnections counts {0[0]} {0[1]} {0[2]}
 object 3 class array type double rank 0 items {3} data follows
 """.format(data['counts'],data['origin'],data['spacing'],n_points))
     
-    for start_n in range(0,len(data['vals']),3):
-      F.write(' '.join(['%6e'%c for c in data['vals'][start_n:start_n+3]]) + '\n')
+    # Write three values per line, many lines at a time
+    vals = np.asarray(data['vals']).ravel()
+    n_full = (len(vals)/3)*3
+    for start_n in range(0,n_full,3*self._dx_write_block):
+      block = vals[start_n:min(start_n+3*self._dx_write_block,n_full)]
+      F.write(('%6e %6e %6e\n'*(len(block)/3))%tuple(block))
+    if n_full<len(vals):
+      F.write(' '.join(['%6e'%c for c in vals[n_full:]]) + '\n')
 
     F.write('object 4 class field\n')
     F.write('component "positions" value 1\n')
@@ -167,24 +262,19 @@ object 3 class array type double rank 0 items {3} data follows
     multiplier is for the values, not the grid scaling
     """
     data_o = self.read(in_FN)
-    nyz_o = data_o['counts'][1]*data_o['counts'][2]
-    nz_o = data_o['counts'][2]
     
     min_i = int(-data_o['origin'][0]/data_o['spacing'][0])
     min_j = int(-data_o['origin'][1]/data_o['spacing'][1])
     min_k = int(-data_o['origin'][2]/data_o['spacing'][2])
 
-#    vals = np.ndarray(shape=tuple(counts), dtype=float)
-#    for i in range(counts[0]):
-#      for j in range(counts[1]):
-#        for k in range(counts[2]):
-#          vals[i,j,k] = data_o['vals'][(i+min_i)*nyz_o + (j+min_j)*nz_o + (k+min_k)]
+    # The truncated grid must be within the original grid
+    for (min_x, count, count_o) in \
+        zip((min_i, min_j, min_k), counts, data_o['counts']):
+      if (min_x<0) or (min_x+count>count_o):
+        raise Exception('Truncated grid is outside of the grid in '+in_FN)
 
-    vals = np.array(
-      [[[data_o['vals'][(i+min_i)*nyz_o + (j+min_j)*nz_o + (k+min_k)]
-        for k in range(counts[2])]
-          for j in range(counts[1])]
-            for i in range(counts[0])])
+    vals = data_o['vals'].reshape(data_o['counts'])[\
+      min_i:min_i+counts[0], min_j:min_j+counts[1], min_k:min_k+counts[2]]
 
     if multiplier is not None:
       vals = vals*multiplier
@@ -193,6 +283,67 @@ object 3 class array type double rank 0 items {3} data follows
       'counts':counts, 'spacing':data_o['spacing'], 'vals':vals.flatten()}
     self.write(out_FN,data_n)
 
+  def resample(self, in_FN, out_FN, spacing, counts, origin=None, \
+      interpolation='Trilinear', multiplier=None):
+    """
+    Resamples the grid onto a new grid with different spacing and extent
+    
+    origin defaults to the origin of the input grid.
+    interpolation may be 'Trilinear' or 'CatmullRom' (cubic).
+    Points outside the input grid take the value at the nearest edge.
+    multiplier is for the values, not the grid scaling
+    """
+    data_o = self.read(in_FN)
+    if origin is None:
+      origin = data_o['origin']
+    data_n = self._resample(data_o, np.array(spacing, dtype=float), \
+      np.array(counts, dtype=int), np.array(origin, dtype=float), \
+      interpolation)
+    if multiplier is not None:
+      data_n['vals'] = data_n['vals']*multiplier
+    self.write(out_FN, data_n)
+
+  def _resample(self, data, spacing, counts, origin, interpolation):
+    """
+    Interpolates grid data onto a new regular grid.
+    Because both grids are regular, interpolation is separable
+    and is performed along one axis at a time.
+    """
+    vals = data['vals'].reshape(data['counts'])
+    for axis in range(3):
+      # Positions of the new grid points in units of the old spacing
+      x = (origin[axis] + np.arange(counts[axis])*spacing[axis] - \
+        data['origin'][axis])/data['spacing'][axis]
+      vals = self._interpolate_axis(vals, axis, x, interpolation)
+    return {'origin':origin, 'counts':counts, 'spacing':spacing, \
+      'vals':vals.flatten()}
+
+  def _interpolate_axis(self, vals, axis, x, interpolation):
+    """
+    Interpolates vals along one axis at the fractional indices x
+    """
+    n = vals.shape[axis]
+    x = np.clip(x, 0, n-1)
+    i0 = np.minimum(np.floor(x).astype(int), max(n-2,0))
+    t = x - i0
+    if interpolation=='Trilinear':
+      taps = [(i0, 1.-t), (i0+1, t)]
+    elif interpolation=='CatmullRom':
+      t2 = t*t
+      t3 = t2*t
+      taps = [(i0-1, 0.5*(-t3 + 2*t2 - t)), \
+              (i0,   0.5*(3*t3 - 5*t2 + 2)), \
+              (i0+1, 0.5*(-3*t3 + 4*t2 + t)), \
+              (i0+2, 0.5*(t3 - t2))]
+    else:
+      raise Exception('Interpolation type %s not supported'%interpolation)
+    shape = [1]*vals.ndim
+    shape[axis] = len(x)
+    resampled = np.zeros(vals.shape[:axis] + (len(x),) + vals.shape[axis+1:])
+    for (ind, w) in taps:
+      resampled += np.take(vals, np.clip(ind,0,n-1), axis=axis)*w.reshape(shape)
+    return resampled
+
 class crd:
   """
   Class to read and write AMBER coordinate/restart and trajectory files.
@@ -304,9 +455,25 @@ class dock6_mol2:
   def read(self, FN, reorder=None, multiplier=None):
     crds = []
     E = {}
+    for (crd, E_model) in self.iread(FN, reorder, multiplier):
+      if crds==[]:
+        for (label, val) in E_model:
+          E[label] = []
+      for (label, val) in E_model:
+        if not label in E.keys():
+          E[label] = [0]*len(crds)
+        E[label].append(val)
+      crds.append(crd)
+    return (crds,E)
 
+  def iread(self, FN, reorder=None, multiplier=None):
+    """
+    Reads models one at a time, without loading the whole file.
+    Yields (crd, E_model), where E_model is a list of (label, value)
+    for the energy terms in the model header.
+    """
     if (FN is None) or (not os.path.isfile(FN)):
-      return (crds,E)
+      return
 
     # Specifically to read output from UCSF dock6
     if FN.endswith('.mol2'):
@@ -316,36 +483,37 @@ class dock6_mol2:
       mol2F = gzip.open(FN,'r')
     else:
       raise Exception('Unknown file type')
-    
-    models = mol2F.read().strip().split('########## Name:')
+
+    def model(atoms, E_model):
+      crd = np.array(atoms, dtype=float)
+      if multiplier is not None:
+        crd = multiplier*crd
+      if reorder is not None:
+        crd = crd[reorder,:]
+      return (crd, E_model)
+
+    E_model = None
+    in_atoms = False
+    for line in mol2F:
+      if line.startswith('########## Name:'):
+        if E_model is not None:
+          yield model(atoms, E_model)
+        E_model = []
+        atoms = []
+        in_atoms = False
+      elif E_model is None:
+        continue
+      elif line.startswith('##########'):
+        if not in_atoms:
+          E_model.append((line[11:line.find(':')].strip(), \
+            float(line.split()[-1])))
+      elif line.startswith('@<TRIPOS>'):
+        in_atoms = line.startswith('@<TRIPOS>ATOM')
+      elif in_atoms and line.strip()!='':
+        atoms.append(line.split()[2:5])
     mol2F.close()
-    models.pop(0)
-    
-    if len(models)>0:
-      for line in models[0].split('\n'):
-        if line.startswith('##########'):
-          label = line[11:line.find(':')].strip()
-          E[label] = []
-      
-      for model in models:
-        fields = model.split('<TRIPOS>')
-        
-        crd = np.array([l.split()[2:5] for l in fields[2].split('\n')[1:-1]],
-          dtype=float)
-        if multiplier is not None:
-          crd = multiplier*crd
-        if reorder is not None:
-          crd = crd[reorder,:]
-
-        for line in fields[0].split('\n'):
-          if line.startswith('##########'):
-            label = line[11:line.find(':')].strip()
-            if not label in E.keys():
-              E[label] = [0]*len(crds)
-            E[label].append(float(line.split()[-1]))
-
-        crds.append(crd)
-    return (crds,E)
+    if E_model is not None:
+      yield model(atoms, E_model)
 
   def write(self, templateFN, confs, FN):
     if (templateFN is None) or not os.path.isfile(templateFN):
@@ -376,10 +544,50 @@ class dock6_mol2:
         + footer)
     F.close()
 
+class sander_mdout:
+  """
+  Class to read energies from sander output
+  """
+  def __init__(self):
+    import re
+    # Energy terms are printed as NAME = value, where
+    # names are single words except for the 1-4 terms
+    self._term = re.compile(r'(1-4 \w+|\w+)\s*=\s*(\S+)')
+
+  def read(self, FN):
+    """
+    Reads the energies of every frame from sander imin=5 output.
+    Returns a numpy record array with a field for each energy term,
+    in the order that the terms are printed.
+    """
+    F = open(FN,'r')
+    dat = F.read()
+    F.close()
+
+    names = None
+    vals = []
+    start = dat.find(' BOND')
+    while start>-1:
+      end = dat.find('\nminimization', start)
+      if end==-1:
+        end = len(dat)
+      terms = self._term.findall(dat, start, end)
+      if names is None:
+        names = [name for (name,val) in terms]
+      vals.append(tuple([float(val) for (name,val) in terms]))
+      start = dat.find(' BOND', end)
+
+    if names is None:
+      return np.zeros(0, dtype=[])
+    return np.array(vals, dtype=[(name,float) for name in names])
+
 class dcd:
   """
   Class to write DCD files
   """
+  # Number of frames written to a DCD file at a time
+  _write_block = 1000
+
   def __init__(self, molecule, ligand_atom_order=None, \
       receptorConf=None, ligand_first_atom=0):
     self.molecule = molecule
@@ -393,58 +601,91 @@ class dcd:
 
   def write(self, FN, confs,
       includeLigand=True, includeReceptor=False, factor=10.0,
-      delta_t=0.1):
+      delta_t=0.1, append=False):
     """
     Writes a DCD file for a trajectory.
     If includeReceptor==True, the receptor coordinates are included.
+    If append==True and FN exists, the frames are added to the end of FN.
     """
-    import MMTK
-    import MMTK_DCD  # @UnresolvedImport
-    from Scientific import N
-
     if not isinstance(confs,list):
       confs = [confs]
     
     if includeReceptor and (self.receptorConf is None):
       raise Exception("Missing receptor configuration")
-    
-    n_atoms = 0
-    if includeReceptor:
-      receptor_x0 = factor*self.receptorConf[:self.ligand_first_atom,0]
-      receptor_y0 = factor*self.receptorConf[:self.ligand_first_atom,1]
-      receptor_z0 = factor*self.receptorConf[:self.ligand_first_atom,2]
-      receptor_x1 = factor*self.receptorConf[self.ligand_first_atom:,0]
-      receptor_y1 = factor*self.receptorConf[self.ligand_first_atom:,1]
-      receptor_z1 = factor*self.receptorConf[self.ligand_first_atom:,2]
-      n_atoms += self.receptorConf.shape[0]
+
+    # Build all the frames in a single array
     if includeLigand:
-      n_atoms += len(self.molecule.atoms)
-    n_snaps = len(confs)
-
-    fd = MMTK_DCD.writeOpenDCD(FN, n_atoms, n_snaps, 1, 1, delta_t)
-
-    if includeReceptor and includeLigand:
-      for array in confs:
-        array = factor*array
-        x = N.concatenate((receptor_x0,N.take(array[:,0],self.ligand_atom_order),receptor_x1)).astype(N.Float16)
-        y = N.concatenate((receptor_y0,N.take(array[:,1],self.ligand_atom_order),receptor_y1)).astype(N.Float16)
-        z = N.concatenate((receptor_z0,N.take(array[:,2],self.ligand_atom_order),receptor_z1)).astype(N.Float16)
-        MMTK_DCD.writeDCDStep(fd, x, y, z)
-      MMTK_DCD.writeCloseDCD(fd)
+      ligand = factor*np.array(confs)[:,self.ligand_atom_order,:]
+    if includeReceptor:
+      receptor_0 = factor*self.receptorConf[:self.ligand_first_atom,:]
+      receptor_1 = factor*self.receptorConf[self.ligand_first_atom:,:]
+      if includeLigand:
+        n_snaps = len(confs)
+        frames = np.concatenate((\
+          np.tile(receptor_0,(n_snaps,1,1)), ligand, \
+          np.tile(receptor_1,(n_snaps,1,1))), axis=1)
+      else:
+        frames = np.concatenate((receptor_0,receptor_1))[np.newaxis,:,:]
     elif includeLigand:
-      for array in confs:
-        array = factor*array
-        x = N.take(array[:,0], self.ligand_atom_order).astype(N.Float16)
-        y = N.take(array[:,1], self.ligand_atom_order).astype(N.Float16)
-        z = N.take(array[:,2], self.ligand_atom_order).astype(N.Float16)
-        MMTK_DCD.writeDCDStep(fd, x, y, z)
-      MMTK_DCD.writeCloseDCD(fd)
+      frames = ligand
     else:
-      x = N.concatenate((receptor_x0,receptor_x1)).astype(N.Float16)
-      y = N.concatenate((receptor_y0,receptor_y1)).astype(N.Float16)
-      z = N.concatenate((receptor_z0,receptor_z1)).astype(N.Float16)
-      MMTK_DCD.writeDCDStep(fd, x, y, z)
-      MMTK_DCD.writeCloseDCD(fd)
+      raise Exception("Neither the ligand nor receptor are included")
+    (n_snaps, n_atoms) = frames.shape[:2]
+
+    if append and os.path.isfile(FN):
+      F = open(FN,'r+b')
+      self._update_header(F, FN, n_atoms, n_snaps)
+      F.seek(0, os.SEEK_END)
+    else:
+      F = open(FN,'wb')
+      self._write_header(F, FN, n_atoms, n_snaps, delta_t)
+
+    # Each frame consists of Fortran records for x, y, and z,
+    # each of which is surrounded by its length in bytes
+    for start_n in range(0, n_snaps, self._write_block):
+      block = frames[start_n:start_n+self._write_block]
+      records = np.empty((block.shape[0], 3, n_atoms+2), dtype=np.float32)
+      records[:,:,1:-1] = block.transpose((0,2,1))
+      markers = records.view(np.int32)
+      markers[:,:,0] = 4*n_atoms
+      markers[:,:,-1] = 4*n_atoms
+      F.write(records.tostring())
+    F.close()
+
+  def _write_header(self, F, FN, n_atoms, n_snaps, delta_t):
+    """
+    Writes a CHARMM-format DCD header, as in MMTK_DCD
+    """
+    import struct, time
+    # NSET, ISTART, NSAVC, five zeros, NAMNF, DELTA, ten zeros
+    # DELTA is in AKMA time units
+    icntrl = struct.pack('9if10i', n_snaps, 1, 1, \
+      *([0]*6 + [delta_t/0.0488882129] + [0]*10))
+    titles = [('REMARKS FILENAME=%s CREATED BY VMD'%FN)[:80].ljust(80), \
+      ('REMARKS DATE: %s CREATED BY MMTK.'%(\
+        time.strftime('%m/%d/%y')))[:80].ljust(80)]
+    F.write(struct.pack('i',84) + 'CORD' + icntrl + struct.pack('i',84))
+    F.write(struct.pack('ii',164,2) + ''.join(titles) + struct.pack('i',164))
+    F.write(struct.pack('iii',4,n_atoms,4))
+
+  def _update_header(self, F, FN, n_atoms, n_snaps):
+    """
+    Adds n_snaps to the number of frames in an existing DCD file
+    """
+    import struct
+    F.seek(0)
+    (marker, cord, nset) = struct.unpack('i4si', F.read(12))
+    if (marker!=84) or (cord!='CORD'):
+      raise Exception('%s is not a DCD file that can be appended to'%FN)
+    # The number of atoms follows the title record
+    F.seek(4 + 84 + 4)
+    title_length = struct.unpack('i', F.read(4))[0]
+    F.seek(title_length + 4 + 4, os.SEEK_CUR)
+    file_natoms = struct.unpack('i', F.read(4))[0]
+    if file_natoms!=n_atoms:
+      raise Exception('%s has %d atoms, not %d'%(FN, file_natoms, n_atoms))
+    F.seek(8)
+    F.write(struct.pack('i', nset + n_snaps))
 
 class prmtop:
   """
@@ -459,6 +700,10 @@ class prmtop:
     """
     if not os.path.isfile(FN):
       raise Exception('prmtop file %s does not exist!'%FN)
+    return _cached(('prmtop',tuple(varnames)), FN, \
+      lambda : self._read(FN, varnames))
+
+  def _read(self, FN, varnames):
     if FN.endswith('.gz'):
       import gzip
       F = gzip.open(FN, 'r')
@@ -475,22 +720,32 @@ class prmtop:
     return prmtop
 
   def _load_record(self, record):
-    items = []
     lines = record.split('\n')
     lines.pop(0) # Name
     FORMAT = lines.pop(0).strip()[8:-1] # Format
     if FORMAT.find('a')>-1: # Text
       w = int(FORMAT[FORMAT.find('a')+1:])
-      for line in lines:
-        items = items + [line[x:x+w] for x in range(0,len(line),w)]
-      return np.array(items)
+      return self._split_fields(lines, w)
     elif FORMAT.find('I')>-1: # Integer
       w = int(FORMAT[FORMAT.find('I')+1:])
-      for line in lines:
-        items = items + [int(line[x:x+w]) for x in range(0,len(line),w)]
-      return np.array(items, dtype=int)
+      return self._split_fields(lines, w).astype(int)
     elif FORMAT.find('E')>-1: # Scientific
       w = int(FORMAT[FORMAT.find('E')+1:FORMAT.find('.')])
-      for line in lines:
-        items = items + [float(line[x:x+w]) for x in range(0,len(line),w)]
-      return np.array(items, dtype=float)
+      return self._split_fields(lines, w).astype(float)
+
+  def _split_fields(self, lines, w):
+    """
+    Splits lines into fields of width w, as an array of strings
+    """
+    lines = [line for line in lines if line!='']
+    if len(lines)==0:
+      return np.array([], dtype='S%d'%w)
+    if all([len(line)%w==0 for line in lines[:-1]]):
+      # Fields are aligned across lines, so the record is split at once
+      data = ''.join(lines)
+      data = data + ' '*(-len(data)%w)
+      return np.frombuffer(data, dtype='S%d'%w).copy()
+    items = []
+    for line in lines:
+      items.extend([line[x:x+w] for x in range(0,len(line),w)])
+    return np.array(items)
@@ -32,14 +32,23 @@ def random_rotate():
                      q[0]*q[0] - q[1]*q[1] - q[2]*q[2] + q[3]*q[3]]])
   return rotMat
 
+def logsumexp(a):
+  """
+  Returns the logarithm of the sum of exponentials of the array a
+  """
+  a_max = np.max(a)
+  return a_max + np.log(np.sum(np.exp(a - a_max)))
+
 #
 # External Monte Carlo move integrator
 #
 class ExternalMCIntegrator(Dynamics.Integrator):
   def __init__(self, universe, molecule, step_size, **options):
     """
-    confs - configurations to dart to
-    extended - whether or not to use external coordinates
+    molecule - the molecule that is moved
+    step_size - the standard deviation of random translations
+    options may include ntries, the number of proposals in each trial.
+      If ntries is greater than one, multiple-try Metropolis is used.
     """
     Dynamics.Integrator.__init__(self, universe, options)
     # Supported features: none for the moment, to keep it simple
@@ -56,11 +65,20 @@ class ExternalMCIntegrator(Dynamics.Integrator):
   
     RT = R*self.getOption('T')
     ntrials = self.getOption('ntrials')
+    try:
+      ntries = self.getOption('ntries')
+    except ValueError:
+      ntries = 1
+    if ntries>1:
+      return self._multiple_try(RT, ntrials, ntries)
+
+    # Only terms that change under rigid body moves are evaluated
+    terms = self._rigid_terms()
 
     acc = 0
     xo = np.copy(self.universe.configuration().array)
-    eo = self.universe.energy()
-    com = self.universe.centerOfMass().array
+    com = np.array(self.universe.centerOfMass().array)
+    eo = self._energies(terms, xo[np.newaxis])[0]
     
     for c in range(ntrials):
       step = np.random.randn(3)*self.step_size
@@ -70,14 +88,126 @@ class ExternalMCIntegrator(Dynamics.Integrator):
       else:
         # Random translation
         xn = xo + step
-      self.universe.setConfiguration(Configuration(self.universe,xn))
-      en = self.universe.energy()
+      en = self._energies(terms, xn[np.newaxis])[0]
       if ((en<eo) or (np.random.random()<np.exp(-(en-eo)/RT))):
         acc += 1
         xo = xn
         eo = en
         com += step
+
+    self.universe.setConfiguration(Configuration(self.universe,xo))
+    return ([np.copy(xo)], [self.universe.energy()], acc, ntrials, 0.0)
+
+  def _multiple_try(self, RT, ntrials, ntries):
+    """
+    Multiple-try Metropolis (Liu, Liang, and Wong, JASA 95, 121, 2000)
+    with ntries rigid body proposals in each trial.
+    Because the proposals are symmetric, their weights are Boltzmann factors.
+    """
+    # Only terms that change under rigid body moves are evaluated
+    terms = self._rigid_terms()
+
+    acc = 0
+    xo = np.copy(self.universe.configuration().array)
+    com = np.array(self.universe.centerOfMass().array)
+    eo = self._energies(terms, xo[np.newaxis])[0]
+
+    for c in range(ntrials):
+      # Proposals from the current configuration
+      (ys, coms_y) = self._propose(xo, com, ntries, c%2==0)
+      log_w_y = -self._energies(terms, ys)/RT
+      # Select a proposal in proportion to its weight
+      p = np.exp(log_w_y - np.max(log_w_y))
+      j = np.random.choice(ntries, p=p/np.sum(p))
+      # Reference set from the selected proposal,
+      # which includes the current configuration
+      (xs, coms_x) = self._propose(ys[j], coms_y[j], ntries-1, c%2==0)
+      log_w_x = np.append(-self._energies(terms, xs)/RT, -eo/RT)
+      log_ratio = logsumexp(log_w_y) - logsumexp(log_w_x)
+      if (log_ratio>0) or (np.random.random()<np.exp(log_ratio)):
+        acc += 1
+        xo = ys[j]
+        eo = -log_w_y[j]*RT
+        com = coms_y[j]
+
+    self.universe.setConfiguration(Configuration(self.universe,xo))
+    return ([np.copy(xo)], [self.universe.energy()], acc, ntrials, 0.0)
+
+  def _propose(self, x, com, n, rotate):
+    """
+    Returns n configurations generated by rigid body moves of x
+    and their centers of mass
+    """
+    steps = np.random.randn(n,3)*self.step_size
+    if rotate:
+      # Random translation and full rotation
+      xs = np.array([np.dot(x - com, random_rotate()) for k in range(n)])
+    else:
+      # Random translation
+      xs = np.tile(x - com, (n,1,1))
+    return (xs + (com + steps)[:,np.newaxis,:], com + steps)
+
+  def _rigid_terms(self):
+    """
+    Returns the force fields in the universe whose energy changes
+    under rigid body moves. They are split into a list of force fields
+    that can be evaluated for many configurations at once and
+    an energy evaluator for the others, which may be None.
+    Internal terms, which do not change, are left out.
+    The result is stored with the universe energy evaluator.
+    """
+    universe_evaluator = self.universe.energyEvaluator()
+    if hasattr(universe_evaluator, 'rigid_terms'):
+      return universe_evaluator.rigid_terms
+
+    def flatten(ff):
+      if ff.__class__.__name__=='CompoundForceField':
+        return sum([flatten(f) for f in ff.fflist],[])
+      return [ff]
+
+    vectorized = []
+    others = []
+    for ff in flatten(self.universe.forceField()):
+      name = ff.__class__.__name__
+      if name.startswith('Amber') or (name=='InternalRestraintForceField') or \
+          (name=='OBCForceField' and not ff.useDesolvationGrid):
+        continue # Internal energy
+      elif (name=='InterpolationForceField' and \
+            ff.params['interpolation_type']=='Trilinear' and \
+            not ff.params['energy_thresh']>0) or \
+           (name in ['SphereForceField','CylinderForceField']):
+        vectorized.append(ff)
       else:
-        self.universe.setConfiguration(Configuration(self.universe,xo))
+        others.append(ff)
+
+    evaluator = None
+    if len(others)>0:
+      from MMTK.ForceFields import ForceField
+      compoundFF = others[0]
+      for ff in others[1:]:
+        compoundFF += ff
+      evaluator = ForceField.EnergyEvaluator(\
+        self.universe, compoundFF, None, None, None, None)
 
-    return ([np.copy(xo)], [en], acc, ntrials, 0.0)
\ No newline at end of file
+    universe_evaluator.rigid_terms = (vectorized, evaluator)
+    return universe_evaluator.rigid_terms
+
+  def _energies(self, terms, xs):
+    """
+    Returns the energies of the configurations xs, up to a constant
+    that does not change with rigid body moves
+    """
+    (vectorized, evaluator) = terms
+    E = np.zeros(len(xs))
+    for ff in vectorized:
+      E += ff.energies(self.universe, xs)
+    if evaluator is not None:
+      xo = np.copy(self.universe.configuration().array)
+      universe_evaluator = self.universe._evaluator[(None,None,None)]
+      self.universe._evaluator[(None,None,None)] = evaluator
+      for k in range(len(xs)):
+        self.universe.setConfiguration(Configuration(self.universe,xs[k]))
+        E[k] += self.universe.energy()
+      self.universe._evaluator[(None,None,None)] = universe_evaluator
+      self.universe.setConfiguration(Configuration(self.universe,xo))
+    return E
@@ -0,0 +1,137 @@
+# This module implements a generalized Hamiltonian Monte Carlo "integrator"
+# It is the Hamiltonian Monte Carlo integrator with
+# partial momentum refreshment between trials.
+# After a rejected trial, the momentum is reversed.
+# It requires the option 'T' in addition to velocity verlet options.
+# The option 'refresh', between 0 and 1, is the fraction of the kinetic
+# energy that is redrawn from the Maxwell-Boltzmann distribution
+# before each trial. With refresh=1 it is equivalent to
+# Hamiltonian Monte Carlo.
+# The momentum is not kept between calls. It is fully redrawn at the
+# start of every call, because the universe may have been set to another
+# replica. Partial refreshment and momentum reversal therefore only carry
+# across the trials within a call (steps/steps_per_trial), not across
+# sweeps of replica exchange.
+
+from MMTK import Dynamics, Environment, Features, Trajectory, Units
+import MMTK_dynamics
+from MMTK.ParticleProperties import Configuration
+
+from Scientific import N
+import numpy as np
+
+R = 8.3144621*Units.J/Units.mol/Units.K
+
+#
+# Generalized Hamiltonian Monte Carlo integrator
+#
+class GHMCIntegrator(Dynamics.Integrator):
+
+    def __init__(self, universe, **options):
+        Dynamics.Integrator.__init__(self, universe, options)
+        # Supported features: none for the moment, to keep it simple
+        self.features = []
+
+    def __call__(self, **options):
+        # Process the keyword arguments
+        self.setCallOptions(options)
+        # Check if the universe has features not supported by the integrator
+        Features.checkFeatures(self, self.universe)
+      
+        RT = R*self.getOption('T')
+        delta_t = self.getOption('delta_t')
+        
+        if 'steps_per_trial' in self.call_options.keys():
+          steps_per_trial = self.getOption('steps_per_trial')
+          ntrials = self.getOption('steps')/steps_per_trial
+        else:
+          steps_per_trial = self.getOption('steps')
+          ntrials = 1
+  
+        if 'normalize' in self.call_options.keys():
+          normalize = self.getOption('normalize')
+        else:
+          normalize = False
+
+        try:
+          refresh = self.getOption('refresh')
+        except ValueError:
+          refresh = 0.5
+
+        # Seed the random number generator
+        if 'random_seed' in self.call_options.keys():
+          np.random.seed(self.getOption('random_seed'))
+
+        # Get the universe variables needed by the integrator
+        masses = self.universe.masses()
+        fixed = self.universe.getAtomBooleanArray('fixed')
+        nt = self.getOption('threads')
+        comm = self.getOption('mpi_communicator')
+        evaluator = self.universe.energyEvaluator(threads=nt,
+                                                  mpi_communicator=comm)
+        evaluator = evaluator.CEvaluator()
+
+        late_args = (
+                masses.array, fixed.array, evaluator,
+                N.zeros((0, 2), N.Int), N.zeros((0, ), N.Float),
+                N.zeros((1,), N.Int),
+                N.zeros((0,), N.Float), N.zeros((2,), N.Float),
+                N.zeros((0,), N.Float), N.zeros((1,), N.Float),
+                delta_t, self.getOption('first_step'),
+                steps_per_trial, self.getActions(),
+                'Generalized Hamiltonian Monte Carlo step')
+
+        # Variables for velocity assignment
+        m3 = np.repeat(np.expand_dims(masses.array,1),3,axis=1)
+        sigma_MB = np.sqrt((self.getOption('T')*Units.k_B)/m3)
+        natoms = self.universe.numberOfAtoms()
+
+        # The momentum is fully sampled at the start of the call,
+        # because the universe may have been set to another replica
+        self.universe.initializeVelocitiesToTemperature(self.getOption('T'))
+        vo = np.multiply(sigma_MB,np.random.randn(natoms,3))
+
+        xs = []
+        energies = []
+
+        # Store initial configuration and potential energy
+        xo = np.copy(self.universe.configuration().array)
+        pe_o = self.universe.energy()
+
+        acc = 0
+        for t in range(ntrials):
+          # Partially refresh the velocity
+          v = self.universe.velocities()
+          v.array = np.sqrt(1.-refresh)*vo + \
+            np.sqrt(refresh)*np.multiply(sigma_MB,np.random.randn(natoms,3))
+          vo = np.copy(v.array)
+    
+          # Store total energy
+          eo = pe_o + 0.5*np.sum(np.multiply(m3,np.square(v.array)))
+
+          # Run the velocity verlet integrator
+          self.run(MMTK_dynamics.integrateVV,
+            (self.universe,
+             self.universe.configuration().array,
+             self.universe.velocities().array) + late_args)
+
+          # Decide whether to accept the move
+          pe_n = self.universe.energy()
+          en = pe_n + 0.5*np.sum(np.multiply(m3,np.square(v.array)))
+          
+          if ((en<eo) or (np.random.random()<N.exp(-(en-eo)/RT))) and \
+             ((abs(pe_o-pe_n)/RT<250.) or (abs(eo-en)/RT<250.)):
+            xo = np.copy(self.universe.configuration().array)
+            vo = np.copy(self.universe.velocities().array)
+            pe_o = pe_n
+            acc += 1
+            if normalize:
+              self.universe.normalizePosition()
+          else:
+            self.universe.setConfiguration(Configuration(self.universe,xo))
+            vo = -vo
+          
+          xs.append(np.copy(self.universe.configuration().array))
+          energies.append(pe_o)
+  
+        return (xs, energies, acc, ntrials, delta_t)
@@ -0,0 +1,321 @@
+# This module implements a Hamiltonian Monte Carlo integrator
+# in which all of the trials are run within a single compiled loop.
+#
+# Velocity sampling, velocity verlet integration, the Metropolis test,
+# and restoring the configuration after a rejected trial are all in C,
+# so there is no Python overhead per trial.
+#
+
+import numpy as np
+cimport numpy as np
+import cython
+
+cimport MMTK_trajectory_generator
+from MMTK import Units
+from MMTK import Features
+
+import MMTK_trajectory
+import MMTK_forcefield
+
+cdef extern from "stdlib.h":
+
+    ctypedef long size_t
+    cdef void *malloc(size_t size)
+    cdef void free(void *ptr)
+
+cdef extern from "string.h":
+
+    cdef void *memcpy(void *dest, void *src, size_t n)
+
+cdef extern from "math.h":
+
+    cdef double sqrt(double x)
+    cdef double log(double x)
+    cdef double exp(double x)
+    cdef double cos(double x)
+    cdef double fabs(double x)
+
+from MMTK.ParticleProperties import Configuration, ParticleVector
+
+include "MMTK/python.pxi"
+include "MMTK/numeric.pxi"
+include "MMTK/core.pxi"
+include "MMTK/universe.pxi"
+include "MMTK/trajectory.pxi"
+include "MMTK/forcefield.pxi"
+
+R = 8.3144621*Units.J/Units.mol/Units.K
+
+include "../xorshift.pxi"
+
+#
+# Hamiltonian Monte Carlo integrator
+#
+cdef class HMCIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerator):
+
+  """
+  Hamiltonian Monte Carlo integrator
+  The integration is started by calling the integrator object.
+  In addition to the options of the velocity verlet integrator,
+  the temperature 'T' is required.
+  Each trial is 'steps_per_trial' velocity verlet steps
+  and there are 'steps'/'steps_per_trial' trials.
+  If 'thin' is positive, the configuration after every 'thin' trials
+  is returned in addition to the final configuration.
+
+  Calling the integrator returns (xs, energies, acc, ntrials, delta_t),
+  the same as the Python HamiltonianMonteCarloIntegrator.
+  As in velocity verlet, atoms with the 'fixed' attribute do not move.
+  """
+
+  cdef np.ndarray x, v, g, m, xo, go, f
+  cdef energy_data energy
+  cdef double RT
+  cdef rng_t rng
+
+  def __init__(self, universe, **options):
+    """
+    @param universe: the universe on which the integrator acts
+    @type universe: L{MMTK.Universe}
+    @keyword steps: the number of integration steps (default is 100)
+    @type steps: C{int}
+    @keyword delta_t: the time step (default is 1 fs)
+    @type delta_t: C{double}
+    @keyword actions: a list of actions to be executed periodically
+                      (default is none)
+    @type actions: C{list}
+    @keyword threads: the number of threads to use in energy evaluation
+                      (default set by MMTK_ENERGY_THREADS)
+    @type threads: C{int}
+    @keyword background: if True, the integration is executed as a
+                         separate thread (default: False)
+    @type background: C{bool}
+    """
+    MMTK_trajectory_generator.EnergyBasedTrajectoryGenerator.__init__(
+        self, universe, options, "Hamiltonian Monte Carlo integrator")
+    # Supported features: none for the moment, to keep it simple
+    self.features = []
+
+  default_options = {'first_step': 0, 'steps': 100, 'delta_t': 1.*Units.fs,
+                     'background': False, 'threads': None,
+                     'actions': []}
+
+  available_data = ['configuration', 'velocities', 'gradients',
+                    'energy', 'time']
+
+  restart_data = ['configuration', 'velocities', 'energy']
+
+  def __call__(self, **options):
+    self.setCallOptions(options)
+    self.actions = []
+    try:
+        if self.getOption('background'):
+            import MMTK_state_accessor
+            self.state_accessor = MMTK_state_accessor.StateAccessor()
+            self.actions.append(self.state_accessor)
+    except ValueError:
+        pass
+    Features.checkFeatures(self, self.universe)
+    if self.tvars != NULL:
+        free(self.tvars)
+        self.tvars = NULL
+    self.universe_spec = <PyUniverseSpecObject *>self.universe._spec
+    if self.universe_spec.geometry_data_length > 0:
+        self.declareTrajectoryVariable_box(
+            self.universe_spec.geometry_data,
+            self.universe_spec.geometry_data_length)
+    self.df = self.universe.degreesOfFreedom()
+    self.declareTrajectoryVariable_int(&self.df,
+                                       "degrees_of_freedom",
+                                       "Degrees of freedom: %d\n",
+                                       "", PyTrajectory_Internal)
+    if self.getOption('background'):
+        from MMTK import ThreadManager
+        return ThreadManager.TrajectoryGeneratorThread(
+            self.universe, self.start_py, (), self.state_accessor)
+    else:
+        # This is the main change from the original __call__ function
+        # in MMTK_trajectory_generator.pyx
+        return self.start()
+
+  # Cython compiler directives set for efficiency:
+  # - No bound checks on index operations
+  # - No support for negative indices
+  # - Division uses C semantics
+  @cython.boundscheck(False)
+  @cython.wraparound(False)
+  @cython.cdivision(True)
+  cdef start(self):
+
+    cdef double time, delta_t, ke, eo, en, pe_o, pe_n
+    cdef int natoms, ntrials, steps_per_trial, thin
+    cdef int t, s, i, d, acc
+    cdef size_t nbytes
+    cdef np.ndarray[double, ndim=2] x, v, g, xo, go
+    cdef np.ndarray[double, ndim=1] m, sigma_MB
+    cdef np.ndarray[np.int8_t, ndim=1] f
+
+    # Gather state variables and parameters
+    if self.universe.velocities() is None:
+      self.universe.initializeVelocitiesToTemperature(self.getOption('T'))
+    configuration = self.universe.configuration()
+    velocities = self.universe.velocities()
+    gradients = ParticleVector(self.universe)
+    masses = self.universe.masses()
+    fixed = self.universe.getAtomBooleanArray('fixed')
+    delta_t = self.getOption('delta_t')
+    natoms = self.universe.numberOfAtoms()
+
+    self.RT = R*self.getOption('T')
+
+    if 'steps_per_trial' in self.call_options.keys():
+      steps_per_trial = self.getOption('steps_per_trial')
+      ntrials = self.getOption('steps')/steps_per_trial
+    else:
+      steps_per_trial = self.getOption('steps')
+      ntrials = 1
+
+    if 'thin' in self.call_options.keys():
+      thin = self.getOption('thin')
+    else:
+      thin = 0
+
+    if 'normalize' in self.call_options.keys():
+      normalize = self.getOption('normalize')
+    else:
+      normalize = False
+
+    # Seed the random number generator
+    if 'random_seed' in self.call_options.keys():
+      rng_seed(&self.rng, self.getOption('random_seed'))
+    else:
+      rng_seed(&self.rng, np.random.randint(2**30))
+
+    # For efficiency, the Cython code works at the array
+    # level rather than at the ParticleProperty level.
+    # The configuration is modified in place.
+    self.x = configuration.array
+    self.v = velocities.array
+    self.g = gradients.array
+    self.m = masses.array
+    self.f = np.array(fixed.array, dtype=np.int8)
+    self.xo = np.copy(self.x)
+    self.go = np.copy(self.g)
+    x = self.x
+    v = self.v
+    g = self.g
+    m = self.m
+    f = self.f
+    xo = self.xo
+    go = self.go
+    nbytes = natoms*3*sizeof(double)
+
+    # Standard deviation of the Maxwell-Boltzmann distribution
+    sigma_MB = np.sqrt((self.getOption('T')*Units.k_B)/self.m)
+
+    # Ask for energy gradients to be calculated and stored in
+    # the array g. Force constants are not requested.
+    self.energy.gradients = <void *>self.g
+    self.energy.gradient_fn = NULL
+    self.energy.force_constants = NULL
+    self.energy.fc_fn = NULL
+
+    # Declare the variables accessible to trajectory actions.
+    self.declareTrajectoryVariable_double(
+        &time, "time", "Time: %lf\n", time_unit_name, PyTrajectory_Time)
+    self.declareTrajectoryVariable_array(
+        self.v, "velocities", "Velocities:\n", velocity_unit_name,
+        PyTrajectory_Velocities)
+    self.declareTrajectoryVariable_array(
+        self.g, "gradients", "Energy gradients:\n", energy_gradient_unit_name,
+        PyTrajectory_Gradients)
+    self.declareTrajectoryVariable_double(
+        &self.energy.energy,"potential_energy", "Potential energy: %lf\n",
+        energy_unit_name, PyTrajectory_Energy)
+    self.declareTrajectoryVariable_double(
+        &ke, "kinetic_energy", "Kinetic energy: %lf\n",
+        energy_unit_name, PyTrajectory_Energy)
+    self.initializeTrajectoryActions()
+
+    # Acquire the write lock of the universe.
+    self.acquireWriteLock()
+
+    # Store initial configuration, gradients, and potential energy
+    self.calculateEnergies(self.x, &self.energy, 0)
+    pe_o = self.energy.energy
+    memcpy(<void *>xo.data, <void *>x.data, nbytes)
+    memcpy(<void *>go.data, <void *>g.data, nbytes)
+
+    xs = []
+    energies = []
+
+    time = 0.
+    acc = 0
+    for t in range(ntrials):
+      # Sample the velocity and store the total energy
+      ke = 0.
+      for i in range(natoms):
+        if f[i]:
+          for d in range(3):
+            v[i,d] = 0.
+          continue
+        for d in range(3):
+          v[i,d] = sigma_MB[i]*rng_gaussian(&self.rng)
+          ke += 0.5*m[i]*v[i,d]*v[i,d]
+      eo = pe_o + ke
+
+      # Velocity verlet integration
+      for s in range(steps_per_trial):
+        for i in range(natoms):
+          if f[i]:
+            continue
+          for d in range(3):
+            v[i,d] -= 0.5*delta_t*g[i,d]/m[i]
+            x[i,d] += delta_t*v[i,d]
+        self.foldCoordinatesIntoBox()
+        self.calculateEnergies(self.x, &self.energy, 1)
+        for i in range(natoms):
+          if f[i]:
+            continue
+          for d in range(3):
+            v[i,d] -= 0.5*delta_t*g[i,d]/m[i]
+
+      # Decide whether to accept the move
+      pe_n = self.energy.energy
+      ke = 0.
+      for i in range(natoms):
+        for d in range(3):
+          ke += 0.5*m[i]*v[i,d]*v[i,d]
+      en = pe_n + ke
+
+      if ((en<eo) or (rng_uniform(&self.rng)<exp(-(en-eo)/self.RT))) and \
+         ((fabs(pe_o-pe_n)/self.RT<250.) or (fabs(eo-en)/self.RT<250.)):
+        memcpy(<void *>xo.data, <void *>x.data, nbytes)
+        memcpy(<void *>go.data, <void *>g.data, nbytes)
+        pe_o = pe_n
+        acc += 1
+      else:
+        memcpy(<void *>x.data, <void *>xo.data, nbytes)
+        memcpy(<void *>g.data, <void *>go.data, nbytes)
+        self.energy.energy = pe_o
+
+      time += steps_per_trial*delta_t
+      if (thin>0) and ((t+1)%thin==0) and (t+1<ntrials):
+        xs.append(np.copy(self.x))
+        energies.append(pe_o)
+
+    xs.append(np.copy(self.x))
+    energies.append(pe_o)
+
+    self.universe.setConfiguration(\
+      Configuration(self.universe, self.x), block=False)
+    if normalize:
+      self.universe.normalizePosition()
+
+    # Release the write lock.
+    self.releaseWriteLock()
+
+    # Finalize all trajectory actions (close files etc.)
+    self.finalizeTrajectoryActions(ntrials*steps_per_trial)
+
+    return (xs, energies, acc, ntrials, delta_t)
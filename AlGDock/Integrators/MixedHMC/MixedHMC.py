@@ -3,39 +3,60 @@
 
 # It requires the option 'T' in addition to velocity verlet options.
 
-from MMTK import Dynamics, Environment, Features, Trajectory, Units
-import MMTK_dynamics
-from MMTK.ParticleProperties import Configuration
+# Both integrators are constructed once and keep their state between calls.
+# Coordinates are the only thing passed between them,
+# through the configuration of the shared universe.
 
-from Scientific import N
-import numpy as np
+from MMTK import Dynamics, Features, Units
 
-R = 8.3144621*Units.J/Units.mol/Units.K
+import numpy as np
+import time
 
 #
 # Mixed HMC integrator
 #
 class MixedHMCIntegrator(Dynamics.Integrator):
-  def __init__(self, universe, TDintegrator, **options):
+  def __init__(self, universe, TDintegrator, MDintegrator=None, **options):
+    """
+    TDintegrator is a CDHMCIntegrator for torsional dynamics.
+    MDintegrator is a Cartesian HMC integrator. If it is None,
+    the compiled HMCIntegrator is used if available.
+    """
     Dynamics.Integrator.__init__(self, universe, options)
     # Supported features: none for the moment, to keep it simple
     self.features = []
-  
+
     self.TDintegrator = TDintegrator
-  
+    if MDintegrator is None:
+      try:
+        from HMC import HMCIntegrator # @UnresolvedImport
+      except ImportError:
+        from AlGDock.Integrators.HamiltonianMonteCarlo.HamiltonianMonteCarlo \
+          import HamiltonianMonteCarloIntegrator as HMCIntegrator
+      MDintegrator = HMCIntegrator(universe)
+    self.MDintegrator = MDintegrator
+
+    # Statistics for each component from the last call
+    self.stats = {}
+
   def __call__(self, **options):
     """
     options include:
-    
-    steps, 
-    steps_per_trial, 
-    T, 
-    delta_t, 
-    random_seed, 
-    normalize=False, 
+
+    steps,
+    steps_per_trial,
+    T,
+    delta_t,
+    random_seed,
+    normalize=False,
     adapt=False
+
+    Each call runs one constrained dynamics trial, of 'CD_steps_per_trial'
+    steps with time step 'delta_t_TD' (in fs), for every Cartesian trial.
+    After the call, self.stats contains the acceptances, attempts,
+    and time for the constrained ('CD') and Cartesian ('MD') components.
     """
-  
+
     # Process the keyword arguments
     self.setCallOptions(options)
     # Check if the universe has features not supported by the integrator
@@ -45,124 +66,54 @@ class MixedHMCIntegrator(Dynamics.Integrator):
     steps = self.getOption('steps')
     delta_t = self.getOption('delta_t')
     T = self.getOption('T')
-    
-    RT = R*T
-    
+
     # Arguments with default values
     try:
-      steps_per_cycle = self.getOption('steps_per_trial')
-      ncycles = steps/steps_per_cycle
+      steps_per_trial = self.getOption('steps_per_trial')
+      ntrials = steps/steps_per_trial
     except ValueError:
-      steps_per_cycle = steps
-      ncycles = 1
+      steps_per_trial = steps
+      ntrials = 1
 
-    try:
-      fraction_CD = self.getOption('fraction_CD')
-    except ValueError:
-      fraction_CD = 0.5
-      
     try:
       CD_steps_per_trial = self.getOption('CD_steps_per_trial')
     except ValueError:
       CD_steps_per_trial = 5
-    
+
     try:
       delta_t_TD = self.getOption('delta_t_TD')
     except ValueError:
-      delta_t_TD = 4.0
-
-    # Allocate steps per cycle to TD and MD
-    CD_steps_per_cycle = int(fraction_CD*steps_per_cycle)
-    MD_steps_per_cycle = steps_per_cycle - CD_steps_per_cycle*CD_steps_per_trial
+      delta_t_TD = 3.0
 
     if 'random_seed' in self.call_options.keys():
       random_seed = self.getOption('random_seed')
-      np.random.seed(random_seed)
     else:
-      import time
-      random_seed = np.int(time.time()*1E3 + rand.rand()*1E3)
-    
+      random_seed = np.random.randint(32767)
+
     if 'normalize' in self.call_options.keys():
       normalize = self.getOption('normalize')
     else:
-      normalize = False          
-    
-    if self.universe.velocities() is None:
-      self.universe.initializeVelocitiesToTemperature(T)
-    
-    # Get the universe variables needed by the integrator
-    masses = self.universe.masses()
-    fixed = self.universe.getAtomBooleanArray('fixed')
-    nt = self.getOption('threads')
-    comm = self.getOption('mpi_communicator')
-    evaluator = self.universe.energyEvaluator(threads=nt,
-                                              mpi_communicator=comm)
-    evaluator = evaluator.CEvaluator()
-
-    late_args = (
-            masses.array, fixed.array, evaluator,
-            N.zeros((0, 2), N.Int), N.zeros((0, ), N.Float),
-            N.zeros((1,), N.Int),
-            N.zeros((0,), N.Float), N.zeros((2,), N.Float),
-            N.zeros((0,), N.Float), N.zeros((1,), N.Float),
-            delta_t, self.getOption('first_step'),
-            MD_steps_per_cycle, self.getActions(),
-            'Mixed Hamiltonian Monte Carlo step')
-
-    # Variables for velocity assignment
-    m3 = np.repeat(np.expand_dims(masses.array,1),3,axis=1)
-    sigma_MB = np.sqrt((self.getOption('T')*Units.k_B)/m3)
-    natoms = self.universe.numberOfAtoms()
-
-    xs = []
-    energies = []
-
-    CD_acc = 0
-    CD_ntrials = 0
-    MD_acc = 0
-    for t in range(ncycles):
-      # Do the constrained dynamics steps
-      (CD_xs_c, CD_energies_c, CD_acc_c, CD_ntrials_c, CD_dts) = \
-        self.TDintegrator.Call(CD_steps_per_cycle, CD_steps_per_trial, \
-          T, delta_t_TD/1000., (random_seed+t)%32767, 1, 1, 0.5)
-      xs.extend(CD_xs_c)
-      energies.extend(CD_energies_c)
-      CD_acc += CD_acc_c
-      CD_ntrials += CD_ntrials_c
-
-      # Store initial configuration and potential energy
-      xo = np.copy(self.universe.configuration().array)
-      pe_o = self.universe.energy()
-
-      # Initialize the velocity
-      v = self.universe.velocities()
-      v.array = np.multiply(sigma_MB,np.random.randn(natoms,3))
-
-      # Store total energy
-      eo = pe_o + 0.5*np.sum(np.multiply(m3,np.square(v.array)))
-
-      # Run the velocity verlet integrator
-      self.run(MMTK_dynamics.integrateVV,
-        (self.universe,
-         self.universe.configuration().array,
-         self.universe.velocities().array) + late_args)
-
-      # Decide whether to accept the move
-      pe_n = self.universe.energy()
-      en = pe_n + 0.5*np.sum(np.multiply(m3,np.square(v.array)))
-      
-      if ((en<eo) or (np.random.random()<N.exp(-(en-eo)/RT))) and \
-         ((abs(pe_o-pe_n)/RT<250.) or (abs(eo-en)/RT<250.)):
-        xo = np.copy(self.universe.configuration().array)
-        pe_o = pe_n
-        MD_acc += 1
-        if normalize:
-          self.universe.normalizePosition()
-      else:
-        self.universe.setConfiguration(Configuration(self.universe,xo))
-      
-      xs.append(np.copy(self.universe.configuration().array))
-      energies.append(pe_o)
-      
-    # print 'TD: %d/%d, MD: %d/%d'%(CD_acc,CD_ntrials,MD_acc,ncycles)
-    return (xs, energies, CD_acc + MD_acc, CD_ntrials + ncycles, delta_t)
+      normalize = False
+
+    # Constrained dynamics. The CDHMC integrator reads the configuration
+    # from the universe and writes the final configuration back to it.
+    time_start_CD = time.time()
+    (CD_xs, CD_energies, CD_acc, CD_ntrials, CD_dt) = \
+      self.TDintegrator.Call(ntrials*CD_steps_per_trial, CD_steps_per_trial, \
+        T, delta_t_TD/1000., random_seed%254, 1, 1, 0.5)
+    time_CD = time.time() - time_start_CD
+
+    # Cartesian HMC, starting from the constrained dynamics configuration
+    time_start_MD = time.time()
+    (MD_xs, MD_energies, MD_acc, MD_ntrials, MD_dt) = \
+      self.MDintegrator(steps=steps, steps_per_trial=steps_per_trial, \
+        T=T, delta_t=delta_t, normalize=normalize, random_seed=random_seed)
+    time_MD = time.time() - time_start_MD
+
+    self.stats = {'acc_CD':CD_acc, 'att_CD':CD_ntrials, 'time_CD':time_CD, \
+                  'acc_MD':MD_acc, 'att_MD':MD_ntrials, 'time_MD':time_MD}
+
+    # The constrained dynamics snapshots are Configuration objects
+    xs = [x.array for x in CD_xs] + MD_xs
+    energies = list(CD_energies) + list(MD_energies)
+    return (xs, energies, CD_acc + MD_acc, CD_ntrials + MD_ntrials, delta_t)
@@ -20,6 +20,18 @@ cdef extern from "stdlib.h":
     cdef void *malloc(size_t size)
     cdef void free(void *ptr)
 
+cdef extern from "string.h":
+
+    cdef void *memcpy(void *dest, void *src, size_t n)
+
+cdef extern from "math.h":
+
+    cdef double sqrt(double x)
+    cdef double log(double x)
+    cdef double exp(double x)
+    cdef double cos(double x)
+    cdef double fabs(double x)
+
 from MMTK.ParticleProperties import Configuration, ParticleVector
 
 include "MMTK/python.pxi"
@@ -31,6 +43,30 @@ include "MMTK/forcefield.pxi"
 
 R = 8.3144621*Units.J/Units.mol/Units.K
 
+include "../xorshift.pxi"
+
+# Statistics of a subtree
+cdef struct tree_stats:
+  int n # Number of valid points
+  int s # Whether the subtree may be extended
+  int steps # Number of integration steps
+  double alpha # Sum of acceptance probabilities
+  int nalpha # Number of acceptance probabilities
+
+# The U-turn criterion for a tree with edges
+# at (xminus, vminus) and (xplus, vplus)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+cdef inline int no_uturn(double *xminus, double *vminus, \
+    double *xplus, double *vplus, int N):
+  cdef double dminus = 0., dplus = 0., dx
+  cdef int i
+  for i in range(N):
+    dx = xplus[i] - xminus[i]
+    dminus += dx*vminus[i]
+    dplus += dx*vplus[i]
+  return (dminus>0) and (dplus>0)
+
 #
 # NUTS integrator
 #
@@ -52,11 +88,29 @@ cdef class NUTSIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerat
    - category "energy": potential and kinetic energy, plus
      extended-system energy terms if a thermostat and/or barostat
      are used
+
+  The tree is built in a workspace that is allocated once per call,
+  with a trailing edge and a proposal for every depth of the recursion,
+  so no Python objects are created while the tree is built.
+  Calling the integrator returns (xs, energies, acc, ntrajectories, delta_t),
+  where acc is the sum of the mean acceptance probabilities
+  of the trajectories.
   """
 
-  cdef np.ndarray x, v, g, m
+  cdef np.ndarray x, v, g, minv
+  cdef np.ndarray ws_edge, ws_trail, ws_prime, ws_eprime
+  cdef double *px
+  cdef double *pv
+  cdef double *pg
+  cdef double *pminv
+  cdef double *pws_trail
+  cdef double *pws_prime
+  cdef double *pws_eprime
+  cdef int N
+  cdef size_t nbytes
   cdef energy_data energy
   cdef double RT
+  cdef rng_t rng
 
   def __init__(self, universe, **options):
     """
@@ -150,24 +204,24 @@ cdef class NUTSIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerat
   cdef start(self):
 
     cdef double time, delta_t, ke
-    cdef int natoms, nsteps, elapsed_steps
+    cdef int natoms, nsteps, elapsed_steps, ntraj, levels, i, d
+
+    cdef double joint, logu, e_m, acc
+    cdef double *px_m
+    cdef double *pg_m
+    cdef double *pedge
+    cdef double e_edge[2]
+    cdef int j, n, steps_m, s
+    cdef tree_stats stats
+    cdef np.ndarray[double, ndim=2] x_m, g_m
+    cdef np.ndarray[double, ndim=1] sigma_MB
 
-    cdef double joint, logu, e_m
-    cdef np.ndarray[double, ndim=2] xminus, xplus, vminus, vplus, x_m
-    cdef int j, n, steps_m
-        
     # For dual averaging
-    cdef double alpha, delta, gamma, kappa, mu, delta_t_bar, Hbar, eta
-    cdef int nalpha, t0, m
-
-    # Initialize the velocity
-    if self.universe.velocities() is None:
-      self.universe.initializeVelocitiesToTemperature(self.getOption('T'))
+    cdef double delta, gamma, kappa, mu, delta_t_bar, Hbar, eta
+    cdef int t0, m
 
     # Gather state variables and parameters
     configuration = self.universe.configuration()
-    velocities = self.universe.velocities()
-    gradients = ParticleVector(self.universe)
     masses = self.universe.masses()
     delta_t = self.getOption('delta_t')
     nsteps = self.getOption('steps')
@@ -191,33 +245,56 @@ cdef class NUTSIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerat
       adapt = False
 
     # Parameters for the dual averaging algorithm.
+    gamma = 0.05
+    t0 = 10
+    kappa = 0.75
+    mu = log(10*delta_t)
+    Hbar = 0.
     if adapt:
-      gamma = 0.05
-      t0 = 10
-      kappa = 0.75
-      mu = np.log(10*delta_t)
-      # Initialize dual averaging algorithm.
       delta_t_bar = 1.
-      Hbar = 0.
     else:
       delta_t_bar = delta_t
 
     # Seed the random number generator
     if 'random_seed' in self.call_options.keys():
-      np.random.seed(self.getOption('random_seed'))
+      rng_seed(&self.rng, self.getOption('random_seed'))
     else:
-      np.random.seed()
+      rng_seed(&self.rng, np.random.randint(2**30))
 
     # For efficiency, the Cython code works at the array
     # level rather than at the ParticleProperty level.
-    self.x = configuration.array
-    self.v = velocities.array
-    self.g = gradients.array
-    self.m = np.repeat(np.expand_dims(masses.array,1),3,axis=1)
+    self.N = 3*natoms
+    self.nbytes = self.N*sizeof(double)
+    self.x = np.copy(configuration.array)
+    self.v = np.zeros((natoms,3))
+    self.g = np.zeros((natoms,3))
+    self.minv = np.repeat(np.expand_dims(1./masses.array,1),3,axis=1)
+    sigma_MB = np.ravel(np.sqrt((self.getOption('T')*Units.k_B)*self.minv))
+
+    # Preallocate the workspace for the tree.
+    # The depth of the tree is limited by the number of steps.
+    levels = int(np.log2(max(nsteps,1))) + 2
+    # Minus and plus edges of the tree: configuration, velocity, and gradient
+    self.ws_edge = np.zeros((2,3,natoms,3))
+    # Trailing edge of the subtree at every depth: configuration and velocity
+    self.ws_trail = np.zeros((levels,2,natoms,3))
+    # Proposal from the subtree at every depth: configuration and gradient
+    self.ws_prime = np.zeros((levels,2,natoms,3))
+    self.ws_eprime = np.zeros(levels)
+    x_m = np.zeros((natoms,3))
+    g_m = np.zeros((natoms,3))
+
+    self.px = <double *>self.x.data
+    self.pv = <double *>self.v.data
+    self.pg = <double *>self.g.data
+    self.pminv = <double *>self.minv.data
+    self.pws_trail = <double *>self.ws_trail.data
+    self.pws_prime = <double *>self.ws_prime.data
+    self.pws_eprime = <double *>self.ws_eprime.data
+    pedge = <double *>self.ws_edge.data
+    px_m = <double *>x_m.data
+    pg_m = <double *>g_m.data
 
-    # Weight matrix for velocity assignment
-    sigma_MB = np.sqrt((self.getOption('T')*Units.k_B)/self.m)
-    
     # Ask for energy gradients to be calculated and stored in
     # the array g. Force constants are not requested.
     self.energy.gradients = <void *>self.g
@@ -262,29 +339,36 @@ cdef class NUTSIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerat
     
     # Initialize the next sample.
     # If all else fails, the next sample is the previous sample.
-    x_m = np.copy(self.x)
+    memcpy(px_m, self.px, self.nbytes)
+    memcpy(pg_m, self.pg, self.nbytes)
     e_m = 1.*self.energy.energy
 
     # Main integration loop
+    time = 0.
+    acc = 0.
     elapsed_steps = 0
+    ntraj = 0
     m = 1
     while elapsed_steps < nsteps:
       # Resample velocities
-      self.v = np.multiply(sigma_MB,np.random.randn(natoms,3))
-      ke = 0.5*np.sum(np.multiply(self.m,np.square(self.v)))
+      ke = 0.
+      for i in range(self.N):
+        self.pv[i] = sigma_MB[i]*rng_gaussian(&self.rng)
+        ke += 0.5*self.pv[i]*self.pv[i]/self.pminv[i]
 
       # Joint log-probabiity of positions and velocities
       joint = -(e_m + ke)/self.RT
 
       # Resample u ~ uniform([0, np.exp(joint)]).
       # Equivalent to (log(u) - joint) ~ exponential(1).
-      logu = joint - np.random.exponential(1)
+      logu = joint + log(1.0-rng_uniform(&self.rng))
       
       # Initialize tree.
-      xminus = np.copy(x_m)
-      xplus = np.copy(x_m)
-      vminus = np.copy(self.v)
-      vplus = np.copy(self.v)
+      for d in range(2):
+        memcpy(pedge + (3*d)*self.N, px_m, self.nbytes)
+        memcpy(pedge + (3*d+1)*self.N, self.pv, self.nbytes)
+        memcpy(pedge + (3*d+2)*self.N, pg_m, self.nbytes)
+        e_edge[d] = e_m
 
       # Initial height j = 0.
       j = 0
@@ -294,50 +378,48 @@ cdef class NUTSIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerat
       steps_m = 0
 
       # Main loop
-      s = True
+      s = 1
       while (s==1):
         # Double the size of the tree
-        if np.random.rand()<0.5:
-          # Backwards
-          self.x = xminus
-          self.v = vminus
-          self.calculateEnergies(self.x, &self.energy, 0)
-          (xminus, vminus, NA0, NA1, 
-           xprime, eprime, nprime, sprime, steps_m,
-           alpha, nalpha) = \
-            self.build_tree(logu, j, -1*delta_t, steps_m, joint)
-        else:
-          # Forward
-          self.x = xplus
-          self.v = vplus
-          self.calculateEnergies(self.x, &self.energy, 0)
-          (NA0, NA1, xplus, vplus, 
-           xprime, eprime, nprime, sprime, steps_m,
-           alpha, nalpha) = \
-            self.build_tree(logu, j, delta_t, steps_m, joint)
+        # Backwards if d is 0, forward if d is 1
+        d = 0 if rng_uniform(&self.rng)<0.5 else 1
+        memcpy(self.px, pedge + (3*d)*self.N, self.nbytes)
+        memcpy(self.pv, pedge + (3*d+1)*self.N, self.nbytes)
+        memcpy(self.pg, pedge + (3*d+2)*self.N, self.nbytes)
+        self.energy.energy = e_edge[d]
+        stats = self.build_tree(logu, j, (2*d-1)*delta_t, joint)
+        memcpy(pedge + (3*d)*self.N, self.px, self.nbytes)
+        memcpy(pedge + (3*d+1)*self.N, self.pv, self.nbytes)
+        memcpy(pedge + (3*d+2)*self.N, self.pg, self.nbytes)
+        e_edge[d] = self.energy.energy
+        steps_m += stats.steps
         # Use Metropolis-Hastings to decide whether or not to move to a
         # point from the half-tree we just generated
-        if (sprime and (np.random.rand() < float(nprime)/n)):
-          x_m = xprime
-          e_m = eprime
+        if (stats.s and (rng_uniform(&self.rng) < float(stats.n)/n)):
+          memcpy(px_m, self.pws_prime + (2*j)*self.N, self.nbytes)
+          memcpy(pg_m, self.pws_prime + (2*j+1)*self.N, self.nbytes)
+          e_m = self.pws_eprime[j]
         # Update number of valid points we've seen.
-        n += nprime
+        n += stats.n
         # Increment depth
         j += 1
         # Decide if it's time to stop
-        s = sprime and \
-            self.stop_criterion(xminus, xplus, vminus, vplus) and \
-            ((elapsed_steps + steps_m*2) < nsteps)
+        s = stats.s and \
+            no_uturn(pedge, pedge + self.N, \
+              pedge + 3*self.N, pedge + 4*self.N, self.N) and \
+            ((elapsed_steps + steps_m*2) < nsteps) and (j < levels)
 
       # Keep track of acceptance statistics
+      acc += stats.alpha/stats.nalpha
+      ntraj += 1
       eta = 1./(m+t0)
-      Hbar = (1-eta)*Hbar + eta*(delta-alpha/nalpha)
+      Hbar = (1-eta)*Hbar + eta*(delta-stats.alpha/stats.nalpha)
 
       # Adapt the time step
       if adapt:
-        delta_t = np.exp(mu - np.sqrt(m)/gamma*Hbar)
+        delta_t = exp(mu - sqrt(m)/gamma*Hbar)
         eta = m**-kappa
-        delta_t_bar = np.exp((1-eta)*np.log(delta_t_bar) + eta*np.log(delta_t))
+        delta_t_bar = exp((1-eta)*log(delta_t_bar) + eta*log(delta_t))
 
       xs.append(np.copy(x_m))
       energies.append(1.*e_m)
@@ -358,89 +440,99 @@ cdef class NUTSIntegrator(MMTK_trajectory_generator.EnergyBasedTrajectoryGenerat
     # Finalize all trajectory actions (close files etc.)
     self.finalizeTrajectoryActions(nsteps)
     
-    return (xs, energies, Hbar*nsteps, nsteps, delta_t_bar)
+    return (xs, energies, acc, ntraj, delta_t_bar)
 
-  # The main recursion
-  # Cython compiler directives set for efficiency:
-  # - No bound checks on index operations
-  # - No support for negative indices
-  # - Division uses C semantics
+  # A single leapfrog step from the current point
   @cython.boundscheck(False)
   @cython.wraparound(False)
   @cython.cdivision(True)
-  cdef build_tree(NUTSIntegrator self, double logu, int j, double delta_t, int steps, double joint_o):
-    cdef double ke, joint, e_o, eprime, eprime2
-    cdef np.ndarray[double, ndim=2] xminus, xplus, vminus, vplus, xprime, xprime2, NA0, NA1
-    
-    cdef double alphaprime, alphaprime2
-    cdef int nalphaprime, nalphaprime2
+  cdef void leapfrog(NUTSIntegrator self, double delta_t):
+    cdef int i
+    # First half-step
+    for i in range(self.N):
+      self.pv[i] -= 0.5*delta_t*self.pg[i]*self.pminv[i]
+      self.px[i] += delta_t*self.pv[i]
+    # Mid-step energy calculation
+    self.foldCoordinatesIntoBox()
+    self.calculateEnergies(self.x, &self.energy, 1)
+    # Second half-step
+    for i in range(self.N):
+      self.pv[i] -= 0.5*delta_t*self.pg[i]*self.pminv[i]
+
+  # The main recursion.
+  # The tree is extended from the current point in the direction of delta_t.
+  # The trailing edge and proposal of the subtree of depth j
+  # are stored in the workspace at depth j
+  # and the leading edge is the current point.
+  @cython.boundscheck(False)
+  @cython.wraparound(False)
+  @cython.cdivision(True)
+  cdef tree_stats build_tree(NUTSIntegrator self, double logu, int j, \
+      double delta_t, double joint_o):
+    cdef tree_stats a, b
+    cdef double ke, joint, e_o, eprime
+    cdef int i
+    cdef double *trail_x = self.pws_trail + (2*j)*self.N
+    cdef double *trail_v = self.pws_trail + (2*j+1)*self.N
+    cdef double *prime_x = self.pws_prime + (2*j)*self.N
+    cdef double *prime_g = self.pws_prime + (2*j+1)*self.N
 
     if (j==0):
       # Base case: Take a single leapfrog step
-      # First half-step
-      e_o = 1.*self.energy.energy      
-      self.v += -0.5*delta_t*np.divide(self.g,self.m)
-      self.x += delta_t*self.v      
-      # Mid-step energy calculation
-      self.foldCoordinatesIntoBox()
-      self.calculateEnergies(self.x, &self.energy, 1)
-      # Second half-step
-      self.v += -0.5*delta_t*np.divide(self.g,self.m)
-      ke = 0.5*np.sum(np.multiply(self.m,np.square(self.v)))
-      steps += 1
-
-      eprime = 1.*self.energy.energy
+      e_o = self.energy.energy
+      self.leapfrog(delta_t)
+      ke = 0.
+      for i in range(self.N):
+        ke += 0.5*self.pv[i]*self.pv[i]/self.pminv[i]
+
+      eprime = self.energy.energy
       joint = -(eprime+ke)/self.RT
       # Is the new point in the slice?
-      nprime = (logu < joint)
+      a.n = (logu < joint)
       # Is the simulation wildly inaccurate
-      sprime = (np.abs(joint_o - joint) < 200.) and (np.abs((e_o - eprime)/self.RT) < 200.)
+      a.s = (fabs(joint_o - joint) < 200.) and (fabs((e_o - eprime)/self.RT) < 200.)
       # Compute the acceptance probability
-      alphaprime = min(1, np.exp(joint - joint_o)) if sprime else 0.
-      # Set the return values---minus=plus for all things here, since the
-      # "tree" is of depth 0.
-      return (np.copy(self.x), np.copy(self.v),
-              np.copy(self.x), np.copy(self.v), 
-              np.copy(self.x),
-              eprime, nprime, sprime, steps,
-              alphaprime, 1)
+      if a.s:
+        a.alpha = 1. if joint>joint_o else exp(joint - joint_o)
+      else:
+        a.alpha = 0.
+      a.nalpha = 1
+      a.steps = 1
+      # The trailing edge and proposal are the new point,
+      # since the "tree" is of depth 0.
+      memcpy(trail_x, self.px, self.nbytes)
+      memcpy(trail_v, self.pv, self.nbytes)
+      memcpy(prime_x, self.px, self.nbytes)
+      memcpy(prime_g, self.pg, self.nbytes)
+      self.pws_eprime[0] = eprime
+      return a
     else:
-      (xminus, vminus, xplus, vplus, 
-       xprime, eprime, nprime, sprime, steps,
-       alphaprime, nalphaprime) = \
-        self.build_tree(logu, j-1, delta_t, steps, joint_o)
+      a = self.build_tree(logu, j-1, delta_t, joint_o)
+      # The first subtree has the trailing edge
+      # and is the initial source of the proposal
+      memcpy(trail_x, trail_x - 2*self.N, self.nbytes)
+      memcpy(trail_v, trail_v - 2*self.N, self.nbytes)
+      memcpy(prime_x, prime_x - 2*self.N, self.nbytes)
+      memcpy(prime_g, prime_g - 2*self.N, self.nbytes)
+      self.pws_eprime[j] = self.pws_eprime[j-1]
       # No need to keep going if the stopping criteria were met in the first
       # subtree.
-      if sprime:
-        if (delta_t < 0):
-          (xminus, vminus, NA0, NA1, 
-           xprime2, eprime2, nprime2, sprime2, steps,
-           alphaprime2, nalphaprime2) = \
-              self.build_tree(logu, j-1, delta_t, steps, joint_o)
-        else:
-          (NA0, NA1, xplus, vplus, 
-           xprime2, eprime2, nprime2, sprime2, steps,
-           alphaprime2, nalphaprime2) = \
-              self.build_tree(logu, j-1, delta_t, steps, joint_o)
+      if a.s:
+        b = self.build_tree(logu, j-1, delta_t, joint_o)
         # Choose which subtree to propagate a sample up from.
-        if ((nprime + nprime2) > 0) and \
-           (np.random.rand() < float(nprime2) / (nprime + nprime2)):
-            xprime = xprime2
-            eprime = eprime2
+        if ((a.n + b.n) > 0) and (rng_uniform(&self.rng) < float(b.n) / (a.n + b.n)):
+          memcpy(prime_x, prime_x - 2*self.N, self.nbytes)
+          memcpy(prime_g, prime_g - 2*self.N, self.nbytes)
+          self.pws_eprime[j] = self.pws_eprime[j-1]
         # Update the number of valid points.
-        nprime = nprime + nprime2
+        a.n += b.n
         # Update the stopping criterion.
-        sprime = sprime and sprime2 and \
-          self.stop_criterion(xminus, xplus, vminus, vplus)
+        if delta_t > 0:
+          a.s = b.s and no_uturn(trail_x, trail_v, self.px, self.pv, self.N)
+        else:
+          a.s = b.s and no_uturn(self.px, self.pv, trail_x, trail_v, self.N)
         # Update the acceptance probability statistics
-        alphaprime = alphaprime + alphaprime2
-        nalphaprime = nalphaprime + nalphaprime2
-      return (xminus, vminus, xplus, vplus, xprime,
-              eprime, nprime, sprime, steps,
-              alphaprime, nalphaprime)
-
-  def stop_criterion(NUTSIntegrator self, xminus, xplus, vminus, vplus):
-    cdef np.ndarray[double] thetavec
-    thetavec = np.ravel(xplus-xminus)
-    return (np.dot(thetavec,np.ravel(vminus))>0) and \
-           (np.dot(thetavec,np.ravel(vplus))>0)
\ No newline at end of file
+        a.alpha += b.alpha
+        a.nalpha += b.nalpha
+        a.steps += b.steps
+      return a
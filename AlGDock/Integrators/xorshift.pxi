@@ -0,0 +1,36 @@
+# Pseudorandom numbers shared by the Cython integrators.
+# The including file must declare sqrt, log, and cos from math.h.
+
+cdef double TWO_PI = 6.283185307179586
+
+# State of a xorshift64* generator with a spare normal deviate
+cdef struct rng_t:
+  unsigned long long state
+  int has_spare
+  double spare
+
+cdef inline void rng_seed(rng_t *rng, unsigned long long seed):
+  # The state must be nonzero
+  rng.state = 2*seed + 1
+  rng.has_spare = 0
+
+# Uniform deviates in [0, 1) from the xorshift64* generator
+@cython.cdivision(True)
+cdef inline double rng_uniform(rng_t *rng):
+  rng.state ^= rng.state >> 12
+  rng.state ^= rng.state << 25
+  rng.state ^= rng.state >> 27
+  return ((rng.state*2685821657736338717ULL) >> 11) * \
+    (1.0/9007199254740992.0)
+
+# Standard normal deviates from the Box-Muller transform
+cdef inline double rng_gaussian(rng_t *rng):
+  cdef double r, theta
+  if rng.has_spare:
+    rng.has_spare = 0
+    return rng.spare
+  r = sqrt(-2.0*log(1.0-rng_uniform(rng)))
+  theta = TWO_PI*rng_uniform(rng)
+  rng.spare = r*cos(theta - 0.25*TWO_PI)
+  rng.has_spare = 1
+  return r*cos(theta)
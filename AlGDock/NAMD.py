@@ -785,6 +785,120 @@ coorfile close
         keepScript=keepScript, retry=False)
     return energies
 
+  def start_energy_server(self, outputname, energyFields=[12], \
+      keepScript=False):
+    """
+    Starts a NAMD instance that stays open to calculate potential energies
+    in a series of dcd files, so the structure and parameters are only
+    loaded once.
+    
+    dcd file names are sent through a named pipe, outputname.fifo,
+    which is read by a Tcl loop in the NAMD configuration script.
+    
+    outputname - the prefix for NAMD output
+    energyFields - the NAMD energy fields to keep [Default 12, total potential energy]
+    """
+    import subprocess
+    
+    outputname = os.path.abspath(outputname)
+    fifoname = outputname+'.fifo'
+    if os.path.exists(fifoname):
+      os.remove(fifoname)
+    os.mkfifo(fifoname)
+    # Opening for reading and writing does not block until NAMD opens the pipe
+    requests = os.fdopen(os.open(fifoname, os.O_RDWR), 'w')
+
+    (integrator_script,output_script,execution_script) = \
+      self._energy_scripts('')
+    execution_script = '''
+set ts 0
+set requests [open {'''+fifoname+'''} r]
+while { [gets $requests dcdname] >= 0 } {
+  if { $dcdname == "STOP" } { break }
+  coorfile open dcd $dcdname
+  while { ![coorfile read] } {
+    firstTimestep $ts
+    run 0
+    incr ts 1
+  }
+  coorfile close
+  print "ALGDOCK DONE $dcdname"
+}
+close $requests
+'''
+    self._writeConfiguration(outputname, 0.0,
+      integrator_script, output_script, execution_script)
+
+    proc = subprocess.Popen(\
+      [self.namd_command,'+p','%d'%self.NPROCS,outputname+'.namd'], \
+      stdout=subprocess.PIPE, cwd=os.path.dirname(outputname))
+    self._server = {'outputname':outputname, 'fifoname':fifoname, \
+      'requests':requests, 'proc':proc, 'energyFields':energyFields, \
+      'keepScript':keepScript, 'outF':open(outputname+'.out','w')}
+
+  def energy_server_running(self):
+    """
+    Returns True if a NAMD energy server is running
+    """
+    return (getattr(self,'_server',None) is not None) and \
+      (self._server['proc'].poll() is None)
+
+  def energies_PE_server(self, dcdname):
+    """
+    Calculates potential energies in a dcd file with the NAMD energy server.
+    Returns a list of energies with the fields passed to start_energy_server.
+    """
+    if not self.energy_server_running():
+      raise Exception('NAMD energy server is not running')
+    server = self._server
+    server['requests'].write(os.path.abspath(dcdname)+'\n')
+    server['requests'].flush()
+
+    energies = []
+    for line in iter(server['proc'].stdout.readline,''):
+      server['outF'].write(line)
+      # Store energy output
+      if line.find('ENERGY:')==0:
+        ENERGY = line[9:].split()
+        energies.append(\
+          [float(ENERGY[energyField]) for energyField in server['energyFields']])
+      elif line.find('ERROR:')>-1:
+        print line
+        self.stop_energy_server()
+        raise Exception('Error in NAMD')
+      elif line.find('ALGDOCK DONE')>-1:
+        return energies
+    self.stop_energy_server()
+    raise Exception('NAMD energy server ended unexpectedly')
+
+  def stop_energy_server(self):
+    """
+    Closes the NAMD energy server and cleans up its files
+    """
+    if getattr(self,'_server',None) is None:
+      return
+    server = self._server
+    self._server = None
+    if server['proc'].poll() is None:
+      try:
+        server['requests'].write('STOP\n')
+        server['requests'].flush()
+      except IOError:
+        pass
+    server['requests'].close()
+    for line in iter(server['proc'].stdout.readline,''):
+      server['outF'].write(line)
+    server['proc'].wait()
+    server['outF'].close()
+
+    outputname = server['outputname']
+    os.remove(server['fifoname'])
+    if not server['keepScript']:
+      self._removeFile(outputname+'.namd')
+    self._removeFile(outputname+'.out')
+    for ext in ['.coor','.vel','.xsc']:
+      self._removeFile(outputname+ext)
+
   def energies_LJ_ELE_INT(self, outputname, dcdname=None, keepScript=False):
     """
     Calculates Lennard-Jones and electrostatic interaction energies with a grid, and ligand internal energy
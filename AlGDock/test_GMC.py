@@ -0,0 +1,96 @@
+# Checks that attempting all the crossover candidates for a list of
+# independent state pairs together gives the same acceptance statistics
+# as attempting them one at a time
+
+import copy
+import random
+import numpy as np
+
+from AlGDock.GMC import attempt_crossovers
+
+K = 12
+nBAT = 30
+torsion_inds = range(24, 30)
+BAT_to_crossover = [[t] for t in torsion_inds] + \
+  [list(pair) for pair in zip(torsion_inds[::2], torsion_inds[1::2])]
+beta = np.linspace(0.5, 5.0, K)
+
+def reduced_energy(BAT, s_ind):
+  return beta[s_ind]*(np.sum(np.cos(BAT[24:])) + 0.1*np.sum(BAT[:24]**2))
+
+def serial_crossovers(confs, BATs, energies, inv_state_inds, \
+    state_indices_to_swap, torsion_threshold, nr_attempts):
+  # One candidate at a time, as in the original implementation
+  attempt_count, acc_count = 0, 0
+  sweep_count = 0
+  while True:
+    sweep_count += 1
+    if (sweep_count * K) > (1000 * nr_attempts):
+      return attempt_count, acc_count
+    for state_pair in state_indices_to_swap:
+      c0 = inv_state_inds[state_pair[0]]
+      c1 = inv_state_inds[state_pair[1]]
+      torsions = BAT_to_crossover[random.randrange(len(BAT_to_crossover))]
+      if np.any(np.abs(BATs[c0][torsions] - BATs[c1][torsions]) \
+          >= torsion_threshold):
+        attempt_count += 1
+        BAT_k0_af = copy.deepcopy(BATs[c0])
+        BAT_k1_af = copy.deepcopy(BATs[c1])
+        for index in torsions:
+          tmp = BAT_k0_af[index]
+          BAT_k0_af[index] = BAT_k1_af[index]
+          BAT_k1_af[index] = tmp
+        e_k0_af = reduced_energy(BAT_k0_af, state_pair[0])
+        e_k1_af = reduced_energy(BAT_k1_af, state_pair[1])
+        de = (energies[c0] - e_k0_af) + (energies[c1] - e_k1_af)
+        if (de > 0) or (np.random.uniform() < np.exp(de)):
+          acc_count += 1
+          confs[c0] = BAT_k0_af
+          confs[c1] = BAT_k1_af
+          energies[c0] = e_k0_af
+          energies[c1] = e_k1_af
+          BATs[c0] = BAT_k0_af
+          BATs[c1] = BAT_k1_af
+        if attempt_count == nr_attempts:
+          return attempt_count, acc_count
+
+def evaluate(tasks):
+  return [(BAT, reduced_energy(BAT, s_ind)) for (BAT, s_ind) in tasks]
+
+state_indices = range(K)
+state_pairs_to_swap = [zip(state_indices[0::2], state_indices[1::2]), \
+                       zip(state_indices[1::2], state_indices[2::2])]
+state_indices_to_swap = state_pairs_to_swap[0] + state_pairs_to_swap[1]
+
+for (seed, torsion_threshold, nr_attempts) in \
+    [(1, 0.0, 25), (2, 0.5, 60), (3, 2.0, 37), (4, 5.0, 10)]:
+  np.random.seed(seed)
+  BATs_0 = np.random.uniform(-np.pi, np.pi, size=(K, nBAT))
+  state_inds = list(np.random.permutation(K))
+  inv_state_inds = [state_inds.index(s) for s in range(K)]
+  energies_0 = np.array([reduced_energy(BATs_0[c], state_inds[c]) \
+    for c in range(K)])
+
+  out = []
+  for method in ['serial', 'batch']:
+    random.seed(seed)
+    np.random.seed(seed)
+    BATs = np.copy(BATs_0)
+    energies = np.copy(energies_0)
+    confs = [BAT for BAT in BATs_0]
+    if method == 'serial':
+      counts = serial_crossovers(confs, list(BATs), energies, \
+        inv_state_inds, state_indices_to_swap, torsion_threshold, nr_attempts)
+    else:
+      counts = attempt_crossovers(confs, BATs, energies, inv_state_inds, \
+        state_pairs_to_swap, BAT_to_crossover, torsion_threshold, \
+        nr_attempts, evaluate)
+    out.append((counts, np.array(confs), energies))
+    print '%6s threshold %.1f: %d/%d accepted'%(\
+      method, torsion_threshold, counts[1], counts[0])
+
+  assert out[0][0] == out[1][0]
+  assert np.allclose(out[0][1], out[1][1])
+  assert np.allclose(out[0][2], out[1][2])
+
+print 'Acceptance statistics are unchanged'
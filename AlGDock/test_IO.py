@@ -0,0 +1,52 @@
+# Checks that frames appended to a DCD file are read back
+# after the frames that were already in the file
+
+import os, struct, tempfile, shutil
+import numpy as np
+
+from AlGDock.IO import dcd
+
+def read_dcd(FN):
+  # Returns (the number of frames in the header, an array of frames)
+  F = open(FN,'rb')
+  nset = struct.unpack('i4si',F.read(12))[2]
+  F.seek(4 + 84 + 4)
+  title_length = struct.unpack('i',F.read(4))[0]
+  F.seek(title_length + 4 + 4, os.SEEK_CUR)
+  n_atoms = struct.unpack('i',F.read(4))[0]
+  F.seek(4, os.SEEK_CUR)
+  records = np.fromstring(F.read(), dtype=np.float32)
+  F.close()
+  records = records.reshape((-1, 3, n_atoms+2))[:,:,1:-1]
+  return (nset, records.transpose((0,2,1)))
+
+class Molecule:
+  def __init__(self, n_atoms):
+    self.atoms = range(n_atoms)
+
+n_atoms = 7
+confs = [np.random.rand(n_atoms,3) for n in range(5)]
+test_dir = tempfile.mkdtemp()
+FN = os.path.join(test_dir,'test.dcd')
+
+IO_dcd = dcd(Molecule(n_atoms))
+IO_dcd.write(FN, confs[:3])
+IO_dcd.write(FN, confs[3:], append=True)
+
+(nset, frames) = read_dcd(FN)
+assert nset==len(confs)
+assert frames.shape==(len(confs), n_atoms, 3)
+assert np.allclose(frames, 10.0*np.array(confs), atol=1e-5)
+
+# Appending frames with a different number of atoms is an error
+raised = False
+try:
+  dcd(Molecule(n_atoms+1)).write(FN, [np.random.rand(n_atoms+1,3)], \
+    append=True)
+except Exception as e:
+  raised = (str(e).find('atoms')>-1)
+assert raised
+assert read_dcd(FN)[0]==len(confs)
+print 'DCD append test passed'
+
+shutil.rmtree(test_dir)
@@ -0,0 +1,100 @@
+# Tests the NAMD energy server with a mock NAMD executable,
+# which reports one ENERGY line per frame in each dcd file.
+# The energies depend on the frame and on the first timestep
+# in the dcd header, so they are the same with or without the server.
+
+import os, struct, tempfile, shutil
+import numpy as np
+
+from NAMD import NAMD
+
+mock_namd = '''#!/usr/bin/env python
+import sys, struct
+
+def header(dcdname):
+  F = open(dcdname,'rb')
+  (nset, istart) = struct.unpack('i4sii',F.read(16))[2:]
+  F.close()
+  return (nset, istart)
+
+def energies(dcdname, ts):
+  (nset, istart) = header(dcdname)
+  for n in range(nset):
+    print('ENERGY:  %7d'%ts + \
+      ''.join(['%14.4f'%(istart+n+0.1*f) for f in range(15)]))
+    ts += 1
+  return ts
+
+conf = open(sys.argv[-1]).read()
+ts = 0
+if conf.find('set requests [open {')>-1:
+  fifoname = conf[conf.find('set requests [open {')+20:]
+  fifoname = fifoname[:fifoname.find('}')]
+  requests = open(fifoname,'r')
+  for dcdname in iter(requests.readline,''):
+    dcdname = dcdname.strip()
+    if dcdname=='STOP':
+      break
+    ts = energies(dcdname, ts)
+    print('ALGDOCK DONE '+dcdname)
+    sys.stdout.flush()
+elif conf.find('coorfile open dcd {')>-1:
+  dcdname = conf[conf.find('coorfile open dcd {')+19:]
+  ts = energies(dcdname[:dcdname.find('}')], ts)
+open(conf[conf.find('set outputname')+15:].split()[0]+'.coor','w').close()
+'''
+
+def write_dcd(FN, nframes, istart=1):
+  F = open(FN,'wb')
+  F.write(struct.pack('i4s9if10ii', 84, 'CORD', nframes, \
+    *([istart,1] + [0]*6 + [0.] + [0]*10 + [84])))
+  F.close()
+
+test_dir = tempfile.mkdtemp()
+namd_FN = os.path.join(test_dir,'namd2')
+F = open(namd_FN,'w')
+F.write(mock_namd)
+F.close()
+os.chmod(namd_FN, 0755)
+
+for FN in ['test.prmtop','test.inpcrd']:
+  open(os.path.join(test_dir,FN),'w').close()
+chunks = [3,1,4]
+for (c,nframes) in enumerate(chunks):
+  write_dcd(os.path.join(test_dir,'chunk%d.dcd'%c), nframes, 100*(c+1))
+
+energyFields = [1, 2, 3, 4, 5, 6, 8, 12]
+energyCalc = NAMD(namd_command=namd_FN, \
+  prmtop=os.path.join(test_dir,'test.prmtop'), \
+  inpcrd=os.path.join(test_dir,'test.inpcrd'))
+
+# Energies from separate NAMD instances
+E_separate = []
+for c in range(len(chunks)):
+  E_separate.append(energyCalc.energies_PE(\
+    os.path.join(test_dir,'separate%d'%c), \
+    os.path.join(test_dir,'chunk%d.dcd'%c), \
+    energyFields=energyFields, write_energy_pkl_gz=False))
+
+# Energies from a single NAMD instance
+energyCalc.start_energy_server(os.path.join(test_dir,'server'), \
+  energyFields=energyFields)
+E_server = []
+for c in range(len(chunks)):
+  E_server.append(energyCalc.energies_PE_server(\
+    os.path.join(test_dir,'chunk%d.dcd'%c)))
+energyCalc.stop_energy_server()
+
+for c in range(len(chunks)):
+  print 'chunk %d: %d frames'%(c, len(E_server[c]))
+  assert len(E_server[c])==chunks[c]
+  assert np.array(E_separate[c]).shape==np.array(E_server[c]).shape
+  assert np.allclose(E_separate[c], E_server[c])
+  # Chunks should not be mixed up
+  assert np.allclose(np.array(E_server[c])[:,0], \
+    100*(c+1) + np.arange(chunks[c]) + 0.1*(energyFields[0]-1))
+assert not energyCalc.energy_server_running()
+assert not os.path.exists(os.path.join(test_dir,'server.fifo'))
+print 'NAMD energy server test passed'
+
+shutil.rmtree(test_dir)
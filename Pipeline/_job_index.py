@@ -0,0 +1,213 @@
+# A persistent index of job states and file checks, stored in SQLite.
+#
+# Results of expensive checks (directory listings, tarball contents,
+# cycles completed in f_RL.pkl.gz) are stored with the modification time
+# and size of the file they came from and are only recomputed
+# when these change.
+# The state of every job from the latest scan is also stored,
+# so that the jobs that still need to run can be listed without a scan.
+# Rows are stamped with the scan that wrote them. A scan only replaces
+# the rows of the jobs that it reaches. When a scan reaches every job,
+# rows from earlier scans, e.g. for jobs that were removed, are deleted.
+
+import os, time, json
+import sqlite3
+
+class JobIndex:
+  def __init__(self, FN):
+    """
+    Opens or creates the index in the SQLite file FN
+    """
+    self.FN = os.path.abspath(FN)
+    self.db = sqlite3.connect(self.FN)
+    self.db.executescript("""
+      CREATE TABLE IF NOT EXISTS checks (
+        path TEXT, kind TEXT, mtime REAL, size INTEGER, value TEXT,
+        PRIMARY KEY (path, kind));
+      CREATE TABLE IF NOT EXISTS jobs (
+        jobname TEXT PRIMARY KEY, ligand TEXT, receptor TEXT, rep INTEGER,
+        run_type TEXT, status TEXT, directory TEXT, updated REAL,
+        scan INTEGER);
+      CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+      CREATE INDEX IF NOT EXISTS jobs_ligand ON jobs (ligand);
+      CREATE TABLE IF NOT EXISTS scans (
+        scan INTEGER PRIMARY KEY AUTOINCREMENT, started REAL);
+      CREATE TABLE IF NOT EXISTS queue (
+        jobname TEXT PRIMARY KEY, command TEXT, directory TEXT,
+        submitted REAL);
+      """)
+    # Indices from earlier versions do not have scan stamps
+    columns = [row[1] for row in \
+      self.db.execute('PRAGMA table_info(jobs)').fetchall()]
+    if not 'scan' in columns:
+      self.db.execute('ALTER TABLE jobs ADD COLUMN scan INTEGER')
+    self.scan = None
+
+  def cached(self, path, kind, compute):
+    """
+    Returns compute(), a JSON-serializable function of the file at path.
+    The value is stored and reused until the modification time or size
+    of the file change.
+    """
+    stat = os.stat(path)
+    row = self.db.execute(\
+      'SELECT mtime, size, value FROM checks WHERE path=? AND kind=?', \
+      (path, kind)).fetchone()
+    if (row is not None) and (row[0]==stat.st_mtime) and \
+        (row[1]==stat.st_size):
+      return json.loads(row[2])
+    value = compute()
+    self.db.execute('INSERT OR REPLACE INTO checks VALUES (?,?,?,?,?)', \
+      (path, kind, stat.st_mtime, stat.st_size, json.dumps(value)))
+    return value
+
+  def listdir(self, path):
+    """
+    Names of subdirectories and files in the directory path.
+    Adding or removing an entry changes the directory modification time.
+    """
+    # JSON decodes strings as unicode
+    return [str(name) for name in \
+      self.cached(path, 'listdir', lambda : sorted(os.listdir(path)))]
+
+  def glob(self, path, pattern):
+    """
+    Files matching os.path.join(path, *pattern),
+    where each element of pattern is a directory level
+    (e.g. ['*','*.tar.gz']).
+    """
+    import fnmatch
+    matches = [path]
+    for level in pattern:
+      matches = [os.path.join(dirN, name) \
+        for dirN in matches if os.path.isdir(dirN) \
+          for name in fnmatch.filter(self.listdir(dirN), level)]
+    return sorted(matches)
+
+  def tar_names(self, FN):
+    """
+    Names of the members of a tarball
+    """
+    def compute():
+      import tarfile
+      tarF = tarfile.open(FN)
+      names = [m.name for m in tarF.getmembers()]
+      tarF.close()
+      return names
+    return [str(name) for name in self.cached(FN, 'tar_names', compute)]
+
+  def completed_cycles(self, FN, phases):
+    """
+    The smallest number of MBAR estimates for the phases in f_RL.pkl.gz.
+    None if the file cannot be read.
+    """
+    def compute():
+      import gzip, pickle
+      try:
+        F = gzip.open(FN,'r')
+        dat = pickle.load(F)
+        F.close()
+        return dict([(p, len(dat[-1][p+'_MBAR'])) for p in phases])
+      except:
+        return None
+    cycles = self.cached(FN, 'completed_cycles-'+'-'.join(phases), compute)
+    if cycles is None:
+      return None
+    return min([cycles[p] for p in phases])
+
+  def begin_scan(self):
+    """
+    Starts a scan. Jobs set afterwards are stamped with its id.
+    """
+    self.scan = self.db.execute('INSERT INTO scans (started) VALUES (?)', \
+      (time.time(),)).lastrowid
+    self.commit()
+    return self.scan
+
+  def finish_scan(self, complete):
+    """
+    Ends a scan. If complete, the scan reached every job,
+    so jobs that it did not set no longer exist and are removed.
+    """
+    if complete:
+      self.db.execute('DELETE FROM jobs WHERE (scan IS NULL) OR (scan!=?)', \
+        (self.scan,))
+    self.scan = None
+    self.commit()
+
+  def set_job(self, jobname, status, ligand=None, receptor=None, rep=None, \
+      run_type=None, directory=None):
+    if self.scan is None:
+      raise Exception('Jobs can only be set during a scan')
+    self.db.execute(\
+      'INSERT OR REPLACE INTO jobs VALUES (?,?,?,?,?,?,?,?,?)', \
+      (jobname, ligand, receptor, rep, run_type, status, directory, \
+       time.time(), self.scan))
+
+  def jobs(self, status=None, exclude_status=None):
+    """
+    Returns a list of (jobname, status, directory), with the status from
+    the latest scan that reached each job.
+    The jobs may be limited to a list of statuses or exclude a list.
+    """
+    query = 'SELECT jobname, status, directory FROM jobs'
+    values = []
+    if status is not None:
+      query += ' WHERE status IN (%s)'%','.join(['?']*len(status))
+      values = list(status)
+    elif exclude_status is not None:
+      query += ' WHERE status NOT IN (%s)'%','.join(['?']*len(exclude_status))
+      values = list(exclude_status)
+    return self.db.execute(query + ' ORDER BY jobname', values).fetchall()
+
+  def status_counts(self):
+    return dict(self.db.execute(\
+      'SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+
+  def commit(self):
+    self.db.commit()
+
+  def close(self):
+    self.db.commit()
+    self.db.close()
+
+class FakeScheduler:
+  """
+  A local job queue for testing job management without a cluster.
+  Jobs are stored in the queue table of a JobIndex.
+  """
+  def __init__(self, index):
+    self.index = index
+
+  def submit(self, jobname, command, directory):
+    self.index.db.execute('INSERT OR REPLACE INTO queue VALUES (?,?,?,?)', \
+      (jobname, command, directory, time.time()))
+    self.index.commit()
+
+  def jobs_on_queue(self):
+    return [row[0] for row in \
+      self.index.db.execute('SELECT jobname FROM queue').fetchall()]
+
+  def remove(self, jobname):
+    self.index.db.execute('DELETE FROM queue WHERE jobname=?', (jobname,))
+    self.index.commit()
+
+  def run(self, max_jobs=None):
+    """
+    Runs queued jobs locally, in order of submission,
+    and removes them from the queue.
+    Returns a list of (jobname, exit status).
+    """
+    query = 'SELECT jobname, command, directory FROM queue ORDER BY submitted'
+    if max_jobs is not None:
+      query += ' LIMIT %d'%max_jobs
+    import subprocess
+    results = []
+    for (jobname, command, directory) in \
+        self.index.db.execute(query).fetchall():
+      # Commands are split over lines with backslashes
+      status = subprocess.call(command.replace('\\\n',''), \
+        shell=True, cwd=directory)
+      self.remove(jobname)
+      results.append((jobname, status))
+    return results
@@ -0,0 +1,94 @@
+# A columnar store of scores.
+#
+# Each row is the score of a complex (library, ligand, receptor)
+# from a method (e.g. dock6 or an AlGDock free energy estimate).
+# Columns are numpy arrays stored in a compressed npz file.
+# The modification time and size of every source file are also stored,
+# so that only new or changed results are read when the store is updated.
+
+import os
+import numpy as np
+
+class ScoreStore:
+  columns = ['library','ligand','receptor','method','score','source']
+
+  def __init__(self, FN):
+    """
+    Loads the store in FN, if it exists
+    """
+    self.FN = FN
+    self.rows = {'score':np.zeros(0, dtype=float)}
+    for c in self.columns[:-2] + ['source']:
+      self.rows[c] = np.zeros(0, dtype='S1')
+    self.source_stats = {}
+    if os.path.isfile(FN):
+      dat = np.load(FN)
+      for c in self.columns:
+        self.rows[c] = dat[c]
+      self.source_stats = dict(zip(dat['source_path'], \
+        zip(dat['source_mtime'], dat['source_size'])))
+      dat.close()
+
+  def __len__(self):
+    return len(self.rows['score'])
+
+  def update(self, FNs, read):
+    """
+    Brings the store up to date with the source files FNs.
+    read(FN) returns a list of (library, ligand, receptor, method, score).
+    Rows from files that are not in FNs or have changed are removed.
+    Returns (the number of files that were read,
+    the number of files whose rows were removed and not replaced).
+    """
+    stats = {}
+    for FN in FNs:
+      stat = os.stat(FN)
+      stats[FN] = (stat.st_mtime, stat.st_size)
+    unchanged = [FN for FN in FNs \
+      if self.source_stats.get(FN, None)==stats[FN]]
+    to_read = sorted(set(FNs).difference(unchanged))
+    removed = set(self.source_stats.keys()).difference(FNs)
+
+    keep = np.in1d(self.rows['source'], unchanged)
+    new_rows = []
+    for FN in to_read:
+      new_rows += [row + (FN,) for row in read(FN)]
+    for (n,c) in enumerate(self.columns):
+      if len(new_rows)>0:
+        new = np.array([row[n] for row in new_rows], \
+          dtype=float if c=='score' else str)
+        self.rows[c] = np.concatenate((self.rows[c][keep], new))
+      else:
+        self.rows[c] = self.rows[c][keep]
+    self.source_stats = stats
+    return (len(to_read), len(removed))
+
+  def save(self):
+    paths = sorted(self.source_stats.keys())
+    tmp_FN = self.FN + '.tmp'
+    F = open(tmp_FN,'wb')
+    np.savez_compressed(F, \
+      source_path=np.array(paths, dtype=str), \
+      source_mtime=np.array([self.source_stats[p][0] for p in paths]), \
+      source_size=np.array([self.source_stats[p][1] for p in paths]), \
+      **self.rows)
+    F.close()
+    os.rename(tmp_FN, self.FN)
+
+  def methods(self):
+    return list(np.unique(self.rows['method']))
+
+  def table(self, method):
+    """
+    Returns (keys, scores) for a method, sorted by key.
+    Keys are strings 'library.ligand-receptor'.
+    If there are several scores for a key, the lowest is used.
+    """
+    sel = (self.rows['method']==method)
+    keys = np.char.add(np.char.add(np.char.add(np.char.add(\
+      self.rows['library'][sel], '.'), self.rows['ligand'][sel]), '-'), \
+      self.rows['receptor'][sel])
+    scores = self.rows['score'][sel]
+    order = np.lexsort((scores, keys))
+    (keys, first) = np.unique(keys[order], return_index=True)
+    return (keys, scores[order][first])
@@ -12,12 +12,78 @@ at points on a grid.
 import os, time, gzip
 import numpy as np
 
+def _write_atomically(write, FN):
+  """
+  Calls write(tmp_FN) and renames the temporary file to FN,
+  so that an incomplete grid is never mistaken for a result
+  """
+  tmp_FN = os.path.join(os.path.dirname(FN), \
+    '.tmp%d.'%os.getpid() + os.path.basename(FN))
+  try:
+    write(tmp_FN)
+  except:
+    if os.path.isfile(tmp_FN):
+      os.remove(tmp_FN)
+    raise
+  os.rename(tmp_FN, FN)
+
+# Parameters for the direct grid calculation.
+# They are set before worker processes are forked,
+# so the prmtop and coordinates are only read once.
+_direct_params = {}
+
+def _direct_grid_slab(i_range):
+  """
+  Calculates ele and Lennard-Jones potential energies at grid points
+  with a first index in the range(*i_range)
+  """
+  p = _direct_params
+  spacing = p['spacing']
+  counts = p['counts']
+  shape = (i_range[1]-i_range[0], counts[1], counts[2])
+  grid_x = (np.arange(i_range[0], i_range[1])*spacing[0]).reshape((-1,1,1))
+  grid_y = (np.arange(counts[1])*spacing[1]).reshape((1,-1,1))
+  grid_z = (np.arange(counts[2])*spacing[2]).reshape((1,1,-1))
+
+  grid = {}
+  if not p['no_ele']:
+    grid['ele'] = np.zeros(shape=shape, dtype=float)
+  grid['LJr'] = np.zeros(shape=shape, dtype=float)
+  grid['LJa'] = np.zeros(shape=shape, dtype=float)
+
+  startTime = time.time()
+  for atom_index in range(p['NATOM']):
+    dif_x = grid_x - p['crd'][atom_index][0]
+    dif_y = grid_y - p['crd'][atom_index][1]
+    dif_z = grid_z - p['crd'][atom_index][2]
+    R2 = (dif_x*dif_x + dif_y*dif_y) + dif_z*dif_z
+    del dif_x, dif_y, dif_z
+
+    atom_type = p['ATOM_TYPE_INDEX'][atom_index]-1
+    root_LJ_depth = p['root_LJ_depth'][atom_type]
+    LJ_diameter = p['LJ_diameter'][atom_type]
+
+    if not p['no_ele']:
+      R = np.sqrt(R2)
+      grid['ele'] += 332.06*p['CHARGE'][atom_index]/R
+      grid['LJr'] += root_LJ_depth*(LJ_diameter**6)/R**12
+      grid['LJa'] += -2*root_LJ_depth*(LJ_diameter**3)/R**6
+    else:
+      grid['LJr'] += root_LJ_depth*(LJ_diameter**6)/R2**6
+      grid['LJa'] += -2*root_LJ_depth*(LJ_diameter**3)/R2**3
+
+    if p['verbose'] and atom_index%100==0:
+      endTime = time.time()
+      print 'Completed atom %d / %d in a total of %3.2f s'%(\
+        atom_index,p['NATOM'],endTime-startTime)
+  return grid
+
 class gridCalculation:
   def __init__(self, \
     prmtop_FN='apo.prmtop', inpcrd_FN=None, pqr_FN=None, \
     header_FN=None, site_FN=None, \
     PB_FN=None, ele_FN=None, LJa_FN=None, LJr_FN=None, \
-    spacing=None, counts=None, PB_spacing=None):
+    spacing=None, counts=None, PB_spacing=None, cores=1):
   
     ### Parse parameters
     self.FNs = {'prmtop':prmtop_FN, 'inpcrd':inpcrd_FN, 'header':header_FN, \
@@ -106,25 +172,46 @@ class gridCalculation:
     print 'Grid spacing            :\t', spacing
     print 'Grid counts             :\t', counts
     print 'PB Grid spacing         :\t', PB_spacing
+    print 'Cores                   :\t', cores
     print
 
-    if not os.path.isfile(self.FNs['PB']):
+    calc_PB = not os.path.isfile(self.FNs['PB'])
+    calc_direct = not (os.path.isfile(self.FNs['ele']) and \
+                       os.path.isfile(self.FNs['LJa']) and \
+                       os.path.isfile(self.FNs['LJr']))
+
+    PB_process = None
+    if calc_PB:
       print 'Calculating Poisson-Boltzmann grid'
-      self.PB_grid(PB_spacing*counts, PB_spacing)
+      if calc_direct and cores>1:
+        # APBS runs in a separate process and uses one core
+        import multiprocessing
+        PB_process = multiprocessing.Process(target=self.PB_grid, \
+          args=(PB_spacing*counts, PB_spacing))
+        PB_process.start()
+        cores -= 1
+      else:
+        self.PB_grid(PB_spacing*counts, PB_spacing)
     else:
       print 'Poisson-Boltzmann grid already calculated'
-    
-    if not (os.path.isfile(self.FNs['ele']) and \
-            os.path.isfile(self.FNs['LJa']) and \
-            os.path.isfile(self.FNs['LJr'])):
+
+    if calc_direct:
       print 'Calculating direct alchemical grids'
-      self.direct_grids(spacing, counts)
+      self.direct_grids(spacing, counts, cores=cores)
     else:
       print 'Direct alchemical grids already calculated'
 
-  def direct_grids(self, spacing, counts, no_ele=False):
+    if PB_process is not None:
+      PB_process.join()
+      if PB_process.exitcode!=0:
+        raise Exception('Poisson-Boltzmann grid calculation failed ' + \
+          'with exit code %d'%PB_process.exitcode)
+
+  def direct_grids(self, spacing, counts, no_ele=False, cores=1):
     """
-    Calculates direct grids (Lennard Jones and electrostatic)
+    Calculates direct grids (Lennard Jones and electrostatic).
+    With more than one core, slabs of the grid are calculated
+    in separate processes.
     """
     
     import AlGDock.IO
@@ -138,40 +225,20 @@ class gridCalculation:
     NATOM = prmtop['POINTERS'][0]
     NTYPES = prmtop['POINTERS'][1]
 
-    ### Extract Lennard-Jones well depth and radii for each atom
+    ### Extract Lennard-Jones well depth and radii for each atom type
+    LJ_index = prmtop['NONBONDED_PARM_INDEX'][(NTYPES+1)*np.arange(NTYPES)]-1
+    A = prmtop['LENNARD_JONES_ACOEF'][LJ_index]
+    B = prmtop['LENNARD_JONES_BCOEF'][LJ_index]
+    nonzero = (A>=1.0e-6)
     LJ_radius = np.zeros(shape=(NTYPES), dtype=float)
     LJ_depth = np.zeros(shape=(NTYPES), dtype=float)
-    for i in range(NTYPES):
-      LJ_index = prmtop['NONBONDED_PARM_INDEX'][NTYPES*i+i]-1
-      if prmtop['LENNARD_JONES_ACOEF'][LJ_index]<1.0e-6:
-        LJ_radius[i] = 0
-        LJ_depth[i] = 0
-      else:
-        factor = 2 * prmtop['LENNARD_JONES_ACOEF'][LJ_index] / prmtop['LENNARD_JONES_BCOEF'][LJ_index]
-        LJ_radius[i] = pow(factor, 1.0/6.0) * 0.5 # R_min/2
-        LJ_depth[i] = prmtop['LENNARD_JONES_BCOEF'][LJ_index] / 2 / factor # epsilon
+    factor = 2 * A[nonzero] / B[nonzero]
+    LJ_radius[nonzero] = pow(factor, 1.0/6.0) * 0.5 # R_min/2
+    LJ_depth[nonzero] = B[nonzero] / 2 / factor # epsilon
     # More useful for later calculations
     root_LJ_depth = np.sqrt(LJ_depth)
     LJ_diameter = LJ_radius*2
-    del i, LJ_index, factor
-
-    ### Coordinates of grid points
-    print 'Calculating grid coordinates'
-    startTime = time.time()
-
-    grid = {}
-    grid['x'] = np.zeros(shape=tuple(counts), dtype=float)
-    grid['y'] = np.zeros(shape=tuple(counts), dtype=float)
-    grid['z'] = np.zeros(shape=tuple(counts), dtype=float)
-    for i in range(counts[0]):
-      for j in range(counts[1]):
-        for k in range(counts[2]):
-          grid['x'][i,j,k] = i*spacing[0]
-          grid['y'][i,j,k] = j*spacing[1]
-          grid['z'][i,j,k] = k*spacing[2]
-
-    endTime = time.time()
-    print ' in %3.2f s'%(endTime-startTime)
+    del LJ_index, A, B, factor
 
 ### Calculate ele and Lennard-Jones potential energies at grid points
 # Units: kcal/mol A e
@@ -189,36 +256,27 @@ class gridCalculation:
     print 'Calculating grid potential energies'
     startTime = time.time()
 
-    if not no_ele:
-      grid['ele'] = np.zeros(shape=tuple(counts), dtype=float)
-    grid['LJr'] = np.zeros(shape=tuple(counts), dtype=float)
-    grid['LJa'] = np.zeros(shape=tuple(counts), dtype=float)
-
-    for atom_index in range(NATOM):
-      dif_x = grid['x'] - self.crd[atom_index][0]
-      R2 =  dif_x*dif_x
-      del dif_x
-      dif_y = grid['y'] - self.crd[atom_index][1]
-      R2 += dif_y*dif_y
-      del dif_y
-      dif_z = grid['z'] - self.crd[atom_index][2]
-      R2 += dif_z*dif_z
-      del dif_z  
-
-      atom_type = prmtop['ATOM_TYPE_INDEX'][atom_index]-1
-      
-      if not no_ele:
-        R = np.sqrt(R2)
-        grid['ele'] = grid['ele'] + 332.06*prmtop['CHARGE'][atom_index]/R
-        grid['LJr'] += root_LJ_depth[atom_type]*(LJ_diameter[atom_type]**6)/R**12
-        grid['LJa'] += -2*root_LJ_depth[atom_type]*(LJ_diameter[atom_type]**3)/R**6
-      else:
-        grid['LJr'] += root_LJ_depth[atom_type]*(LJ_diameter[atom_type]**6)/R2**6
-        grid['LJa'] += -2*root_LJ_depth[atom_type]*(LJ_diameter[atom_type]**3)/R2**3
-
-      if atom_index%100==0:
-        endTime = time.time()
-        print 'Completed atom %d / %d in a total of %3.2f s'%(atom_index,NATOM,endTime-startTime)
+    _direct_params.update({'spacing':np.array(spacing), \
+      'counts':np.array(counts), 'crd':self.crd, 'NATOM':NATOM, \
+      'CHARGE':prmtop['CHARGE'], 'ATOM_TYPE_INDEX':prmtop['ATOM_TYPE_INDEX'], \
+      'root_LJ_depth':root_LJ_depth, 'LJ_diameter':LJ_diameter, \
+      'no_ele':no_ele, 'verbose':(cores<2)})
+
+    # Divide the grid into slabs along the first axis
+    nslabs = min(max(cores,1), counts[0])
+    bounds = [int(round(n*counts[0]/float(nslabs))) for n in range(nslabs+1)]
+    i_ranges = zip(bounds[:-1], bounds[1:])
+    if nslabs>1:
+      import multiprocessing
+      pool = multiprocessing.Pool(nslabs)
+      slabs = pool.map(_direct_grid_slab, i_ranges)
+      pool.close()
+      pool.join()
+    else:
+      slabs = [_direct_grid_slab(i_range) for i_range in i_ranges]
+    grid = dict([(key, np.concatenate([slab[key] for slab in slabs])) \
+      for key in slabs[0].keys()])
+    del slabs
 
     endTime = time.time()
     print '\t%3.2f s'%(endTime-startTime)
@@ -229,16 +287,13 @@ class gridCalculation:
     grid['LJa'] = u_max*np.tanh(grid['LJa']/u_max)
 
     ### Output grids
-    import AlGDock.IO
     IO_Grid = AlGDock.IO.Grid()
     print 'Writing grid output'
-    if not no_ele:
-      IO_Grid.write(self.FNs['ele'], \
-        {'origin':np.array([0., 0., 0.]), 'spacing':spacing, 'counts':counts, 'vals':grid['ele'].flatten()})
-    IO_Grid.write(self.FNs['LJr'], \
-      {'origin':np.array([0., 0., 0.]), 'spacing':spacing, 'counts':counts, 'vals':grid['LJr'].flatten()})
-    IO_Grid.write(self.FNs['LJa'], \
-      {'origin':np.array([0., 0., 0.]), 'spacing':spacing, 'counts':counts, 'vals':grid['LJa'].flatten()})
+    for key in ['ele','LJr','LJa']:
+      if key in grid.keys():
+        data = {'origin':np.array([0., 0., 0.]), 'spacing':spacing, \
+          'counts':counts, 'vals':grid[key].flatten()}
+        _write_atomically(lambda FN: IO_Grid.write(FN, data), self.FNs[key])
 
   def PB_grid(self, edge_length, PB_spacing):
     """
@@ -375,8 +430,8 @@ END'''.format(self.FNs['pqr'], \
       import AlGDock.IO
       IO_Grid = AlGDock.IO.Grid()
       print final_dims
-      IO_Grid.truncate('apbs_focus.dx', self.FNs['PB'], \
-        final_dims, multiplier=0.596)
+      _write_atomically(lambda FN: IO_Grid.truncate('apbs_focus.dx', FN, \
+        final_dims, multiplier=0.596), self.FNs['PB'])
 
     # Remove intermediate files
     for FN in [self.FNs['pqr'], 'io.mc', 'apbs.in', 'apbs.out','apbs_focus.dx']:
@@ -412,6 +467,8 @@ if __name__ == '__main__':
       help='Number of point in each direction (overrides header)')
     parser.add_argument('--PB_spacing', type=float, \
       help='PB Grid spacing (equal in all dimensions)')
+    parser.add_argument('--cores', type=int, default=1, \
+      help='Number of processes for the grid calculations')
     args = parser.parse_args()
   except:
     import optparse
@@ -430,6 +487,8 @@ if __name__ == '__main__':
     parser.add_option('--counts', nargs=3, type="float", help='Grid dimensions')
     parser.add_option('--PB_spacing', type="float", \
       help='PB Grid spacing (equal in all dimensions)')
+    parser.add_option('--cores', type="int", default=1, \
+      help='Number of processes for the grid calculations')
     (args,options) = parser.parse_args()
 
   calc = gridCalculation(**vars(args))
@@ -26,13 +26,22 @@ parser.add_argument('--ligand', default='ligand/', \
   help='Directory with ligand collections')
 parser.add_argument('--analysis', default='analysis/', \
   help='Directory with analysis results')
+parser.add_argument('--scores', default=None, \
+  help='Score store, updated with new results' + \
+    ' (default is scores.npz in the analysis directory)')
 args = parser.parse_args()
 del argparse
 
 # Check for the existence of directories
-import os
+import os, inspect
 if not os.path.isdir(args.analysis):
   os.system('mkdir -p '+args.analysis)
+if args.scores is None:
+  args.scores = os.path.join(args.analysis, 'scores.npz')
+
+script_dir = os.path.dirname(os.path.abspath(\
+  inspect.getfile(inspect.currentframe())))
+execfile(os.path.join(script_dir,'_score_store.py'))
 
 # Determine the library names
 import glob
@@ -46,75 +55,67 @@ library_keys = [os.path.basename(FN)[:-4] \
 import numpy as np
 import pickle, gzip
 
-# Extract and sort dock6 scores.
-scores = {'dock6':{}}
-dock6_scores_FN = os.path.join(args.analysis, 'dock6_scores.pkl.gz')
-if os.path.isfile(dock6_scores_FN):
-  F = gzip.open(dock6_scores_FN,'r')
-  scores['dock6'] = pickle.load(F)
-  F.close()
-else:
-  print 'Parsing dock6 scores...'
-  nc_FNs = glob.glob(os.path.join(args.dock6,'*/*/*.nc'))
-  nc_FNs = [FN for FN in nc_FNs if os.path.getsize(FN)>0]
-  for nc_FN in nc_FNs:
-    (dock6_dir, library, key, receptor) = nc_FN.split('/')
-    library = '.'.join(library.split('.')[:-1])
-    receptor = receptor[:-3]
-    key = '%s.%s-%s'%(library,key,receptor)
+def read_dock6(FN):
+  """
+  Returns the dock6 grid score from a netCDF file,
+  or infinity for an empty mol2.gz file (no poses)
+  """
+  (library, key, receptor) = FN.split('/')[-3:]
+  library = '.'.join(library.split('.')[:-1])
+  if FN.endswith('.nc'):
+    receptor = receptor[:-len('.nc')]
     from netCDF4 import Dataset
-    F = Dataset(nc_FN,'r')
-    scores['dock6'][key] =  F.variables['Grid Score'][0]
+    F = Dataset(FN,'r')
+    score = F.variables['Grid Score'][0]
     F.close()
-  mol2_FNs = glob.glob(os.path.join(args.dock6,'*/*/*.mol2.gz'))
-  mol2_FNs = [FN for FN in mol2_FNs if os.path.getsize(FN)==0]
-  for mol2_FN in mol2_FNs:
-    (dock6_dir, library, key, receptor) = nc_FN.split('/')
-    library = '.'.join(library.split('.')[:-1])
-    receptor = receptor[:-3]
-    key = '%s.%s-%s'%(library,key,receptor)
-    scores['dock6'][key] = np.inf
-  F = gzip.open(dock6_scores_FN,'w')
-  pickle.dump(scores['dock6'],F)
-  F.close()
-
-scores_FN = os.path.join(args.analysis, 'scores.pkl.gz')
-if os.path.isfile(scores_FN):
-  F = gzip.open(scores_FN,'r')
-  scores = pickle.load(F)
-  F.close()
-else:
-  # Extract AlGDock scores
-  import pickle
-  f_RL_FNs = [FN for FN in glob.glob(os.path.join(\
-    args.AlGDock,'*','*','*','f_RL.pkl.gz')) if os.path.getsize(FN)>0]
-  for f_RL_FN in f_RL_FNs:
-    print 'Reading AlGDock scores from '+f_RL_FN
-    (lib_subdir,key,receptor_rep) = os.path.dirname(\
-      f_RL_FN[len(args.AlGDock):]).split('/')
-    library = '.'.join(lib_subdir.split('.')[:-1])
-    receptor = '-'.join(receptor_rep.split('-')[:-1])
-    key = '%s.%s-%s'%(library,key,receptor)
-    F = gzip.open(f_RL_FN)
-    (f_L, stats_RL, f_RL, B) = pickle.load(F)
-    F.close()
-    # TODO: Handle infinite scores
-    if 'grid_MBAR' in scores.keys():
-      scores['grid_MBAR'][key] = f_RL['grid_MBAR'][-1][-1]
-    else:
-      scores['grid_MBAR'] = {key:f_RL['grid_MBAR'][-1][-1]}
-    for FF in B.keys():
-      if FF in scores.keys():
-        scores[FF][key] = B[FF][-1]
-      else:
-        scores[FF] = {key:B[FF][-1]}
-  F = gzip.open(scores_FN,'w')
-  pickle.dump(scores,F)
+  else:
+    receptor = receptor[:-len('.mol2.gz')]
+    score = np.inf
+  return [(library, key, receptor, 'dock6', score)]
+
+def read_AlGDock(FN):
+  """
+  Returns the grid MBAR estimate and binding PMFs from f_RL.pkl.gz
+  """
+  (lib_subdir,key,receptor_rep) = os.path.dirname(FN).split('/')[-3:]
+  library = '.'.join(lib_subdir.split('.')[:-1])
+  receptor = '-'.join(receptor_rep.split('-')[:-1])
+  F = gzip.open(FN)
+  (f_L, stats_RL, f_RL, B) = pickle.load(F)
   F.close()
-
-for FF in show['FF'].keys():
-  if not FF in scores.keys():
-    scores[FF] = {}
+  # TODO: Handle infinite scores
+  return [(library, key, receptor, 'grid_MBAR', f_RL['grid_MBAR'][-1][-1])] + \
+    [(library, key, receptor, FF, B[FF][-1]) for FF in B.keys()]
+
+def read_scores(FN):
+  if FN.endswith('f_RL.pkl.gz'):
+    return read_AlGDock(FN)
+  return read_dock6(FN)
+
+# Only new or modified results are read
+nc_FNs = [FN for FN in glob.glob(os.path.join(args.dock6,'*/*/*.nc')) \
+  if os.path.getsize(FN)>0]
+# Empty mol2.gz files are complexes without any poses
+mol2_FNs = [FN for FN in glob.glob(os.path.join(args.dock6,'*/*/*.mol2.gz')) \
+  if os.path.getsize(FN)==0 and \
+    not os.path.isfile(FN[:-len('.mol2.gz')]+'.nc')]
+f_RL_FNs = [FN for FN in glob.glob(os.path.join(\
+  args.AlGDock,'*','*','*','f_RL.pkl.gz')) if os.path.getsize(FN)>0]
+
+store = ScoreStore(args.scores)
+(nread, nremoved) = store.update(nc_FNs + mol2_FNs + f_RL_FNs, read_scores)
+if nread>0:
+  print 'Read scores from %d new or modified files'%nread
+if nremoved>0:
+  print 'Removed scores from %d missing files'%nremoved
+if (nread>0) or (nremoved>0):
+  store.save()
+
+# Scores for each method are arrays sorted by complex key
+keys = {}
+scores = {}
+for FF in set(store.methods() + show['FF'].keys()):
+  (keys[FF], scores[FF]) = store.table(FF)
 
 # Counts
 print '\nNumber of scores'
@@ -125,11 +126,11 @@ for FF in scores.keys():
 collections = {}
 # Create a collection of keys in each force field
 for FF in show['FF'].keys():
-  collections[FF] = set(scores[FF].keys())
+  collections[FF] = keys[FF]
 # Create collections based on active, inactive, or decoy in the library name
 for library_type in ['active','inactive','decoy']:
   collections[library_type] = \
-    set([key for key in scores['dock6'].keys() if key.find(library_type)>-1])
+    keys['dock6'][np.char.find(keys['dock6'], library_type)>-1]
 # TODO: Read in other collections
 
 # Histograms for each force field
@@ -143,8 +144,8 @@ for FF in show['FF'].keys():
     hist_legend = []
     if not os.path.isfile(hist_FN):
       for lib in show['lib'].keys():
-        scores_FF = [scores[FF][key] for key in scores[FF].keys() \
-          if key in collections[lib] and scores[FF][key]<cutoff]
+        scores_FF = scores[FF][np.in1d(keys[FF], collections[lib]) & \
+          (scores[FF]<cutoff)]
         if len(scores_FF)>0:
           hist_scores.append(scores_FF)
           hist_legend.append(show['lib'][lib])
@@ -177,8 +178,8 @@ width_FF_field = np.max([len(show['FF'][FF]) for FF in nonempty_FF])
 positive_keys = collections[positives]
 negative_keys = collections[negatives]
 for FF in nonempty_FF:
-  positive_keys = positive_keys.intersection(collections[FF])
-  negative_keys = negative_keys.intersection(collections[FF])
+  positive_keys = np.intersect1d(positive_keys, collections[FF])
+  negative_keys = np.intersect1d(negative_keys, collections[FF])
 if len(positive_keys)==0:
   raise Exception('No positive ligands!')
 if len(negative_keys)==0:
@@ -195,10 +196,14 @@ AUC = {}
 AUlC = {}
 ROC_legend = []
 for (FF,symbol) in zip(nonempty_FF,('s','d','^','v','>','<','.')):
-  sorted_scores_and_status = sorted(\
-    [(scores[FF][key],True) for key in positive_keys] + \
-    [(scores[FF][key],False) for key in negative_keys])
-  isPositive = np.array([val[1] for val in sorted_scores_and_status])
+  # Keys are sorted, so scores are found by binary search
+  ROC_scores = np.concatenate(\
+    (scores[FF][np.searchsorted(keys[FF], positive_keys)], \
+     scores[FF][np.searchsorted(keys[FF], negative_keys)]))
+  isPositive = np.concatenate((np.ones(len(positive_keys), dtype=bool), \
+    np.zeros(len(negative_keys), dtype=bool)))
+  # Sort by score, with negatives before positives for ties
+  isPositive = isPositive[np.lexsort((isPositive, ROC_scores))]
   TPR = np.cumsum(isPositive)/float(sum(isPositive))
   isNegative = np.logical_not(isPositive)
   FPR = np.cumsum(isNegative)/float(sum(isNegative))
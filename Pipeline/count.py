@@ -8,155 +8,255 @@ parser.add_argument('--clean_dock_not_complex', action='store_true', \
   help='Removes docking results if there is not an AMBER complex')
 parser.add_argument('--multi_target', action='store_true', default=False, \
   help='Performs counts for multiple targets')
+parser.add_argument('--cores', type=int, default=None, \
+  help='Number of processes for counting multiple targets')
+parser.add_argument('--cache', action='store_true', default=False, \
+  help='Stores directory listings in ' + \
+       'TARGET/.count_cache.pkl.gz and only rereads directories ' + \
+       'whose modification time has changed. Files that were empty ' + \
+       'are checked again in every scan.')
 args = parser.parse_args()
 
 import os, sys
 import glob
+from fnmatch import fnmatch
 import numpy as np
 
-def countLines(FN):
-  if os.path.isfile(FN):
-    F = open(FN,'r')
-    nlines = len(F.read().strip().split('\n'))
-    F.close
-    return nlines
-  else:
-    raise Exception(FN+' is not a file!')
-
-def numfiles(path, nonzero=True):
-  FNs = glob.glob(path)
-  if nonzero:
-    FNs = [FN for FN in FNs if os.path.getsize(FN)>0]
-  return len(FNs)
-
-def FN_in_first_not_second(path1,path2):
-  ext1 = path1.split('*')[-1]
-  ext2 = path2.split('*')[-1]
-  set1 = [os.path.basename(FN)[:-len(ext1)] \
-    for FN in glob.glob(path1) if os.path.getsize(FN)>0]
-  set2 = [os.path.basename(FN)[:-len(ext2)] \
-    for FN in glob.glob(path2) if os.path.getsize(FN)>0]
-  return [x for x in set1 if x not in set2]
-
-def complex_nonoverlap(path1,path2):
-  def complex_ids(path):
-    ext = path.split('*')[-1]
-    FNs = ['/'.join(FN[:-len(ext)].split('/')[-3:]) for FN in glob.glob(path)]
-    FNs = [FN if os.path.basename(FN).find('-')==-1 else FN[:-2] for FN in FNs]
-    return set(FNs)
-
-  set1 = set()
-  set2 = set()
-  for p in path1:
-    set1 = set1.union(complex_ids(p))
-  for p in path2:
-    set2 = set2.union(complex_ids(p))
-  first_not_second = sorted([x for x in set1 if x not in set2])
-  second_not_first = sorted([x for x in set2 if x not in set1])
-  return (first_not_second, second_not_first)
-
-def loopISM(ism_FNs, search_strings, field_width, nonzero=True):
+class Scanner:
+  """
+  Lists each directory once, storing the name, type, and size of entries.
+  If cache_FN is not None, listings are saved and only reread
+  when the directory modification time changes. Rewriting a file in place
+  does not change the directory modification time, so files that were
+  empty are checked again.
+  """
+  def __init__(self, root, cache_FN=None):
+    self.root = root
+    self.cache_FN = cache_FN
+    self.listings = {}
+    self.line_counts = {}
+    if (cache_FN is not None) and os.path.isfile(cache_FN):
+      import gzip, pickle
+      try:
+        F = gzip.open(cache_FN,'rb')
+        (self.listings, self.line_counts) = pickle.load(F)
+        F.close()
+      except:
+        print 'Could not read cache in '+cache_FN
+    self.reread = set()
+
+  def listdir(self, rel):
+    """
+    Returns a list of (name, isdir, size) for the directory rel
+    """
+    if rel in self.reread:
+      return self.listings[rel][1]
+    path = os.path.join(self.root, rel)
+    if not os.path.isdir(path):
+      return []
+    mtime = os.path.getmtime(path)
+    if (not rel in self.listings) or (self.listings[rel][0]!=mtime):
+      entries = []
+      for name in os.listdir(path):
+        FN = os.path.join(path, name)
+        try:
+          entries.append((name, os.path.isdir(FN), os.path.getsize(FN)))
+        except OSError:
+          pass # Broken link or file removed during the scan
+      self.listings[rel] = (mtime, entries)
+    else:
+      # e.g. f_RL.pkl.gz is created empty and written when complete
+      entries = []
+      for (name, isdir, size) in self.listings[rel][1]:
+        if (not isdir) and size==0:
+          try:
+            size = os.path.getsize(os.path.join(path, name))
+          except OSError:
+            continue
+        entries.append((name, isdir, size))
+      self.listings[rel] = (mtime, entries)
+    self.reread.add(rel)
+    return self.listings[rel][1]
+
+  def find(self, levels, nonzero=True):
+    """
+    Relative paths that match a list of patterns, one per directory level.
+    This is equivalent to glob.glob('/'.join(levels)).
+    If nonzero, files with a size of zero are excluded.
+    """
+    matches = ['']
+    for n in range(len(levels)):
+      last = (n==len(levels)-1)
+      next_matches = []
+      for rel in matches:
+        for (name, isdir, size) in self.listdir(rel):
+          if name.startswith('.') and not levels[n].startswith('.'):
+            continue # Hidden files are not matched by glob
+          if not fnmatch(name, levels[n]):
+            continue
+          if (not last) and (not isdir):
+            continue
+          if last and nonzero and size==0:
+            continue
+          next_matches.append(os.path.join(rel, name))
+      matches = next_matches
+    return matches
+
+  def count_lines(self, rel):
+    FN = os.path.join(self.root, rel)
+    if not os.path.isfile(FN):
+      raise Exception(FN+' is not a file!')
+    key = (os.path.getmtime(FN), os.path.getsize(FN))
+    if (not rel in self.line_counts) or \
+        (self.line_counts[rel][0]!=key):
+      # Counts newlines in blocks rather than splitting the whole file
+      nlines = 0
+      last = '\n'
+      F = open(FN,'r')
+      block = F.read(2**20)
+      while block!='':
+        nlines += block.count('\n')
+        last = block[-1]
+        block = F.read(2**20)
+      F.close()
+      if last!='\n':
+        nlines += 1
+      self.line_counts[rel] = (key, max(nlines,1))
+    return self.line_counts[rel][1]
+
+  def save(self):
+    if self.cache_FN is not None:
+      import gzip, pickle
+      # Directories that were not listed in this scan are not kept
+      listings = dict([(rel, self.listings[rel]) for rel in self.reread])
+      F = gzip.open(self.cache_FN,'wb')
+      pickle.dump((listings, self.line_counts), F, -1)
+      F.close()
+
+def dir_counts(paths, level):
+  """
+  Counts the paths in each directory at a level
+  """
+  counts = {}
+  for path in paths:
+    d = path.split('/')[level]
+    counts[d] = counts.get(d,0) + 1
+  return counts
+
+def count_prefix(counts, prefix):
+  # Equivalent to matching 'prefix*'
+  return sum([n for (d,n) in counts.items() if d.startswith(prefix)])
+
+def basenames(paths, ext):
+  return set([os.path.basename(path)[:-len(ext)] for path in paths])
+
+def complex_ids(paths, ext):
+  ids = ['/'.join(path[:-len(ext)].split('/')[-3:]) for path in paths]
+  ids = [id if os.path.basename(id).find('-')==-1 else id[:-2] for id in ids]
+  return set(ids)
+
+def loopISM(prefixes, paths, level, field_width):
+  counts = dir_counts(paths, level)
   outstr = ''
-  for ism_FN in ism_FNs:
-    prefix = os.path.basename(ism_FN)[:-4]
-    n = np.sum(np.array([numfiles(search_string%prefix, nonzero=nonzero) \
-      for search_string in search_strings]))
-    outstr += '%s\t%d\n'%(prefix.rjust(field_width), n)
-  n = np.sum(np.array([numfiles(search_string%'', nonzero=nonzero) \
-      for search_string in search_strings]))
-  outstr += '%s\t%d\n'%('Total'.rjust(field_width), n)
+  for prefix in prefixes:
+    outstr += '%s\t%d\n'%(prefix.rjust(field_width), \
+      count_prefix(counts, prefix))
+  outstr += '%s\t%d\n'%('Total'.rjust(field_width), len(paths))
   return outstr
 
-start_dir = os.getcwd()
-if args.multi_target:
-  dirs = sorted([d for d in glob.glob('*') if os.path.isdir(d)])
-  print 'Parsing multiple targets'
-else:
-  dirs = ['.']
-
-for dir in dirs:
-  os.chdir(dir)
+def report(target_dir):
+  """
+  Returns the counts for a target as a string
+  """
+  root = os.path.abspath(target_dir)
+  s = Scanner(root, os.path.join(root,'.count_cache.pkl.gz') \
+    if args.cache else None)
+  out = ['-'*20, root]
 
-  print '-'*20
-  print os.getcwd()
-  
-  nligands_all = 0
-  nligands_dock = 0
-  nligands_AlGDock = 0
-  ism_FNs = glob.glob('ligand/*.ism')
+  ism_FNs = sorted(s.find(['ligand','*.ism'], nonzero=False))
   if ism_FNs==[]:
-    print 'No ligands found for '+dir
-    os.chdir('..')
-    continue
+    out.append('No ligands found for '+target_dir)
+    s.save()
+    return '\n'.join(out)
+  prefixes = [os.path.basename(ism_FN)[:-4] for ism_FN in ism_FNs]
 
-  print "\nLigands"
+  out.append("\nLigands")
   first_field_width = int(np.max([len(ism_FN[:-4]) for ism_FN in ism_FNs]))
-  print ' '*first_field_width+"\tSMILES\tDock\tAlGDock"
-  for ism_FN in ism_FNs:
-    prefix = os.path.basename(ism_FN)[:-4]
-    ism_nligands_all = countLines(ism_FN)
-    ism_nligands_dock = numfiles('ligand/dock_in/%s*/*.mol2'%prefix)
-    ism_nligands_AlGDock = numfiles('ligand/AlGDock_in/%s*/*.tar.gz'%prefix)
-    nligands_all += ism_nligands_all
-    nligands_dock += ism_nligands_dock
-    nligands_AlGDock += ism_nligands_AlGDock
-    print '%*s\t%d\t%d\t%d'%(first_field_width,\
-      prefix,ism_nligands_all,ism_nligands_dock,ism_nligands_AlGDock)
-  print '%*s\t%d\t%d\t%d'%(first_field_width,\
-    'Total',nligands_all,nligands_dock,nligands_AlGDock)
-
-  print "\nReceptors"
-  print "\tHomology  ", numfiles('receptor/3-models/pdb_noH/*.pdb')
-  print "\tDock      ", numfiles('receptor/dock_in/*.sph')
-  nonoverlap = FN_in_first_not_second('receptor/3-models/pdb_noH/*.pdb', \
-                                   'receptor/dock_in/*.sph')
-  if len(nonoverlap)>0:
-    print '  in homology but not dock: ' + ', '.join(nonoverlap)
-  print "\tAMBER     ", numfiles('receptor/amber_in/*.prmtop')
-  nonoverlap = FN_in_first_not_second('receptor/3-models/pdb_noH/*.pdb', \
-                                   'receptor/amber_in/*.prmtop')
-  if len(nonoverlap)>0:
-    print '  in homology but not AMBER: ' + ', '.join(nonoverlap)
-  print "\tAlGDock   ", numfiles('receptor/AlGDock_in/*.PB.nc')
-  nonoverlap = FN_in_first_not_second('receptor/3-models/pdb_noH/*.pdb', \
-                                   'receptor/AlGDock_in/*.PB.nc')
-  if len(nonoverlap)>0:
-    print '  in homology but not AlGDock: ' + ', '.join(nonoverlap)
-
-  print "\nComplexes for AlGDock"
-  print loopISM(ism_FNs, ['complex/AlGDock_in/%s*/*/*.tar.gz'], \
-    first_field_width)
-
-  print "\nCompleted Calculations"
-  print "for dock (*.mol2.gz)"
-  print loopISM(ism_FNs, ['dock6/%s*/*/*.mol2.gz'], first_field_width, \
-    nonzero=False)
-  print "for dock (*.nc)"
-  print loopISM(ism_FNs, ['dock6/%s*/*/*.nc'], first_field_width)
-  print "for dock (all)"
-  print loopISM(ism_FNs, ['dock6/%s*/*/*.mol2.gz', 'dock6/%s*/*/*.nc'], first_field_width, nonzero=False)
-
-  print "for AlGDock"
-  print loopISM(ism_FNs, ['AlGDock/dock/%s*/*/*/f_RL.pkl.gz'], \
-    first_field_width)
+  out.append(' '*first_field_width+"\tSMILES\tDock\tAlGDock")
+  dock_counts = dir_counts(s.find(['ligand','dock_in','*','*.mol2']), 2)
+  AlGDock_counts = \
+    dir_counts(s.find(['ligand','AlGDock_in','*','*.tar.gz']), 2)
+  totals = np.zeros(3, dtype=int)
+  for (ism_FN, prefix) in zip(ism_FNs, prefixes):
+    n = np.array([s.count_lines(ism_FN), \
+      count_prefix(dock_counts, prefix), \
+      count_prefix(AlGDock_counts, prefix)])
+    totals += n
+    out.append('%*s\t%d\t%d\t%d'%((first_field_width, prefix) + tuple(n)))
+  out.append('%*s\t%d\t%d\t%d'%((first_field_width, 'Total') + tuple(totals)))
+
+  out.append("\nReceptors")
+  homology = basenames(s.find(['receptor','3-models','pdb_noH','*.pdb']), \
+    '.pdb')
+  out.append("\tHomology   %d"%len(homology))
+  for (label, name, levels, ext) in [\
+      ('Dock      ', 'dock', ['receptor','dock_in','*.sph'], '.sph'), \
+      ('AMBER     ', 'AMBER', ['receptor','amber_in','*.prmtop'], '.prmtop'), \
+      ('AlGDock   ', 'AlGDock', ['receptor','AlGDock_in','*.PB.nc'], '.PB.nc')]:
+    found = basenames(s.find(levels), ext)
+    out.append("\t%s %d"%(label, len(found)))
+    nonoverlap = sorted(homology.difference(found))
+    if len(nonoverlap)>0:
+      out.append('  in homology but not %s: '%name + ', '.join(nonoverlap))
+
+  # Directories are listed once, so repeated searches are inexpensive
+  complexes = s.find(['complex','AlGDock_in','*','*','*.tar.gz'])
+  dock6_mol2 = s.find(['dock6','*','*','*.mol2.gz'], nonzero=False)
+  dock6_nc_all = s.find(['dock6','*','*','*.nc'], nonzero=False)
+
+  out.append("\nComplexes for AlGDock")
+  out.append(loopISM(prefixes, complexes, 2, first_field_width))
+
+  out.append("\nCompleted Calculations")
+  out.append("for dock (*.mol2.gz)")
+  out.append(loopISM(prefixes, dock6_mol2, 1, first_field_width))
+  out.append("for dock (*.nc)")
+  out.append(loopISM(prefixes, s.find(['dock6','*','*','*.nc']), 1, \
+    first_field_width))
+  out.append("for dock (all)")
+  out.append(loopISM(prefixes, dock6_mol2 + dock6_nc_all, 1, \
+    first_field_width))
+
+  out.append("for AlGDock")
+  out.append(loopISM(prefixes, \
+    s.find(['AlGDock','dock','*','*','*','f_RL.pkl.gz']), 2, \
+    first_field_width))
 
   if args.clean_dock_not_complex:
-    (complex_not_dock,dock_not_complex) = complex_nonoverlap(['complex/AlGDock_in/*/*/*.tar.gz'], ['dock6/*/*/*.mol2.gz', 'dock6/*/*/*.nc'])
-    for p in dock_not_complex:
-      os.system('rm dock6/%s*'%p)
-
-  # print "\nComparing AlGDock and dock sets"
-#  (AlGDock_not_nc,nc_not_AlGDock) = complex_nonoverlap(['AlGDock/dock/*/*/*/f_RL.pkl.gz'], ['dock6/*/*/*.nc'])
-#  (AlGDock_not_dock,dock_not_AlGDock) = complex_nonoverlap(['AlGDock/dock/*/*/*/f_RL.pkl.gz'], ['dock6/*/*/*.mol2.gz', 'dock6/*/*/*.nc'])
-
-#  import gzip, pickle
-#  for path in AlGDock_not_nc:
-#    F = gzip.open('AlGDock/dock/%s-0/f_RL.pkl.gz'%path)
-#    dat = pickle.load(F)
-#    F.close()
-#    print dat[-1]['NAMD_OBC_MBAR'][-1]
-#
-#  for path in AlGDock_not_nc:
-#    os.system('rm -rf AlGDock/dock/%s-0'%path)
-
-  os.chdir(start_dir)
+    complex_set = complex_ids(s.find(\
+      ['complex','AlGDock_in','*','*','*.tar.gz'], nonzero=False), '.tar.gz')
+    dock_set = complex_ids(dock6_mol2, '.mol2.gz').union(\
+      complex_ids(dock6_nc_all, '.nc'))
+    for p in sorted(dock_set.difference(complex_set)):
+      os.system('rm %s*'%os.path.join(root,'dock6',p))
+
+  s.save()
+  return '\n'.join(out)
+
+if args.multi_target:
+  dirs = sorted([d for d in glob.glob('*') if os.path.isdir(d)])
+  print 'Parsing multiple targets'
+else:
+  dirs = ['.']
+
+if args.multi_target and (args.cores!=1) and len(dirs)>1:
+  import multiprocessing
+  pool = multiprocessing.Pool(args.cores)
+  # imap keeps the order of the targets
+  for out in pool.imap(report, dirs):
+    print out
+  pool.close()
+  pool.join()
+else:
+  for dir in dirs:
+    print report(dir)
@@ -0,0 +1,118 @@
+# Times the desolvation grid routines on the bundled example receptor
+# with one thread and with nthreads OpenMP threads,
+# and checks that the results are the same.
+
+# Build the Cython module first:
+# python setup_desolvationGrid_util.py build_ext --inplace
+
+import os, time
+import numpy as np
+
+from desolvationGrid_util import *
+from desolvationGrid import goldenSectionSpiral
+
+# Approximate atomic radii, in A, by element
+# (the example does not include a receptor prmtop)
+radii = {'H':1.1, 'C':1.7, 'N':1.55, 'O':1.52, 'S':1.8}
+
+def load_example(prmtopcrd_dir, counts, spacing):
+  import AlGDock.IO
+  IO_crd = AlGDock.IO.crd()
+  crd = IO_crd.read(os.path.join(prmtopcrd_dir, 'receptor.trans.inpcrd'))
+  ligand_crd = IO_crd.read(os.path.join(prmtopcrd_dir, 'ligand.trans.inpcrd'))
+
+  F = open(os.path.join(prmtopcrd_dir, 'receptor.pdb'),'r')
+  names = [line[12:16].strip() for line in F.read().split('\n') \
+    if line.startswith('ATOM') or line.startswith('HETATM')]
+  F.close()
+  if len(names)!=len(crd):
+    raise Exception('Number of atoms in receptor.pdb and inpcrd differ!')
+  LJ_r = np.array([radii.get(name.lstrip('0123456789')[0], 1.7) \
+    for name in names])
+
+  # The grid origin is at zero, so the receptor is translated
+  # to put the binding site at the center of the grid
+  crd = crd + (counts*spacing/2. - ligand_crd.mean(0))
+  return (crd, LJ_r)
+
+def timed(f, *args):
+  startTime = time.time()
+  result = f(*args)
+  return (result, time.time() - startTime)
+
+def run(crd, LJ_r, counts, spacing, nthreads, args):
+  LJ_r2 = LJ_r*LJ_r
+  SAS_r = LJ_r + args.probe_radius
+  unit_sphere_pts = goldenSectionSpiral(args.SAS_points)
+  times = {}
+
+  (SAS_points, times['SAS points']) = timed(enumerate_SAS_points, \
+    crd, crd, unit_sphere_pts, SAS_r, LJ_r2, nthreads)
+
+  receptor_MS_grid = np.ones(shape=tuple(counts), dtype=np.int)
+  startTime = time.time()
+  set_inside_spheres_to(receptor_MS_grid, spacing, counts, \
+    crd, SAS_r, 0, nthreads)
+  increment_inside_spheres(receptor_MS_grid, spacing, counts, \
+    SAS_points, args.probe_radius, nthreads)
+  times['receptor MS'] = time.time() - startTime
+
+  SAS_sphere_pts = \
+    (args.ligand_atom_radius + args.probe_radius)*unit_sphere_pts
+  (desolvationGrid, times['desolvation grid']) = timed(calc_desolvationGrid, \
+    receptor_MS_grid, spacing, counts, SAS_points, crd, \
+    SAS_sphere_pts, LJ_r2, max(LJ_r), args.ligand_atom_radius, \
+    args.probe_radius, args.integration_cutoff, nthreads, \
+    args.integration_method)
+  return ((SAS_points, receptor_MS_grid, desolvationGrid), times)
+
+if __name__ == '__main__':
+  import argparse
+  parser = argparse.ArgumentParser(\
+    description='Benchmarks the desolvation grid calculation')
+  parser.add_argument('--prmtopcrd_dir', \
+    default=os.path.join(os.path.dirname(os.path.abspath(__file__)), \
+      '..','..','Example','prmtopcrd'), \
+    help='Directory with the example receptor and ligand')
+  parser.add_argument('--counts', nargs=3, type=int, default=[24,24,24], \
+    help='Number of point in each direction')
+  parser.add_argument('--spacing', nargs=3, type=float, \
+    default=[0.5,0.5,0.5], help='Grid spacing')
+  parser.add_argument('--probe_radius', default=1.4, type=float, \
+    help='Radius of the solvent probe, in A')
+  parser.add_argument('--ligand_atom_radius', default=1.4, type=float, \
+    help='Radius of the ligand atom, in A')
+  parser.add_argument('--SAS_points', default=1000, type=int, \
+    help='Number of points on solvent accessible surface per receptor atom')
+  parser.add_argument('--integration_cutoff', default=10, type=float, \
+    help='Numerical integration cutoff, in A')
+  parser.add_argument('--nthreads', default=0, type=int, \
+    help='Number of OpenMP threads (0 for the OpenMP default)')
+  parser.add_argument('--integration_method', default='auto', \
+    choices=['auto','stencil','fft'], \
+    help='Evaluate the r**(-4) integrals as stencil sums or FFT convolutions')
+  args = parser.parse_args()
+
+  counts = np.array(args.counts, dtype=np.int)
+  spacing = np.array(args.spacing, dtype=np.float)
+  (crd, LJ_r) = load_example(args.prmtopcrd_dir, counts, spacing)
+  print 'Receptor atoms          :\t', len(crd)
+  print 'Grid spacing            :\t', spacing
+  print 'Grid counts             :\t', counts
+  print
+
+  (serial, serial_times) = run(crd, LJ_r, counts, spacing, 1, args)
+  (parallel, parallel_times) = run(crd, LJ_r, counts, spacing, \
+    args.nthreads, args)
+
+  print '%-20s %10s %10s %8s'%('', '1 thread', \
+    '%d threads'%args.nthreads if args.nthreads>0 else 'default', 'speedup')
+  for key in ['SAS points', 'receptor MS', 'desolvation grid']:
+    print '%-20s %9.2fs %9.2fs %7.2fx'%(key, \
+      serial_times[key], parallel_times[key], \
+      serial_times[key]/max(parallel_times[key],1e-6))
+  print
+  print 'Number of SAS points    :\t', len(serial[0])
+  for (name, a, b) in zip(['SAS points', 'receptor MS', 'desolvation grid'], \
+      serial, parallel):
+    print 'Max difference in %-20s: %g'%(name, np.max(np.abs(a-b)))
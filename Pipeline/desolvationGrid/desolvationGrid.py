@@ -8,8 +8,13 @@ from desolvationGrid_util import *
 # set_inside_sphere_to
 # increment_inside_sphere
 # decrement_inside_sphere
+# set_inside_spheres_to
+# increment_inside_spheres
 # fraction_r4inv_low_dielectric
+# r4inv_integrals
 # calc_desolvationGrid
+# The routines that loop over many atoms or grid points use
+# nthreads OpenMP threads (0 for the OpenMP default).
 
 def goldenSectionSpiral(n):
   golden_angle = np.pi * (3 - np.sqrt(5))
@@ -110,6 +115,13 @@ class desolvationGridCalculation:
 
     kwargs['counts'] = counts
     kwargs['spacing'] = spacing
+    if kwargs.get('nthreads') is None:
+      kwargs['nthreads'] = 0
+    if kwargs.get('integration_method') is None:
+      kwargs['integration_method'] = 'auto'
+    # Integration stencils are cached with the output grid by default
+    if kwargs.get('stencil_dir') is None:
+      kwargs['stencil_dir'] = os.path.dirname(os.path.abspath(self.FNs['grid']))
     self.kwargs = kwargs
 
   def calc_receptor_SAS_points(self):
@@ -117,7 +129,7 @@ class desolvationGridCalculation:
     startTime = time.time()
 
     self.receptor_SAS_points = enumerate_SAS_points(self.crd, self.crd, \
-      self.unit_sphere_pts, self.SAS_r, self.LJ_r2)
+      self.unit_sphere_pts, self.SAS_r, self.LJ_r2, self.kwargs['nthreads'])
 
     endTime = time.time()
     print ' in %3.2f s'%(endTime-startTime)
@@ -129,16 +141,12 @@ class desolvationGridCalculation:
     self.receptor_MS_grid = np.ones(shape=tuple(self.kwargs['counts']), \
       dtype=np.int)
     # Tentatively assign the grid inside the SAS to low dielectric
-    for atom_index in range(len(self.SAS_r)):
-      set_inside_sphere_to(self.receptor_MS_grid, self.kwargs['spacing'], \
-        self.kwargs['counts'],
-        self.crd[atom_index,0], self.crd[atom_index,1], self.crd[atom_index,2], \
-        self.SAS_r[atom_index], 0)
+    set_inside_spheres_to(self.receptor_MS_grid, self.kwargs['spacing'], \
+      self.kwargs['counts'], self.crd, self.SAS_r, 0, self.kwargs['nthreads'])
     # Determine number of SAS points marking each grid point
-    for SAS_point in self.receptor_SAS_points:
-      increment_inside_sphere(self.receptor_MS_grid, self.kwargs['spacing'], \
-        self.kwargs['counts'], SAS_point[0], SAS_point[1], SAS_point[2], \
-        self.kwargs['probe_radius'])
+    increment_inside_spheres(self.receptor_MS_grid, self.kwargs['spacing'], \
+      self.kwargs['counts'], self.receptor_SAS_points, \
+      self.kwargs['probe_radius'], self.kwargs['nthreads'])
 
     endTime = time.time()
     print ' in %3.2f s'%(endTime-startTime)
@@ -163,7 +171,9 @@ class desolvationGridCalculation:
       self.receptor_SAS_points, self.crd, \
       SAS_sphere_pts, self.LJ_r2, max(np.sqrt(self.LJ_r2)), \
       self.kwargs['ligand_atom_radius'], \
-      self.kwargs['probe_radius'], self.kwargs['integration_cutoff'])
+      self.kwargs['probe_radius'], self.kwargs['integration_cutoff'], \
+      self.kwargs['nthreads'], self.kwargs['integration_method'], \
+      self.kwargs['stencil_dir'])
 
     import AlGDock.IO
     IO_Grid = AlGDock.IO.Grid()
@@ -205,6 +215,14 @@ if __name__ == '__main__':
     help='Grid spacing (overrides header)')
   parser.add_argument('--counts', nargs=3, type=int, \
     help='Number of point in each direction (overrides header)')
+  parser.add_argument('--nthreads', default=0, type=int, \
+    help='Number of OpenMP threads (0 for the OpenMP default)')
+  parser.add_argument('--integration_method', default='auto', \
+    choices=['auto','stencil','fft'], \
+    help='Evaluate the r**(-4) integrals as stencil sums or FFT convolutions')
+  parser.add_argument('--stencil_dir', default=None, \
+    help='Directory for cached integration stencils ' + \
+      '(default is the output grid directory)')
   parser.add_argument('-f')
   args = parser.parse_args()
   
@@ -3,13 +3,117 @@
 
 # %%cython --annotate
 
+# The loops over grid slabs are parallelized with OpenMP.
+# Build with setup_desolvationGrid_util.py, which adds the -fopenmp flags.
+# The flags are required: the OpenMP runtime is called directly
+# to choose the default number of threads.
+# Use nthreads=1 to run serially.
+
+import os
 import cython
 import numpy as np
 cimport numpy as np
 
+from cython.parallel cimport prange, parallel
+cimport openmp
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+from libc.math cimport floor
+
 ctypedef np.int_t int_t
 ctypedef np.float_t float_t
 
+# A spatial hash (cell list) of points.
+# The points in cell (a,b,c) are items[first[cell]:first[cell+1]],
+# where cell = (a*ncells[1] + b)*ncells[2] + c.
+cdef struct cell_list:
+  float_t *coords
+  float_t *r2
+  float_t origin[3]
+  int_t ncells[3]
+  float_t cell_size
+  int_t *first
+  int_t *items
+
+def _spatial_hash(points, cell_size):
+  """
+  Sorts points into cubic cells with an edge of cell_size.
+  Returns the origin, number of cells in each dimension,
+  the index of the first point in each cell, and the sorted point indices.
+  """
+  points = np.ascontiguousarray(points, dtype=np.float).reshape((-1,3))
+  if len(points)==0:
+    return (np.zeros(3), np.ones(3, dtype=np.int), \
+      np.zeros(2, dtype=np.int), np.zeros(0, dtype=np.int))
+  origin = points.min(0)
+  ncells = (np.floor((points.max(0)-origin)/cell_size)+1).astype(np.int)
+  cell_ijk = np.floor((points-origin)/cell_size).astype(np.int)
+  cell = (cell_ijk[:,0]*ncells[1] + cell_ijk[:,1])*ncells[2] + cell_ijk[:,2]
+  items = np.argsort(cell, kind='mergesort').astype(np.int)
+  first = np.searchsorted(cell[items], \
+    np.arange(np.prod(ncells)+1)).astype(np.int)
+  return (origin, ncells, first, items)
+
+cdef cell_list _as_cell_list(float_t[:,::1] coords, float_t[::1] r2, \
+    float_t[::1] origin, int_t[::1] ncells, int_t[::1] first, \
+    int_t[::1] items, float_t cell_size):
+  # The arrays must be kept alive by the caller while the cell list is used
+  cdef cell_list h
+  cdef int d
+  h.coords = &coords[0,0] if coords.shape[0]>0 else NULL
+  h.r2 = &r2[0] if r2.shape[0]>0 else NULL
+  for d in range(3):
+    h.origin[d] = origin[d]
+    h.ncells[d] = ncells[d]
+  h.cell_size = cell_size
+  h.first = &first[0]
+  h.items = &items[0] if items.shape[0]>0 else NULL
+  return h
+
+cdef inline int_t _imax(int_t a, int_t b) nogil:
+  return a if a>b else b
+
+cdef inline int_t _imin(int_t a, int_t b) nogil:
+  return a if a<b else b
+
+# The range of cells that may contain points within cell_size of (x,y,z)
+@cython.cdivision(True)
+cdef inline void _neighbor_cells(cell_list *h, float_t x, float_t y, \
+    float_t z, int_t *lo, int_t *hi) nogil:
+  cdef int_t c
+  c = <int_t>floor((x-h.origin[0])/h.cell_size)
+  lo[0] = _imax(c-1,0)
+  hi[0] = _imin(c+2,h.ncells[0])
+  c = <int_t>floor((y-h.origin[1])/h.cell_size)
+  lo[1] = _imax(c-1,0)
+  hi[1] = _imin(c+2,h.ncells[1])
+  c = <int_t>floor((z-h.origin[2])/h.cell_size)
+  lo[2] = _imax(c-1,0)
+  hi[2] = _imin(c+2,h.ncells[2])
+
+# Whether (x,y,z) is within the LJ radius of any point in the cell list.
+# The cell size must be at least the largest LJ radius.
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _clashes(cell_list *h, float_t x, float_t y, float_t z) nogil:
+  cdef int_t lo[3]
+  cdef int_t hi[3]
+  cdef int_t a, b, c, cell, n, atom
+  cdef float_t dx, dy, dz
+  _neighbor_cells(h, x, y, z, lo, hi)
+  for a in range(lo[0],hi[0]):
+    for b in range(lo[1],hi[1]):
+      for c in range(lo[2],hi[2]):
+        cell = (a*h.ncells[1] + b)*h.ncells[2] + c
+        for n in range(h.first[cell],h.first[cell+1]):
+          atom = h.items[n]
+          dx = h.coords[3*atom] - x
+          dy = h.coords[3*atom+1] - y
+          dz = h.coords[3*atom+2] - z
+          if (dx*dx + dy*dy + dz*dz) < h.r2[atom]:
+            return 1
+  return 0
+
 # This is the original python code for enumerate_SAS_points
 # def enumerate_SAS_points(to_surround, to_avoid, \
 #     unit_sphere_pts, SAS_r, LJ_r2):
@@ -21,52 +125,69 @@ ctypedef np.float_t float_t
 #     SAS_points.extend(receptor_SAS_points_n)
 #   return SAS_points
 
+# Instead of checking each point against all the atoms to avoid,
+# only atoms in neighboring cells of a spatial hash are checked.
+# The first pass counts the SAS points of each atom and the second pass
+# stores them, so the points are in the same order as the serial code.
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
 cpdef enumerate_SAS_points(float_t[:,:] to_surround, float_t[:,:] to_avoid, \
-    float_t[:,:] unit_sphere_pts, float_t[:] SAS_r, float_t[:] LJ_r2):
-  cdef int_t clash
-  cdef int_t natoms_to_surround, natoms_to_avoid, nsphere_points
-  cdef int_t atom_i, atom_j, sphere_i, d
-  cdef float_t atom_x, atom_y, atom_z
+    float_t[:,:] unit_sphere_pts, float_t[:] SAS_r, float_t[:] LJ_r2, \
+    int nthreads=0):
+  cdef int_t natoms_to_surround, nsphere_points
+  cdef int_t atom_i, sphere_i, n
   cdef float_t point_x, point_y, point_z
-  cdef float_t dx, dy, dz
-  cdef float_t SAS_radius
+  cdef cell_list h
+  cdef int_t[::1] npoints, offsets
+  cdef float_t[:,::1] SAS_points_v
 
   natoms_to_surround = len(SAS_r)
-  natoms_to_avoid = len(LJ_r2)
   nsphere_points = len(unit_sphere_pts)
+  if nthreads<=0:
+    nthreads = openmp.omp_get_max_threads()
 
-  SAS_points = []
-  atom_i = 0
-  while atom_i < natoms_to_surround:
-    atom_x = to_surround[atom_i,0]
-    atom_y = to_surround[atom_i,1]
-    atom_z = to_surround[atom_i,2]
-    SAS_radius = SAS_r[atom_i]
-    sphere_i = 0
-    while sphere_i < nsphere_points:
+  avoid = np.ascontiguousarray(to_avoid, dtype=np.float)
+  avoid_r2 = np.ascontiguousarray(LJ_r2, dtype=np.float)
+  cell_size = np.sqrt(avoid_r2.max()) if len(avoid_r2)>0 else 1.
+  if cell_size<=0.:
+    cell_size = 1.
+  (origin, ncells, first, items) = _spatial_hash(avoid, cell_size)
+  h = _as_cell_list(avoid, avoid_r2, origin, ncells, first, items, cell_size)
+
+  npoints = np.zeros(natoms_to_surround, dtype=np.int)
+  for atom_i in prange(natoms_to_surround, nogil=True, \
+      num_threads=nthreads, schedule='guided'):
+    for sphere_i in range(nsphere_points):
       # Propose a point at the SAS of the atom
-      point_x = unit_sphere_pts[sphere_i,0]*SAS_radius + atom_x
-      point_y = unit_sphere_pts[sphere_i,1]*SAS_radius + atom_y
-      point_z = unit_sphere_pts[sphere_i,2]*SAS_radius + atom_z
-      clash = 0
-      atom_j = 0
-      while atom_j < natoms_to_avoid:
-        dx = to_avoid[atom_j,0] - point_x
-        dy = to_avoid[atom_j,1] - point_y
-        dz = to_avoid[atom_j,2] - point_z
-        if (dx*dx + dy*dy + dz*dz) < LJ_r2[atom_j]:
-          clash = 1
-          atom_j = natoms_to_avoid
-        else:
-          atom_j += 1
-      if clash==0:
-        SAS_points.append((point_x,point_y,point_z))
-      sphere_i += 1
-    atom_i += 1
-  return np.array(SAS_points)
+      point_x = unit_sphere_pts[sphere_i,0]*SAS_r[atom_i] + \
+        to_surround[atom_i,0]
+      point_y = unit_sphere_pts[sphere_i,1]*SAS_r[atom_i] + \
+        to_surround[atom_i,1]
+      point_z = unit_sphere_pts[sphere_i,2]*SAS_r[atom_i] + \
+        to_surround[atom_i,2]
+      if not _clashes(&h, point_x, point_y, point_z):
+        npoints[atom_i] += 1
+
+  offsets = np.concatenate([[0],np.cumsum(npoints)]).astype(np.int)
+  SAS_points = np.zeros((offsets[natoms_to_surround],3), dtype=np.float)
+  SAS_points_v = SAS_points
+  for atom_i in prange(natoms_to_surround, nogil=True, \
+      num_threads=nthreads, schedule='guided'):
+    n = offsets[atom_i]
+    for sphere_i in range(nsphere_points):
+      point_x = unit_sphere_pts[sphere_i,0]*SAS_r[atom_i] + \
+        to_surround[atom_i,0]
+      point_y = unit_sphere_pts[sphere_i,1]*SAS_r[atom_i] + \
+        to_surround[atom_i,1]
+      point_z = unit_sphere_pts[sphere_i,2]*SAS_r[atom_i] + \
+        to_surround[atom_i,2]
+      if not _clashes(&h, point_x, point_y, point_z):
+        SAS_points_v[n,0] = point_x
+        SAS_points_v[n,1] = point_y
+        SAS_points_v[n,2] = point_z
+        n = n + 1
+  return SAS_points
 
 # This is the original python code for set_inside_sphere_to
 # def set_inside_sphere_to(grid, spacing, counts, point, r, val):
@@ -87,142 +208,176 @@ cpdef enumerate_SAS_points(float_t[:,:] to_surround, float_t[:,:] to_avoid, \
 #         if (dx2 + dy2 + dz2) < r2:
 #           grid[i,j,k]=val
 
-# The following three functions are the same except that
-# one sets the grid value,
-# one increments the grid value, and
-# one decrements the grid value
+# Sets (increment==0) or adds val to (increment==1) the grid points
+# inside a sphere. The grid is a block of n[0] x n[1] x n[2] points
+# starting at grid index lo, so that a block around a single point
+# can be modified instead of the whole grid. Only slabs with
+# i_first <= i < i_last are modified.
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cpdef set_inside_sphere_to(\
-    int_t[:,:,:] grid, \
-    float_t[:] spacing, \
-    int_t[:] counts, \
-    float_t point_x, \
-    float_t point_y, \
-    float_t point_z, \
-    float_t r, \
-    int_t val):
-
-  cdef int_t i, j, k
+cdef void _mark_inside_sphere(int_t *grid, int_t *lo, int_t *n, \
+    int_t *counts, float_t *spacing, \
+    float_t point_x, float_t point_y, float_t point_z, float_t r, \
+    int_t val, int increment, int_t i_first, int_t i_last) nogil:
+  cdef int_t i, j, k, ind
   cdef int_t i_min, i_max, j_min, j_max, k_min, k_max
   cdef float_t dx, dy, dz, dx2, dy2, dz2, dx2dy2, r2
-  
-  i_min = max(int((point_x-r)/spacing[0]),0)
-  i_max = min(int((point_x+r)/spacing[0])+1,counts[0])
-  j_min = max(int((point_y-r)/spacing[1]),0)
-  j_max = min(int((point_y+r)/spacing[1])+1,counts[1])
-  k_min = max(int((point_z-r)/spacing[2]),0)
-  k_max = min(int((point_z+r)/spacing[2])+1,counts[2])
+
+  i_min = _imax(_imax(<int_t>((point_x-r)/spacing[0]),0),_imax(lo[0],i_first))
+  i_max = _imin(_imin(<int_t>((point_x+r)/spacing[0])+1,counts[0]), \
+    _imin(lo[0]+n[0],i_last))
+  j_min = _imax(_imax(<int_t>((point_y-r)/spacing[1]),0),lo[1])
+  j_max = _imin(_imin(<int_t>((point_y+r)/spacing[1])+1,counts[1]),lo[1]+n[1])
+  k_min = _imax(_imax(<int_t>((point_z-r)/spacing[2]),0),lo[2])
+  k_max = _imin(_imin(<int_t>((point_z+r)/spacing[2])+1,counts[2]),lo[2]+n[2])
 
   r2 = r*r
-  i = i_min
-  while i<i_max:
+  for i in range(i_min,i_max):
     dx  = point_x-i*spacing[0]
     dx2 = dx*dx
-    j = j_min
-    while j<j_max:
+    for j in range(j_min,j_max):
       dy  = point_y-j*spacing[1]
       dy2 = dy*dy
       dx2dy2 = dx2 + dy2
       if dx2dy2 < r2:
-        k = k_min
-        while k<k_max:
+        ind = ((i-lo[0])*n[1] + (j-lo[1]))*n[2] - lo[2]
+        for k in range(k_min,k_max):
           dz  = point_z-k*spacing[2]
           dz2 = dz*dz
           if (dx2dy2 + dz2) < r2:
-            grid[i,j,k]=val
-          k += 1
-      j += 1
-    i += 1
+            if increment:
+              grid[ind+k] += val
+            else:
+              grid[ind+k] = val
+
+# Sets or adds val to the grid points inside many spheres.
+# Each thread works on a different slab of the grid, so threads never
+# write to the same grid point and the result does not depend on
+# the number of threads.
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef _mark_inside_spheres(int_t[:,:,::1] grid, \
+    float_t[:] spacing, int_t[:] counts, \
+    points, radii, int_t val, int increment, int nthreads):
+  cdef int_t i, n, ind
+  cdef int_t *grid_p = &grid[0,0,0]
+  cdef int_t lo[3]
+  cdef int_t c_counts[3]
+  cdef float_t c_spacing[3]
+  cdef int_t[::1] first, last, order
+  cdef float_t[:,::1] points_v
+  cdef float_t[::1] radii_v
+
+  points = np.ascontiguousarray(points, dtype=np.float).reshape((-1,3))
+  radii = np.ascontiguousarray(radii, dtype=np.float)
+  if len(points)==0:
+    return
+  if nthreads<=0:
+    nthreads = openmp.omp_get_max_threads()
+  for i in range(3):
+    lo[i] = 0
+    c_counts[i] = counts[i]
+    c_spacing[i] = spacing[i]
+
+  # Spheres that may overlap each slab
+  order = np.argsort(points[:,0], kind='mergesort').astype(np.int)
+  x_sorted = points[order,0]
+  slab_x = np.arange(c_counts[0])*c_spacing[0]
+  margin = radii.max() + 2*c_spacing[0]
+  first = np.searchsorted(x_sorted, slab_x - margin, 'left').astype(np.int)
+  last = np.searchsorted(x_sorted, slab_x + margin, 'right').astype(np.int)
+
+  points_v = points
+  radii_v = radii
+  for i in prange(c_counts[0], nogil=True, \
+      num_threads=nthreads, schedule='dynamic'):
+    for n in range(first[i],last[i]):
+      ind = order[n]
+      _mark_inside_sphere(grid_p, lo, c_counts, c_counts, c_spacing, \
+        points_v[ind,0], points_v[ind,1], points_v[ind,2], radii_v[ind], \
+        val, increment, i, i+1)
+
+# The following three functions are the same except that
+# one sets the grid value,
+# one increments the grid value, and
+# one decrements the grid value
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef set_inside_sphere_to(\
+    int_t[:,:,::1] grid, \
+    float_t[:] spacing, \
+    int_t[:] counts, \
+    float_t point_x, \
+    float_t point_y, \
+    float_t point_z, \
+    float_t r, \
+    int_t val):
+  cdef int_t lo[3]
+  cdef int_t c_counts[3]
+  cdef float_t c_spacing[3]
+  cdef int d
+  for d in range(3):
+    lo[d] = 0
+    c_counts[d] = counts[d]
+    c_spacing[d] = spacing[d]
+  _mark_inside_sphere(&grid[0,0,0], lo, c_counts, c_counts, c_spacing, \
+    point_x, point_y, point_z, r, val, 0, 0, c_counts[0])
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-@cython.cdivision(True)
 cpdef increment_inside_sphere(\
-    int_t[:,:,:] grid, \
+    int_t[:,:,::1] grid, \
     float_t[:] spacing, \
     int_t[:] counts, \
     float_t point_x, \
     float_t point_y, \
     float_t point_z, \
     float_t r):
-
-  cdef int_t i, j, k
-  cdef int_t i_min, i_max, j_min, j_max, k_min, k_max
-  cdef float_t dx, dy, dz, dx2, dy2, dz2, dx2dy2, r2
-  
-  i_min = max(int((point_x-r)/spacing[0]),0)
-  i_max = min(int((point_x+r)/spacing[0])+1,counts[0])
-  j_min = max(int((point_y-r)/spacing[1]),0)
-  j_max = min(int((point_y+r)/spacing[1])+1,counts[1])
-  k_min = max(int((point_z-r)/spacing[2]),0)
-  k_max = min(int((point_z+r)/spacing[2])+1,counts[2])
-
-  r2 = r*r
-  i = i_min
-  while i<i_max:
-    dx  = point_x-i*spacing[0]
-    dx2 = dx*dx
-    j = j_min
-    while j<j_max:
-      dy  = point_y-j*spacing[1]
-      dy2 = dy*dy
-      dx2dy2 = dx2 + dy2
-      if dx2dy2 < r2:
-        k = k_min
-        while k<k_max:
-          dz  = point_z-k*spacing[2]
-          dz2 = dz*dz
-          if (dx2dy2 + dz2) < r2:
-            grid[i,j,k]+=1
-          k += 1
-      j += 1
-    i += 1
+  cdef int_t lo[3]
+  cdef int_t c_counts[3]
+  cdef float_t c_spacing[3]
+  cdef int d
+  for d in range(3):
+    lo[d] = 0
+    c_counts[d] = counts[d]
+    c_spacing[d] = spacing[d]
+  _mark_inside_sphere(&grid[0,0,0], lo, c_counts, c_counts, c_spacing, \
+    point_x, point_y, point_z, r, 1, 1, 0, c_counts[0])
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-@cython.cdivision(True)
 cpdef decrement_inside_sphere(\
-    int_t[:,:,:] grid, \
+    int_t[:,:,::1] grid, \
     float_t[:] spacing, \
     int_t[:] counts, \
     float_t point_x, \
     float_t point_y, \
     float_t point_z, \
     float_t r):
+  cdef int_t lo[3]
+  cdef int_t c_counts[3]
+  cdef float_t c_spacing[3]
+  cdef int d
+  for d in range(3):
+    lo[d] = 0
+    c_counts[d] = counts[d]
+    c_spacing[d] = spacing[d]
+  _mark_inside_sphere(&grid[0,0,0], lo, c_counts, c_counts, c_spacing, \
+    point_x, point_y, point_z, r, -1, 1, 0, c_counts[0])
 
-  cdef int_t i, j, k
-  cdef int_t i_min, i_max, j_min, j_max, k_min, k_max
-  cdef float_t dx, dy, dz, dx2, dy2, dz2, dx2dy2, r2
-  
-  i_min = max(int((point_x-r)/spacing[0]),0)
-  i_max = min(int((point_x+r)/spacing[0])+1,counts[0])
-  j_min = max(int((point_y-r)/spacing[1]),0)
-  j_max = min(int((point_y+r)/spacing[1])+1,counts[1])
-  k_min = max(int((point_z-r)/spacing[2]),0)
-  k_max = min(int((point_z+r)/spacing[2])+1,counts[2])
+# Versions of set_inside_sphere_to and increment_inside_sphere
+# for many spheres at once, parallelized over grid slabs.
+# points is an N x 3 array and radii has N elements.
+def set_inside_spheres_to(int_t[:,:,::1] grid, float_t[:] spacing, \
+    int_t[:] counts, points, radii, int_t val, int nthreads=0):
+  _mark_inside_spheres(grid, spacing, counts, points, radii, \
+    val, 0, nthreads)
 
-  r2 = r*r
-  i = i_min
-  while i<i_max:
-    dx  = point_x-i*spacing[0]
-    dx2 = dx*dx
-    j = j_min
-    while j<j_max:
-      dy  = point_y-j*spacing[1]
-      dy2 = dy*dy
-      dx2dy2 = dx2 + dy2
-      if dx2dy2 < r2:
-        k = k_min
-        while k<k_max:
-          dz  = point_z-k*spacing[2]
-          dz2 = dz*dz
-          if (dx2dy2 + dz2) < r2:
-            grid[i,j,k]-=1
-          k += 1
-      j += 1
-    i += 1
+def increment_inside_spheres(int_t[:,:,::1] grid, float_t[:] spacing, \
+    int_t[:] counts, points, float_t r, int nthreads=0):
+  _mark_inside_spheres(grid, spacing, counts, points, \
+    r*np.ones(len(points)), 1, 1, nthreads)
 
 # Performs numerical integrals of r**(-4) over the grid points
 # between r_min and r_max, either
@@ -232,7 +387,7 @@ cpdef decrement_inside_sphere(\
 @cython.wraparound(False)
 @cython.cdivision(True)
 cpdef fraction_r4inv_low_dielectric(\
-    int_t[:,:,:] grid, \
+    int_t[:,:,::1] grid, \
     float_t[:] spacing, \
     int_t[:] counts, \
     float_t point_x, \
@@ -245,31 +400,28 @@ cpdef fraction_r4inv_low_dielectric(\
   cdef float_t I_low_dielectric, I_total
   cdef float_t dx, dy, dz, dx2, dy2, dz2, dx2dy2
   cdef float_t r2, r_min2, r_max2, r4inv
-    
+
   I_low_dielectric = 0.
   I_total = 0.
 
-  i_min = max(int((point_x-r_max)/spacing[0]),0)
-  i_max = min(int((point_x+r_max)/spacing[0])+1,counts[0])
-  j_min = max(int((point_y-r_max)/spacing[1]),0)
-  j_max = min(int((point_y+r_max)/spacing[1])+1,counts[1])
-  k_min = max(int((point_z-r_max)/spacing[2]),0)
-  k_max = min(int((point_z+r_max)/spacing[2])+1,counts[2])
+  i_min = max(<int_t>((point_x-r_max)/spacing[0]),0)
+  i_max = min(<int_t>((point_x+r_max)/spacing[0])+1,counts[0])
+  j_min = max(<int_t>((point_y-r_max)/spacing[1]),0)
+  j_max = min(<int_t>((point_y+r_max)/spacing[1])+1,counts[1])
+  k_min = max(<int_t>((point_z-r_max)/spacing[2]),0)
+  k_max = min(<int_t>((point_z+r_max)/spacing[2])+1,counts[2])
 
   r_min2 = r_min*r_min
   r_max2 = r_max*r_max
-  i = i_min
-  while i<i_max:
+  for i in range(i_min,i_max):
     dx  = point_x-i*spacing[0]
     dx2 = dx*dx
-    j = j_min
-    while j<j_max:
+    for j in range(j_min,j_max):
       dy  = point_y-j*spacing[1]
       dy2 = dy*dy
       dx2dy2 = dx2 + dy2
       if dx2dy2 < r_max2:
-        k = k_min
-        while k<k_max:
+        for k in range(k_min,k_max):
           dz  = point_z-k*spacing[2]
           dz2 = dz*dz
           r2 = dx2dy2 + dz2
@@ -278,11 +430,282 @@ cpdef fraction_r4inv_low_dielectric(\
             if grid[i,j,k]<1:
               I_low_dielectric += r4inv
             I_total += r4inv
-          k += 1
-      j += 1
-    i += 1
   return I_low_dielectric/I_total
 
+# The integrals above are the same at every grid point
+# except for the low dielectric indicator, so they can be written as
+# a sum over a fixed stencil of grid offsets with r**(-4) weights.
+_r4inv_stencils = {}
+
+def r4inv_stencil(spacing, r_min, r_max, cache_dir=None):
+  """
+  Returns (offsets, weights) for the grid points with r_min < r < r_max
+  from a grid point. offsets is an N x 3 integer array and
+  weights is r**(-4). Stencils are kept in memory and,
+  if cache_dir is not None, saved to and loaded from that directory.
+  """
+  spacing = np.array(spacing, dtype=np.float)
+  key = tuple(spacing) + (float(r_min), float(r_max))
+  if key in _r4inv_stencils:
+    return _r4inv_stencils[key]
+
+  stencil_FN = None
+  if cache_dir is not None:
+    stencil_FN = os.path.join(cache_dir, 'r4inv_stencil_' + \
+      '_'.join(['%.6g'%x for x in key]) + '.npz')
+    if os.path.isfile(stencil_FN):
+      stencil_F = np.load(stencil_FN)
+      _r4inv_stencils[key] = (stencil_F['offsets'], stencil_F['weights'])
+      stencil_F.close()
+      return _r4inv_stencils[key]
+
+  h = (r_max/spacing).astype(np.int) + 1
+  offsets = np.mgrid[-h[0]:h[0]+1,-h[1]:h[1]+1,-h[2]:h[2]+1].reshape((3,-1)).T
+  r2 = np.sum(np.square(offsets*spacing),1)
+  inside = (r2 < r_max*r_max) & (r2 > r_min*r_min)
+  offsets = np.ascontiguousarray(offsets[inside], dtype=np.int)
+  weights = 1./np.square(r2[inside])
+
+  if stencil_FN is not None:
+    try:
+      os.makedirs(cache_dir)
+    except OSError:
+      if not os.path.isdir(cache_dir):
+        raise
+    # Write to a temporary file and rename it,
+    # so that other processes never load an incomplete stencil
+    tmp_FN = os.path.join(cache_dir, \
+      '.tmp%d.'%os.getpid() + os.path.basename(stencil_FN))
+    try:
+      F = open(tmp_FN,'wb')
+      np.savez(F, offsets=offsets, weights=weights)
+      F.close()
+    except:
+      if os.path.isfile(tmp_FN):
+        os.remove(tmp_FN)
+      raise
+    os.rename(tmp_FN, stencil_FN)
+  _r4inv_stencils[key] = (offsets, weights)
+  return _r4inv_stencils[key]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef _stencil_sums(float_t[:,:,::1] low_dielectric, \
+    int_t[:,::1] offsets, float_t[::1] weights, int nthreads):
+  cdef int_t i, j, k, o, a, b, c, noffsets
+  cdef int_t counts[3]
+  cdef float_t I_low_dielectric, I_total
+  cdef float_t[:,:,::1] I_low_dielectric_v, I_total_v
+
+  for a in range(3):
+    counts[a] = low_dielectric.shape[a]
+  noffsets = offsets.shape[0]
+  I_low_dielectric_grid = np.zeros((counts[0],counts[1],counts[2]))
+  I_total_grid = np.zeros((counts[0],counts[1],counts[2]))
+  I_low_dielectric_v = I_low_dielectric_grid
+  I_total_v = I_total_grid
+  for i in prange(counts[0], nogil=True, \
+      num_threads=nthreads, schedule='dynamic'):
+    for j in range(counts[1]):
+      for k in range(counts[2]):
+        I_low_dielectric = 0.
+        I_total = 0.
+        for o in range(noffsets):
+          a = i + offsets[o,0]
+          b = j + offsets[o,1]
+          c = k + offsets[o,2]
+          if (a>=0) and (a<counts[0]) and (b>=0) and (b<counts[1]) \
+              and (c>=0) and (c<counts[2]):
+            I_low_dielectric = I_low_dielectric + \
+              weights[o]*low_dielectric[a,b,c]
+            I_total = I_total + weights[o]
+        I_low_dielectric_v[i,j,k] = I_low_dielectric
+        I_total_v[i,j,k] = I_total
+  return (I_low_dielectric_grid, I_total_grid)
+
+def _fft_size(n):
+  # The smallest integer >= n with no prime factors larger than 5
+  while True:
+    m = n
+    for p in [2,3,5]:
+      while m%p==0:
+        m /= p
+    if m==1:
+      return n
+    n += 1
+
+def _fft_sums(low_dielectric, offsets, weights):
+  if len(offsets)==0:
+    # As with the stencil, there are no grid points to sum over
+    return (np.zeros(low_dielectric.shape), np.zeros(low_dielectric.shape))
+  h = np.max(np.abs(offsets),0)
+  kernel = np.zeros(tuple(2*h+1))
+  kernel[tuple((offsets+h).T)] = weights
+  # Zero padding makes the circular convolution linear
+  shape = [_fft_size(low_dielectric.shape[d]+2*h[d]) for d in range(3)]
+  window = tuple([slice(h[d],h[d]+low_dielectric.shape[d]) for d in range(3)])
+  # The stencil is symmetric, so correlation is the same as convolution
+  kernel_f = np.fft.rfftn(kernel, shape)
+  sums = []
+  for indicator in [low_dielectric, np.ones(low_dielectric.shape)]:
+    sums.append(np.ascontiguousarray(np.fft.irfftn(\
+      np.fft.rfftn(indicator, shape)*kernel_f, shape)[window]))
+  # Remove round-off error
+  sums[0] = np.clip(sums[0], 0., sums[1])
+  return tuple(sums)
+
+def r4inv_integrals(low_dielectric, spacing, r_min, r_max, \
+    method='auto', cache_dir=None, nthreads=0):
+  """
+  For every grid point, integrals of r**(-4) between r_min and r_max
+  over the low dielectric region and over all grid points.
+  low_dielectric is 1 in the low dielectric region and 0 elsewhere.
+  The sums are over the stencil from r4inv_stencil, evaluated
+  directly ('stencil') or as FFT convolutions ('fft').
+  With 'auto', the method with fewer expected operations is used.
+  Returns (I_low_dielectric, I_total).
+  """
+  low_dielectric = np.ascontiguousarray(low_dielectric, dtype=np.float)
+  (offsets, weights) = r4inv_stencil(spacing, r_min, r_max, cache_dir)
+  if method=='auto':
+    npoints = np.prod(low_dielectric.shape)
+    h = np.max(np.abs(offsets),0) if len(offsets)>0 else np.zeros(3)
+    nfft = np.prod(np.array(low_dielectric.shape) + 2*h)
+    method = 'fft' if len(offsets)*npoints > 50*nfft*np.log2(nfft) \
+      else 'stencil'
+  if method=='fft':
+    return _fft_sums(low_dielectric, offsets, weights)
+  elif method=='stencil':
+    if nthreads<=0:
+      nthreads = openmp.omp_get_max_threads()
+    return _stencil_sums(low_dielectric, offsets, weights, nthreads)
+  else:
+    raise Exception('Unknown integration method '+method)
+
+# Parameters of a desolvation grid calculation
+cdef struct desolvation_problem:
+  int_t *MS_grid
+  int_t counts[3]
+  float_t spacing[3]
+  cell_list receptor_SAS_points
+  cell_list receptor_atoms
+  float_t *SAS_sphere_pts
+  int_t nsphere_points
+  float_t ligand_atom_radius
+  float_t probe_radius
+  float_t integration_cutoff
+  int_t box_half_width[3]
+  float_t *I_low_dielectric
+  float_t *I_total
+
+# The desolvation grid value at grid point (i,j,k).
+# Instead of copying the receptor MS grid, changes are
+# accumulated in delta, a small block around the grid point.
+# The integrals over the receptor MS grid are precomputed, so only
+# grid points with a change in dielectric need to be visited.
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef float_t _desolvation_at(desolvation_problem *p, \
+    int_t i, int_t j, int_t k, int_t *delta) nogil:
+  cdef int_t lo[3]
+  cdef int_t n[3]
+  cdef int_t c_lo[3]
+  cdef int_t c_hi[3]
+  cdef int_t a, b, c, cell, m, point, sphere_i, d, ind, val
+  cdef int_t n_newly_inaccessible_SAS_points
+  cdef float_t grid_point_x, grid_point_y, grid_point_z
+  cdef float_t SAS_point_x, SAS_point_y, SAS_point_z
+  cdef float_t dx, dy, dz, r2, r_min2, r_max2, ligand_atom_radius2
+  cdef float_t I_low_dielectric
+  cdef cell_list *h = &p.receptor_SAS_points
+
+  grid_point_x = i*p.spacing[0]
+  grid_point_y = j*p.spacing[1]
+  grid_point_z = k*p.spacing[2]
+  ligand_atom_radius2 = p.ligand_atom_radius*p.ligand_atom_radius
+
+  ind = (i*p.counts[1] + j)*p.counts[2] + k
+  I_low_dielectric = p.I_low_dielectric[ind]
+
+  # Count SAS points that are made solvent inaccessible by the ligand atom
+  n_newly_inaccessible_SAS_points = 0
+  _neighbor_cells(h, grid_point_x, grid_point_y, grid_point_z, c_lo, c_hi)
+  for a in range(c_lo[0],c_hi[0]):
+    for b in range(c_lo[1],c_hi[1]):
+      for c in range(c_lo[2],c_hi[2]):
+        cell = (a*h.ncells[1] + b)*h.ncells[2] + c
+        for m in range(h.first[cell],h.first[cell+1]):
+          point = h.items[m]
+          dx = h.coords[3*point] - grid_point_x
+          dy = h.coords[3*point+1] - grid_point_y
+          dz = h.coords[3*point+2] - grid_point_z
+          if (dx*dx + dy*dy + dz*dz)<ligand_atom_radius2:
+            n_newly_inaccessible_SAS_points += 1
+
+  if n_newly_inaccessible_SAS_points==0:
+    # If there are no newly inaccessible SAS points,
+    # the integrals are over the receptor MS grid.
+    return I_low_dielectric/p.I_total[ind]
+
+  lo[0] = i - p.box_half_width[0]
+  lo[1] = j - p.box_half_width[1]
+  lo[2] = k - p.box_half_width[2]
+  for d in range(3):
+    n[d] = 2*p.box_half_width[d] + 1
+  memset(delta, 0, n[0]*n[1]*n[2]*sizeof(int_t))
+
+  # Find new SAS points around the ligand atom and
+  # increment the marks of the grid points within a probe radius
+  for sphere_i in range(p.nsphere_points):
+    SAS_point_x = p.SAS_sphere_pts[3*sphere_i] + grid_point_x
+    SAS_point_y = p.SAS_sphere_pts[3*sphere_i+1] + grid_point_y
+    SAS_point_z = p.SAS_sphere_pts[3*sphere_i+2] + grid_point_z
+    if not _clashes(&p.receptor_atoms, SAS_point_x, SAS_point_y, SAS_point_z):
+      _mark_inside_sphere(delta, lo, n, p.counts, p.spacing, \
+        SAS_point_x, SAS_point_y, SAS_point_z, p.probe_radius, \
+        1, 1, lo[0], lo[0]+n[0])
+
+  # Decrement the marks of grid points within a probe radius
+  # of newly inaccessible SAS points
+  for a in range(c_lo[0],c_hi[0]):
+    for b in range(c_lo[1],c_hi[1]):
+      for c in range(c_lo[2],c_hi[2]):
+        cell = (a*h.ncells[1] + b)*h.ncells[2] + c
+        for m in range(h.first[cell],h.first[cell+1]):
+          point = h.items[m]
+          dx = h.coords[3*point] - grid_point_x
+          dy = h.coords[3*point+1] - grid_point_y
+          dz = h.coords[3*point+2] - grid_point_z
+          if (dx*dx + dy*dy + dz*dz)<ligand_atom_radius2:
+            _mark_inside_sphere(delta, lo, n, p.counts, p.spacing, \
+              h.coords[3*point], h.coords[3*point+1], h.coords[3*point+2], \
+              p.probe_radius, -1, 1, lo[0], lo[0]+n[0])
+
+  # Correct the low dielectric integral for grid points
+  # where the dielectric changed. The region inside the ligand vdW radius
+  # is low dielectric, but it is not blotted because the integrals
+  # start at that radius.
+  r_min2 = ligand_atom_radius2
+  r_max2 = p.integration_cutoff*p.integration_cutoff
+  for a in range(_imax(lo[0],0),_imin(lo[0]+n[0],p.counts[0])):
+    for b in range(_imax(lo[1],0),_imin(lo[1]+n[1],p.counts[1])):
+      for c in range(_imax(lo[2],0),_imin(lo[2]+n[2],p.counts[2])):
+        d = ((a-lo[0])*n[1] + (b-lo[1]))*n[2] + (c-lo[2])
+        if delta[d]==0:
+          continue
+        dx = (a-i)*p.spacing[0]
+        dy = (b-j)*p.spacing[1]
+        dz = (c-k)*p.spacing[2]
+        r2 = dx*dx + dy*dy + dz*dz
+        if (r2 < r_max2) and (r2 > r_min2):
+          val = p.MS_grid[(a*p.counts[1] + b)*p.counts[2] + c]
+          if (val<1) and not (val+delta[d]<1):
+            I_low_dielectric -= 1/(r2*r2)
+          elif (val+delta[d]<1) and not (val<1):
+            I_low_dielectric += 1/(r2*r2)
+  return I_low_dielectric/p.I_total[ind]
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
@@ -295,135 +718,78 @@ cpdef calc_desolvationGrid(int_t[:,:,:] receptor_MS_grid, \
     float_t LJ_r_max, \
     float_t ligand_atom_radius, \
     float_t probe_radius, \
-    float_t integration_cutoff):
-  cdef size_t i, j, k, n
-  cdef int_t nreceptor_SAS_points
-  cdef float_t SAS_x_min, SAS_x_max, SAS_y_min, SAS_y_max, SAS_z_min, SAS_z_max
-  cdef float_t clash_filter_r
-  cdef float_t rec_x_min, rec_x_max, rec_y_min, rec_y_max, rec_z_min, rec_z_max
-  cdef float_t ligand_atom_radius2
-  cdef float_t grid_point_x, grid_point_y, grid_point_z
-  cdef np.ndarray[float_t, ndim=3] desolvationGrid
+    float_t integration_cutoff, \
+    int nthreads=0, \
+    method='auto', \
+    cache_dir=None):
+  cdef int_t i, j, k, d, box_size
+  cdef int_t *delta
+  cdef desolvation_problem p
+  cdef float_t[:,:,::1] desolvationGrid_v
+  cdef int_t[:,:,::1] MS_grid_v
+  cdef float_t[:,::1] SAS_sphere_pts_v
+  cdef float_t[:,:,::1] I_low_dielectric_v, I_total_v
+
+  if nthreads<=0:
+    nthreads = openmp.omp_get_max_threads()
+
+  MS_grid = np.ascontiguousarray(receptor_MS_grid, dtype=np.int)
+  MS_grid_v = MS_grid
+  p.MS_grid = &MS_grid_v[0,0,0]
+  for d in range(3):
+    p.counts[d] = counts[d]
+    p.spacing[d] = spacing[d]
+    # Modified grid points are within the new SAS points and a probe radius
+    p.box_half_width[d] = \
+      <int_t>((ligand_atom_radius + 2*probe_radius)/spacing[d]) + 2
+  box_size = (2*p.box_half_width[0]+1)*(2*p.box_half_width[1]+1)* \
+    (2*p.box_half_width[2]+1)
+
+  # Integrals over the receptor MS grid
+  (I_low_dielectric, I_total) = r4inv_integrals(MS_grid<1, \
+    np.asarray(spacing), ligand_atom_radius, integration_cutoff, \
+    method, cache_dir, nthreads)
+  I_low_dielectric_v = I_low_dielectric
+  I_total_v = I_total
+  p.I_low_dielectric = &I_low_dielectric_v[0,0,0]
+  p.I_total = &I_total_v[0,0,0]
+
+  # Spatial hashes of receptor SAS points and atoms
+  SAS_points = np.ascontiguousarray(receptor_SAS_points, \
+    dtype=np.float).reshape((-1,3))
+  SAS_cell_size = ligand_atom_radius if ligand_atom_radius>0. else 1.
+  SAS_r2 = np.zeros(0)
+  (SAS_origin, SAS_ncells, SAS_first, SAS_items) = \
+    _spatial_hash(SAS_points, SAS_cell_size)
+  p.receptor_SAS_points = _as_cell_list(SAS_points, SAS_r2, \
+    SAS_origin, SAS_ncells, SAS_first, SAS_items, SAS_cell_size)
+
+  atoms = np.ascontiguousarray(receptor_coordinates, dtype=np.float)
+  atoms_r2 = np.ascontiguousarray(LJ_r2, dtype=np.float)
+  atoms_cell_size = LJ_r_max if LJ_r_max>0. else 1.
+  (atoms_origin, atoms_ncells, atoms_first, atoms_items) = \
+    _spatial_hash(atoms, atoms_cell_size)
+  p.receptor_atoms = _as_cell_list(atoms, atoms_r2, \
+    atoms_origin, atoms_ncells, atoms_first, atoms_items, atoms_cell_size)
+
+  sphere_pts = np.ascontiguousarray(SAS_sphere_pts, dtype=np.float)
+  SAS_sphere_pts_v = sphere_pts
+  p.SAS_sphere_pts = &SAS_sphere_pts_v[0,0]
+  p.nsphere_points = SAS_sphere_pts_v.shape[0]
+  p.ligand_atom_radius = ligand_atom_radius
+  p.probe_radius = probe_radius
+  p.integration_cutoff = integration_cutoff
 
-  # To use for new SAS points
-  cdef size_t atom_j, sphere_i, d
-  cdef int_t clash
-  cdef int_t nreceptor_atoms, nsphere_points, n_newly_inaccessible_SAS_points
-  cdef float_t SAS_point_x, SAS_point_y, SAS_point_z
-  cdef float_t dx, dy, dz
-  cdef np.ndarray[int_t, ndim=3] grid_c
-    
-  nreceptor_SAS_points = receptor_SAS_points.shape[0]
-  nreceptor_atoms = len(LJ_r2)
-  nsphere_points = len(SAS_sphere_pts)
-
-  ligand_atom_radius2 = ligand_atom_radius*ligand_atom_radius
-  # Receptor atoms that clash with the ligand atom SAS will be within
-  # the SAS and maximum LJ radius
-  clash_filter_r = ligand_atom_radius + probe_radius + LJ_r_max
-  
   desolvationGrid = np.zeros(shape=tuple(counts), dtype=np.float)
-  
-  for i in xrange(counts[0]):
-    grid_point_x = i*spacing[0]
-    SAS_x_min = grid_point_x - ligand_atom_radius
-    SAS_x_max = grid_point_x + ligand_atom_radius
-    receptor_SAS_points_i = [n for n in xrange(nreceptor_SAS_points) \
-      if (receptor_SAS_points[n,0]>SAS_x_min) and \
-         (receptor_SAS_points[n,0]<SAS_x_max)]
-    rec_x_min = grid_point_x - clash_filter_r
-    rec_x_max = grid_point_x + clash_filter_r
-    receptor_coordinates_i = [n for n in xrange(nreceptor_atoms) \
-      if (receptor_coordinates[n,0]>rec_x_min) and \
-         (receptor_coordinates[n,0]<rec_x_max)]
-    for j in xrange(counts[1]):
-      grid_point_y = j*spacing[1]
-      SAS_y_min = grid_point_y - ligand_atom_radius
-      SAS_y_max = grid_point_y + ligand_atom_radius
-      receptor_SAS_points_ij = [n for n in receptor_SAS_points_i \
-        if (receptor_SAS_points[n,1]>SAS_y_min) and \
-           (receptor_SAS_points[n,1]<SAS_y_max)]
-      rec_y_min = grid_point_y - clash_filter_r
-      rec_y_max = grid_point_y + clash_filter_r
-      receptor_coordinates_ij = [n for n in receptor_coordinates_i \
-        if (receptor_coordinates[n,1]>rec_y_min) and \
-           (receptor_coordinates[n,1]<rec_y_max)]
-      for k in xrange(counts[2]):
-        grid_point_z = k*spacing[2]
-        SAS_z_min = grid_point_z - ligand_atom_radius
-        SAS_z_max = grid_point_z + ligand_atom_radius
-        receptor_SAS_points_ijk = [n for n in receptor_SAS_points_ij \
-          if (receptor_SAS_points[n,2]>SAS_z_min) and \
-             (receptor_SAS_points[n,2]<SAS_z_max)]
-
-        # Find SAS points that are made solvent inaccessible by the ligand atom
-        newly_inaccessible_SAS_points = []
-        for n in receptor_SAS_points_ijk:
-          dx = receptor_SAS_points[n,0]-grid_point_x
-          dy = receptor_SAS_points[n,1]-grid_point_y
-          dz = receptor_SAS_points[n,2]-grid_point_z
-          if (dx*dx + dy*dy + dz*dz)<ligand_atom_radius2:
-            newly_inaccessible_SAS_points.append(\
-              np.copy(receptor_SAS_points[n,:]))
-
-        n_newly_inaccessible_SAS_points = len(newly_inaccessible_SAS_points)
-        if n_newly_inaccessible_SAS_points==0:
-          # If there are no newly inaccessible SAS points, 
-          # perform the numerical integrals over the receptor MS grid.
-          desolvationGrid[i,j,k] = fraction_r4inv_low_dielectric(\
-              receptor_MS_grid, spacing, counts, \
-              grid_point_x, grid_point_y, grid_point_z, \
-              ligand_atom_radius, integration_cutoff)
-        else:
-          rec_z_min = grid_point_z - clash_filter_r
-          rec_z_max = grid_point_z + clash_filter_r
-          receptor_coordinates_ijk = [n for n in receptor_coordinates_ij \
-            if (receptor_coordinates[n,2]>rec_z_min) and \
-               (receptor_coordinates[n,2]<rec_z_max)]
-
-          grid_c = np.copy(receptor_MS_grid)
-
-          # Find new SAS points around the ligand atom and 
-          # increment the marks of the grid points within a probe radius
-          sphere_i = 0
-          while sphere_i < nsphere_points:
-            # Propose a point at the SAS of the atom
-            SAS_point_x = SAS_sphere_pts[sphere_i,0] + grid_point_x
-            SAS_point_y = SAS_sphere_pts[sphere_i,1] + grid_point_y
-            SAS_point_z = SAS_sphere_pts[sphere_i,2] + grid_point_z
-            
-            # Check if the point clashes with a receptor atom
-            clash = 0
-            for atom_j in receptor_coordinates_ijk:
-              dx = receptor_coordinates[atom_j,0] - SAS_point_x
-              dy = receptor_coordinates[atom_j,1] - SAS_point_y
-              dz = receptor_coordinates[atom_j,2] - SAS_point_z
-              if (dx*dx + dy*dy + dz*dz) < LJ_r2[atom_j]:
-                clash = 1
-                break
-            if clash==0:
-              # If there are no clashes, 
-              # increment the marks of the grid points within a probe radius
-              increment_inside_sphere(grid_c, spacing, counts, \
-                SAS_point_x, SAS_point_y, SAS_point_z, probe_radius)
-            sphere_i += 1
-
-          # Decrement of the marks of newly inaccessible grid points
-          n = 0
-          while n < n_newly_inaccessible_SAS_points:
-            decrement_inside_sphere(grid_c, spacing, counts, \
-              newly_inaccessible_SAS_points[n][0], \
-              newly_inaccessible_SAS_points[n][1], \
-              newly_inaccessible_SAS_points[n][2], probe_radius)
-            n += 1
-
-          # Blot the region inside the ligand vdW as low dielectric
-          set_inside_sphere_to(grid_c, spacing, counts, \
-            grid_point_x, grid_point_y, grid_point_z, \
-            ligand_atom_radius, 0)
-
-          desolvationGrid[i,j,k] = fraction_r4inv_low_dielectric(grid_c, \
-            spacing, counts, grid_point_x, grid_point_y, grid_point_z, \
-            ligand_atom_radius, integration_cutoff)
+  desolvationGrid_v = desolvationGrid
+
+  # Each thread has its own block of grid changes
+  with nogil, parallel(num_threads=nthreads):
+    delta = <int_t *>malloc(box_size*sizeof(int_t))
+    for i in prange(p.counts[0], schedule='dynamic'):
+      for j in range(p.counts[1]):
+        for k in range(p.counts[2]):
+          desolvationGrid_v[i,j,k] = _desolvation_at(&p, i, j, k, delta)
+    free(delta)
 
   return desolvationGrid
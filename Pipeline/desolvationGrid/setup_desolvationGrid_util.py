@@ -5,7 +5,9 @@ import numpy
 
 extensions = [
   Extension("desolvationGrid_util", ["desolvationGrid_util.pyx"],
-    include_dirs = [numpy.get_include()])]
+    include_dirs = [numpy.get_include()],
+    extra_compile_args = ['-fopenmp'],
+    extra_link_args = ['-fopenmp'])]
 
 setup(
     ext_modules = cythonize(extensions)
@@ -1,42 +1,171 @@
-import sys
-inFN = sys.argv[-1]
+# Converts UCSF DOCK 6 output from mol2 to netCDF.
+# Many files can be converted in one call, using a pool of processes.
+# Poses are read one at a time and written to chunked variables.
+# The MD5 checksum of the mol2 file is stored in the netCDF file,
+# so outputs that are up to date are skipped.
 
-if inFN.endswith('.mol2'):
-  outFN = inFN[:-5]+'.nc'
-elif inFN.endswith('.mol2.gz'):
-  outFN = inFN[:-8]+'.nc'
+import argparse
+parser = argparse.ArgumentParser(\
+  description='Converts dock6 mol2 files to netCDF')
+parser.add_argument('FNs', nargs='*', help='mol2 or mol2.gz files')
+parser.add_argument('--list', default=None, \
+  help='File with a list of mol2 files, one per line')
+parser.add_argument('--complevel', default=9, type=int, \
+  help='zlib compression level, from 0 (none) to 9')
+parser.add_argument('--chunk_poses', default=100, type=int, \
+  help='Number of poses in each chunk of the netCDF variables')
+parser.add_argument('--cores', default=1, type=int, \
+  help='Number of processes')
+parser.add_argument('--keep_mol2', action='store_true', default=False, \
+  help='Keeps the mol2 file after conversion')
+parser.add_argument('--force', action='store_true', default=False, \
+  help='Converts files even if the output is up to date')
+args = parser.parse_args()
 
-import os
-if os.path.isfile(outFN):
-  sys.exit()
+import os, sys
+import numpy as np
 
-import AlGDock.IO
-IO_dock6_mol2 = AlGDock.IO.dock6_mol2()
-(confs, Es) = IO_dock6_mol2.read(inFN)
+FNs = list(args.FNs)
+if args.list is not None:
+  F = open(args.list,'r')
+  FNs += [line.strip() for line in F if line.strip()!='']
+  F.close()
 
-if confs==[]:
-  F = open(inFN,'w')
+def md5sum(FN):
+  import hashlib
+  h = hashlib.md5()
+  F = open(FN,'rb')
+  block = F.read(2**20)
+  while block!='':
+    h.update(block)
+    block = F.read(2**20)
   F.close()
-  sys.exit()
+  return h.hexdigest()
 
-import numpy as np
-confs = np.array(confs)
-confs = np.array(confs)/10. # Convert Angstroms to nanometers
-
-from netCDF4 import Dataset
-dock6_nc = Dataset(outFN,'w',format='NETCDF4')
-dock6_nc.createDimension('n_poses', confs.shape[0])
-dock6_nc.createDimension('n_atoms', confs.shape[1])
-dock6_nc.createDimension('n_cartesian', confs.shape[2])
-dock6_nc.createDimension('one',1)
-dock6_nc.createVariable('confs','f4',('n_poses','n_atoms','n_cartesian'), \
-  zlib=True, complevel=9, shuffle=True)
-dock6_nc.variables['confs'][:,:,:] = confs
-for key in Es.keys():
+def create_variable(dock6_nc, key, dimensions, chunksizes):
   datatype = 'i2' if key=='Cluster Size' else 'f4'
-  dock6_nc.createVariable(key, datatype,('n_poses'), \
-    zlib=True, complevel=9, shuffle=True)
-  dock6_nc.variables[key][:] = np.array(Es[key])
-dock6_nc.close()
+  return dock6_nc.createVariable(key, datatype, dimensions, \
+    zlib=(args.complevel>0), complevel=max(args.complevel,1), shuffle=True, \
+    chunksizes=chunksizes)
+
+def convert(inFN):
+  """
+  Returns (inFN, status, number of poses)
+  """
+  if inFN.endswith('.mol2'):
+    outFN = inFN[:-5]+'.nc'
+  elif inFN.endswith('.mol2.gz'):
+    outFN = inFN[:-8]+'.nc'
+  else:
+    return (inFN, 'unknown file type', 0)
+  if not os.path.isfile(inFN):
+    return (inFN, 'missing', 0)
+  if os.path.getsize(inFN)==0:
+    return (inFN, 'no poses', 0)
+
+  from netCDF4 import Dataset
+  source_md5 = md5sum(inFN)
+  if os.path.isfile(outFN) and not args.force:
+    dock6_nc = Dataset(outFN,'r')
+    stored_md5 = getattr(dock6_nc, 'source_md5', None)
+    dock6_nc.close()
+    # Files from earlier versions do not have a checksum
+    if (stored_md5 is None) or (stored_md5==source_md5):
+      return (inFN, 'up to date', 0)
+
+  import AlGDock.IO
+  IO_dock6_mol2 = AlGDock.IO.dock6_mol2()
+
+  # The output is written to a temporary file
+  # so that an incomplete file is never mistaken for a result
+  tmpFN = outFN + '.tmp'
+  dock6_nc = None
+  nposes = 0
+  confs = []
+  Es = []
+
+  def flush():
+    dock6_nc.variables['confs'][nposes:nposes+len(confs),:,:] = \
+      np.array(confs)
+    for key in dock6_nc.variables.keys():
+      if key!='confs':
+        dock6_nc.variables[key][nposes:nposes+len(Es)] = \
+          np.array([E.get(key,0) for E in Es])
+    return nposes + len(confs)
+
+  try:
+    # Convert Angstroms to nanometers
+    for (crd, E_model) in IO_dock6_mol2.iread(inFN, multiplier=0.1):
+      if dock6_nc is None:
+        dock6_nc = Dataset(tmpFN,'w',format='NETCDF4')
+        dock6_nc.source_md5 = source_md5
+        dock6_nc.createDimension('n_poses', None)
+        dock6_nc.createDimension('n_atoms', crd.shape[0])
+        dock6_nc.createDimension('n_cartesian', crd.shape[1])
+        dock6_nc.createDimension('one',1)
+        create_variable(dock6_nc, 'confs', \
+          ('n_poses','n_atoms','n_cartesian'), \
+          (args.chunk_poses, crd.shape[0], crd.shape[1]))
+      E = dict(E_model)
+      for key in E.keys():
+        if not key in dock6_nc.variables.keys():
+          create_variable(dock6_nc, key, ('n_poses',), (args.chunk_poses,))
+          if nposes>0:
+            dock6_nc.variables[key][:nposes] = np.zeros(nposes)
+      confs.append(crd)
+      Es.append(E)
+      if len(confs)==args.chunk_poses:
+        nposes = flush()
+        confs = []
+        Es = []
+    if dock6_nc is not None:
+      if len(confs)>0:
+        nposes = flush()
+      dock6_nc.close()
+  except:
+    if dock6_nc is not None:
+      dock6_nc.close()
+    if os.path.isfile(tmpFN):
+      os.remove(tmpFN)
+    raise
+
+  if nposes==0:
+    # An empty mol2 file indicates that there are no poses
+    F = open(inFN,'w')
+    F.close()
+    return (inFN, 'no poses', 0)
+
+  os.rename(tmpFN, outFN)
+  if not args.keep_mol2:
+    os.remove(inFN)
+  return (inFN, 'converted', nposes)
+
+def convert_safely(inFN):
+  # Errors are reported without stopping the other conversions
+  try:
+    return convert(inFN)
+  except Exception as e:
+    return (inFN, 'failed: %s'%repr(e), 0)
+
+if args.cores>1 and len(FNs)>1:
+  import multiprocessing
+  pool = multiprocessing.Pool(args.cores)
+  results = pool.imap_unordered(convert_safely, FNs)
+else:
+  results = (convert_safely(FN) for FN in FNs)
+
+nfailed = 0
+for (inFN, status, nposes) in results:
+  if status=='converted':
+    print 'Converted %d poses from %s'%(nposes, inFN)
+  else:
+    print '%s: %s'%(inFN, status)
+  if status.startswith('failed'):
+    nfailed += 1
+
+if args.cores>1 and len(FNs)>1:
+  pool.close()
+  pool.join()
 
-os.remove(inFN)
+if nfailed>0:
+  sys.exit(1)
@@ -38,48 +38,92 @@ parser.add_argument('--dest_directory', default='ligand_aligned')
 parser.add_argument('--pylab', action='store_true')
 args = parser.parse_args()
 
+import inspect
+dirs = {}
+dirs['script'] = os.path.dirname(os.path.abspath(\
+  inspect.getfile(inspect.currentframe())))
+execfile(os.path.join(dirs['script'],'_masses.py'))
+execfile(os.path.join(dirs['script'],'_external_paths.py'))
+command_paths = findPaths(['dock6'])
+dirs['dock6'] = os.path.abspath(os.path.dirname(command_paths['dock6']))
+
+import numpy as np
+
+# Fixed-width columns of pdb ATOM and HETATM records
+pdb_columns = [('record',0,6), ('resname',17,20), ('res_id',23,26), \
+  ('x',30,38), ('y',38,46), ('z',46,54), ('element',76,78)]
+pdb_dtype = np.dtype({'names':[c[0] for c in pdb_columns], \
+  'formats':['S%d'%(c[2]-c[1]) for c in pdb_columns], \
+  'offsets':[c[1] for c in pdb_columns], 'itemsize':80})
+
+def read_chain(chainFN):
+  """
+  Returns the ATOM and HETATM lines of a pdb file
+  and a structured array with their fields
+  """
+  F = open(chainFN,'r')
+  lines = [line for line in F.read().split('\n') \
+    if line.startswith('ATOM  ') or line.startswith('HETATM')]
+  F.close()
+  if lines==[]:
+    return (lines, np.zeros(0, dtype=pdb_dtype))
+  # All records are parsed at once from lines padded to 80 characters
+  fields = np.frombuffer(''.join([line[:80].ljust(80) for line in lines]), \
+    dtype=pdb_dtype)
+  return (lines, fields)
+
+def add_records(records, key, pdb, crd, element=None):
+  if key in records:
+    records[key]['pdb'] += pdb
+    records[key]['crd'] = np.vstack((records[key]['crd'], crd))
+    if element is not None:
+      records[key]['element'] = \
+        np.concatenate((records[key]['element'], element))
+  else:
+    records[key] = {'pdb':pdb, 'crd':crd}
+    if element is not None:
+      records[key]['element'] = element
+
 # Loads records for
 # receptors and
 # ligands that are selected or not excluded
 ligands = {} # Ligand records
 receptors = {}
 
+selection = set(selection)
+exclude = set(exclude)
+exclude_resname = set(exclude_resname)
+
 import glob
-chainFNs = glob.glob(os.path.join(args.source_directory,'*'))
+chainFNs = sorted(glob.glob(os.path.join(args.source_directory,'*')))
 for chainFN in chainFNs:
   basename = os.path.basename(chainFN)
   pdb_id = basename[:4]
   chain_id = basename[4]
-  F = open(chainFN,'r')
-  lines = F.read().split('\n')
-  F.close()
-  for line in lines:
-    if line.startswith('ATOM  '):
-      key = (pdb_id,chain_id)
-      if not key in receptors.keys():
-        receptors[key] = {'pdb':[]}
-      receptors[key]['pdb'].append(line)
-    if line.startswith('HETATM'):
-      resname = line[17:20].strip()
-      res_id = int(line[23:26])
-      key = (pdb_id,chain_id,resname,res_id)
-      if (len(selection)>0) and (key not in selection):
-        continue
-      if resname in exclude_resname:
-        continue
-      if key in exclude:
-        continue
-      if not key in ligands.keys():
-        ligands[key] = {'pdb':[]}
-      ligands[key]['pdb'].append(line)
-
-# Extract receptor coordinates
-import numpy as np
-
-for key in receptors.keys():
-  receptors[key]['crd'] = np.array([\
-    (float(line[30:38]),float(line[38:46]),float(line[46:54])) \
-      for line in receptors[key]['pdb']])
+  (lines, fields) = read_chain(chainFN)
+  crd = np.column_stack([fields[c].astype(float) for c in ['x','y','z']]) \
+    if len(lines)>0 else np.zeros((0,3))
+
+  atom_ind = np.flatnonzero(fields['record']=='ATOM  ')
+  if len(atom_ind)>0:
+    add_records(receptors, (pdb_id,chain_id), \
+      [lines[n] for n in atom_ind], crd[atom_ind])
+
+  # Group HETATM records by residue
+  het_ind = np.flatnonzero(fields['record']=='HETATM')
+  het_groups = {}
+  for (n, resname, res_id) in zip(het_ind, \
+      np.char.strip(fields['resname'][het_ind]), \
+      fields['res_id'][het_ind].astype(int)):
+    het_groups.setdefault((pdb_id,chain_id,resname,res_id), []).append(n)
+  for key in het_groups.keys():
+    if (len(selection)>0) and (key not in selection):
+      continue
+    if (key[2] in exclude_resname) or (key in exclude):
+      continue
+    ind = np.array(het_groups[key])
+    add_records(ligands, key, [lines[n] for n in ind], crd[ind], \
+      fields['element'][ind])
 
 # Remove ligands which have fewer than minimum_natoms atoms
 for key in ligands.keys():
@@ -87,26 +131,17 @@ for key in ligands.keys():
     del ligands[key]
 
 # Calculate the center of mass for each ligand
-import inspect
-dirs = {}
-dirs['script'] = os.path.dirname(os.path.abspath(\
-  inspect.getfile(inspect.currentframe())))
-execfile(os.path.join(dirs['script'],'_masses.py'))
-execfile(os.path.join(dirs['script'],'_external_paths.py'))
-command_paths = findPaths(['dock6'])
-dirs['dock6'] = os.path.abspath(os.path.dirname(command_paths['dock6']))
-
 for key in ligands.keys():
-  ligands[key]['crd'] = np.array([\
-    (float(line[30:38]),float(line[38:46]),float(line[46:54])) \
-      for line in ligands[key]['pdb']])
-  ligMasses = [masses[line[76:78].strip().capitalize()] \
-    for line in ligands[key]['pdb']]
+  (elements, element_ind) = \
+    np.unique(ligands[key]['element'], return_inverse=True)
+  ligMasses = np.array([masses[element.strip().capitalize()] \
+    for element in elements])[element_ind]
   ligands[key]['com'] = \
-    [sum(ligands[key]['crd'][:,c]*ligMasses)/sum(ligMasses) for c in range(3)]
+    np.dot(ligMasses, ligands[key]['crd'])/np.sum(ligMasses)
   ligands[key]['dmax_COM2atom'] = \
     np.max(np.sqrt(np.sum((ligands[key]['crd']-ligands[key]['com'])**2,1)))
-com = np.array([ligands[key]['com'] for key in ligands.keys()])
+ligand_keys = sorted(ligands.keys())
+com = np.array([ligands[key]['com'] for key in ligand_keys])
 
 # Cluster ligand centers of mass
 import scipy.cluster.hierarchy as hierarchy
@@ -173,15 +208,12 @@ fig.savefig('figures/clusters.png')
 
 # Keep ligands in the largest cluster
 biggest_cluster = np.argmax(np.bincount(part))
-ligand_keys = ligands.keys()
-selected_ligand_keys = [ligand_keys[n] for n in range(len(ligands)) \
-  if part[n]==biggest_cluster]
-selected_com = np.array([ligands[key]['com'] for key in selected_ligand_keys])
+selected_ligand_keys = [ligand_keys[n] for n in \
+  np.flatnonzero(part==biggest_cluster)]
+selected_com = com[part==biggest_cluster]
 del com
-selected_receptor_keys = []
-for key in selected_ligand_keys:
-  if not (key[0],key[1]) in selected_receptor_keys:
-    selected_receptor_keys.append((key[0],key[1]))
+selected_receptor_keys = sorted(set([(key[0],key[1]) \
+  for key in selected_ligand_keys]))
 
 # Prepare output
 def tee(val, F):
@@ -205,8 +237,8 @@ for key in selected_ligand_keys:
   F.close()
 
 # Measure the range of the binding site
-com_min = np.array([min(selected_com[:,c]) for c in range(3)])
-com_max = np.array([max(selected_com[:,c]) for c in range(3)])
+com_min = np.min(selected_com,0)
+com_max = np.max(selected_com,0)
 site_center_aligned = (com_min+com_max)/2.
 dmax_COM2site_center = np.max(np.sqrt(\
   np.sum((selected_com-site_center_aligned)**2,1)))
@@ -216,8 +248,9 @@ if site_R is None:
 # Measure the size of the grid
 # The grid will be larger than the site by at least
 # the maximum distance from any ligand atom to its center of mass
-dmax_COM2atom = np.max(np.array([ligands[key]['dmax_COM2atom'] \
-  for key in selected_ligand_keys]))
+dmax_COM2atom_ligands = np.array([ligands[key]['dmax_COM2atom'] \
+  for key in selected_ligand_keys])
+dmax_COM2atom = np.max(dmax_COM2atom_ligands)
 half_edge_length = np.ceil(dmax_COM2site_center + dmax_COM2atom)
 origin_aligned = site_center_aligned - half_edge_length
 
@@ -236,8 +269,7 @@ tee('site_R = ' + repr(site_R) + '\n',logF)
 tee('# Maximum distance from ligand COM to any atom: ' + \
   repr(dmax_COM2atom) + '\n', logF)
 tee('# in ligand '+'{0[0]}{0[1]}_{0[2]}_{0[3]}'.format(selected_ligand_keys[\
-  np.argmax(np.array([ligands[key]['dmax_COM2atom'] \
-    for key in selected_ligand_keys]))]) + '\n', logF)
+  np.argmax(dmax_COM2atom_ligands)]) + '\n', logF)
 tee('half_edge_length = ' + repr(half_edge_length) + '\n', logF)
 
 # Translate coordinates
@@ -253,35 +285,27 @@ for dest_directory in ['ligand_trans','receptor_trans','complex_trans']:
   else:
     os.system('rm %s/*'%dest_directory)
 
+def write_translated_pdb(FN, source_pdb, source_crds):
+  F = open(FN,'w')
+  F.write('\n'.join(['%s%8.3f%8.3f%8.3f%s'%(\
+    (line[:30],) + tuple(crd) + (line[54:],)) \
+    for (line, crd) in zip(source_pdb, source_crds)]))
+  F.close()
+
 # Write separate pdb files for all the ligands and complexes
 for key in selected_ligand_keys:
   FN = '{0[0]}{0[1]}_{0[2]}_{0[3]}.pdb'.format(key)
-  for (dest_directory, source_pdb, source_crds) in [\
-      ('ligand_trans', ligands[key]['pdb'], ligands[key]['crd_trans']), \
-      ('complex_trans', \
-        receptors[(key[0],key[1])]['pdb'] + ligands[key]['pdb'], \
-        np.vstack((receptors[(key[0],key[1])]['crd_trans'],
-                   ligands[key]['crd_trans'])))]:
-    pdb_trans = ['{0}{1[0]:8.3f}{1[1]:8.3f}{1[2]:8.3f}{2}'.format(\
-      source_pdb[n][:30],\
-      source_crds[n],\
-      source_pdb[n][54:]) for n in range(len(source_pdb))]
-    F = open(os.path.join(dest_directory,FN),'w')
-    F.write('\n'.join(pdb_trans))
-    F.close()
+  write_translated_pdb(os.path.join('ligand_trans',FN), \
+    ligands[key]['pdb'], ligands[key]['crd_trans'])
+  write_translated_pdb(os.path.join('complex_trans',FN), \
+    receptors[(key[0],key[1])]['pdb'] + ligands[key]['pdb'], \
+    np.vstack((receptors[(key[0],key[1])]['crd_trans'], \
+               ligands[key]['crd_trans'])))
 
 for key in selected_receptor_keys:
   FN = '{0[0]}{0[1]}.pdb'.format(key)
-  dest_directory = 'receptor_trans'
-  source_pdb = receptors[key]['pdb']
-  source_crds = receptors[key]['crd_trans']
-  pdb_trans = ['{0}{1[0]:8.3f}{1[1]:8.3f}{1[2]:8.3f}{2}'.format(\
-    source_pdb[n][:30],\
-    source_crds[n],\
-    source_pdb[n][54:]) for n in range(len(source_pdb))]
-  F = open(os.path.join(dest_directory,FN),'w')
-  F.write('\n'.join(pdb_trans))
-  F.close()
+  write_translated_pdb(os.path.join('receptor_trans',FN), \
+    receptors[key]['pdb'], receptors[key]['crd_trans'])
 
 logF.close()
 
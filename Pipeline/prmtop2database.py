@@ -17,6 +17,156 @@ varnames = ['POINTERS','TITLE','ATOM_NAME','AMBER_ATOM_TYPE','CHARGE','MASS',\
 mass2symbols = {12.01:'C',1.008:'H',19.00:'F',35.45:'Cl',79.90:'Br',126.9:'I',\
                 14.01:'N',16.00:'O',30.97:'P',32.06:'S', 65.4:'Zn'}
 
+def atom_list(names, values, format):
+  """
+  A comma-separated list of 'name: value'
+  """
+  return ", ".join(numpy.char.add(numpy.char.add(names, ': '), \
+    numpy.char.mod(format, values)))
+
+def database_text(prmtop, coords, name):
+  """
+  Returns the text of a MMTK database file
+  """
+  NATOM = prmtop['POINTERS'][0]
+  NTYPES = prmtop['POINTERS'][1]
+
+  # Modify atom names to be acceptable python variables
+  # and include the atom index
+  names = numpy.char.add(numpy.char.add(numpy.char.strip(\
+    numpy.char.replace(prmtop['ATOM_NAME'],"'","p")), 'i'), \
+    numpy.arange(len(prmtop['ATOM_NAME'])).astype(str))
+
+  ### Extract Lennard-Jones well depth and radii for each atom type
+  LJ_index = prmtop['NONBONDED_PARM_INDEX'][(NTYPES+1)*numpy.arange(NTYPES)]-1
+  A = prmtop['LENNARD_JONES_ACOEF'][LJ_index]
+  B = prmtop['LENNARD_JONES_BCOEF'][LJ_index]
+  nonzero = (A>=1.0e-6)
+  LJ_radius = numpy.zeros(NTYPES)
+  LJ_depth = numpy.zeros(NTYPES)
+  factor = 2 * A[nonzero] / B[nonzero]
+  LJ_radius[nonzero] = pow(factor, 1.0/6.0) * 0.5
+  LJ_depth[nonzero] = B[nonzero] / 2 / factor
+  # More useful for later calculations
+  root_LJ_depth = numpy.sqrt(LJ_depth)
+  LJ_diameter = LJ_radius*2
+
+  lines = ["name='%s'"%name]
+
+  (masses, mass_index) = numpy.unique(prmtop['MASS'], return_inverse=True)
+  for mass in masses:
+    if not mass in mass2symbols.keys():
+      raise Exception('Unknown atom with mass: %f!'%mass)
+  symbols = numpy.array([mass2symbols[mass] for mass in masses])[mass_index]
+  lines += list(numpy.char.add(numpy.char.add(numpy.char.add(\
+    names, " = Atom('"), symbols), "')"))
+
+  # The order of atoms in the prmtop file (not used by MMTK)
+  lines.append("prmtop_order = [" + ", ".join(names) + "]")
+
+  bonds = numpy.concatenate((prmtop['BONDS_INC_HYDROGEN'], \
+    prmtop['BONDS_WITHOUT_HYDROGEN'])).reshape((-1,3))[:,:2]/3
+  lines.append("bonds = [" + ", ".join(numpy.char.add(numpy.char.add(\
+    numpy.char.add(numpy.char.add('Bond(', names[bonds[:,0]]), ', '), \
+    names[bonds[:,1]]), ')')) + "]")
+
+  lines.append("amber12_atom_type = {" + atom_list(names, \
+    numpy.char.strip(prmtop['AMBER_ATOM_TYPE']), "'%s'") + "}")
+
+  # Write the charge, converted to units of electric charge
+  # AMBER prmtop files multiply the actual charge by 18.2223,
+  # hence the division
+  charge = prmtop['CHARGE']/18.2223
+  lines.append("amber_charge = {" + atom_list(names, charge, "'%f'") + "}")
+
+  # Write the grid scaling factors
+  # Because the grids are in units of kcal/mol,
+  # the scaling factors are multiplied by 4.184 to convert to kJ/mol
+  lines.append("scaling_factor_electrostatic = {" + \
+    atom_list(names, 4.184*charge, "%f") + "}")
+  type_index = prmtop['ATOM_TYPE_INDEX'][:NATOM]-1
+  lines.append("scaling_factor_LJr = {" + atom_list(names, \
+    4.184*root_LJ_depth[type_index]*(LJ_diameter[type_index]**6), "%f") + "}")
+  lines.append("scaling_factor_LJa = {" + atom_list(names, \
+    4.184*root_LJ_depth[type_index]*(LJ_diameter[type_index]**3), "%f") + "}")
+
+  # Write the generalized Born implicit solvent parameters.
+  # The radii will be converted from Angstroms to nanometers.
+  lines.append("scaling_factor_BornRadii = {" + \
+    atom_list(names, prmtop['RADII']/10., "%f") + "}")
+  lines.append("scaling_factor_BornScreening = {" + \
+    atom_list(names, prmtop['SCREEN'], "%f") + "}")
+
+  # Write the coordinates, converted from Angstroms to nanometers
+  if coords is not None:
+    crd = numpy.char.mod('%f', coords[:NATOM]/10.0)
+    lines.append("configurations = {")
+    lines.append("'default': Cartesian({" + ", ".join(\
+      numpy.char.add(numpy.char.add(numpy.char.add(numpy.char.add(\
+      numpy.char.add(numpy.char.add(numpy.char.add(names[:NATOM], ': ('), \
+      crd[:,0]), ', '), crd[:,1]), ', '), crd[:,2]), ')')) + "})}")
+  return '\n'.join(lines) + '\n'
+
+def read_inpcrd(FN):
+  """
+  Returns coordinates from an AMBER inpcrd file, in Angstroms
+  """
+  inpcrdF = open(FN,'r')
+  inpcrd = inpcrdF.read().split('\n')
+  inpcrdF.close()
+  NATOM = int(inpcrd[1].split()[0]) # Number of atoms
+  # Six fields of width 12 per line; a box may follow the coordinates
+  ncrd_lines = (3*NATOM+5)/6
+  data = ''.join(inpcrd[2:2+ncrd_lines])
+  data = data + ' '*(-len(data)%12)
+  return numpy.frombuffer(data, dtype='S12').astype(float)[:3*NATOM]\
+    .reshape((NATOM,3))
+
+def source_hash(prmtop_FN, inpcrd_FN):
+  import hashlib
+  h = hashlib.sha1()
+  for FN in [prmtop_FN, inpcrd_FN]:
+    if (FN is not None) and os.path.isfile(FN):
+      F = open(FN,'rb')
+      h.update(F.read())
+      F.close()
+  return h.hexdigest()
+
+def convert(prmtop_FN, db_FN, inpcrd_FN=None, force=False):
+  """
+  Writes a database for a prmtop file, unless the database
+  was created from prmtop and inpcrd files with the same contents.
+  Returns True if the database was written.
+  """
+  if not ((inpcrd_FN is not None) and os.path.isfile(inpcrd_FN)):
+    inpcrd_FN = None
+  # The database starts with a hash of its sources
+  header = '# source_sha1 = %s\n'%source_hash(prmtop_FN, inpcrd_FN)
+  if (not force) and os.path.isfile(db_FN):
+    F = open(db_FN,'r')
+    first_line = F.readline()
+    F.close()
+    if first_line==header:
+      print "Database %s is up to date"%db_FN
+      return False
+
+  print "Creating database "+db_FN
+
+  ### Loads AMBER parameter and coordinate files
+  prmtop = prmtop_IO.read(prmtop_FN, varnames)
+  coords = read_inpcrd(inpcrd_FN) if inpcrd_FN is not None else None
+
+  ### Writes database
+  db_dir = os.path.dirname(db_FN)
+  if not (db_dir=='' or os.path.exists(db_dir)):
+    os.system('mkdir -p '+db_dir)
+
+  text = database_text(prmtop, coords, os.path.basename(db_FN))
+  db = open(db_FN,'w')
+  db.write(header + text)
+  db.close()
+  return True
+
 ############
 ### MAIN ###
 ############
@@ -24,122 +174,46 @@ mass2symbols = {12.01:'C',1.008:'H',19.00:'F',35.45:'Cl',79.90:'Br',126.9:'I',\
 import argparse
 parser = argparse.ArgumentParser(
   description='Convert AMBER prmtop and inpcrd files to a MMTK database file')
-parser.add_argument('prmtop_FN', help='AMBER prmtop file')
-parser.add_argument('db_FN', help='MMTK Database file')
+parser.add_argument('prmtop_FN', nargs='?', help='AMBER prmtop file')
+parser.add_argument('db_FN', nargs='?', help='MMTK Database file')
 parser.add_argument('--inpcrd_FN', help='AMBER inpcrd file')
+parser.add_argument('--batch', \
+  help='File with one conversion per line: ' + \
+       'prmtop_FN db_FN [inpcrd_FN]')
+parser.add_argument('--force', action='store_true', default=False, \
+  help='Writes databases even if they are up to date')
 parser.add_argument('-f', help='Does nothing')
 args = parser.parse_args()
 
-print "Creating database "+args.db_FN
-
-### Loads AMBER parameter file
 import AlGDock
 import AlGDock.IO
 prmtop_IO = AlGDock.IO.prmtop()
-prmtop = prmtop_IO.read(args.prmtop_FN, varnames)
-
-# Modify atom names to be acceptable python variables and include the atom index
-prmtop['ATOM_NAME'] = ['%si%s'%(a_n.replace("'","p").strip(),ind) \
-  for (a_n,ind) in zip(prmtop['ATOM_NAME'],range(len(prmtop['ATOM_NAME'])))]
-
-NATOM = prmtop['POINTERS'][0]
-NTYPES = prmtop['POINTERS'][1]
-
-### Extract Lennard-Jones well depth and radii for each atom
-LJ_radius = numpy.ndarray(shape=(NTYPES), dtype=float)
-LJ_depth = numpy.ndarray(shape=(NTYPES), dtype=float)
-for i in range(NTYPES):
-  LJ_index = prmtop['NONBONDED_PARM_INDEX'][NTYPES*i+i]-1
-  if prmtop['LENNARD_JONES_ACOEF'][LJ_index]<1.0e-6:
-    LJ_radius[i] = 0
-    LJ_depth[i] = 0
-  else:
-    factor = 2 * prmtop['LENNARD_JONES_ACOEF'][LJ_index] / \
-      prmtop['LENNARD_JONES_BCOEF'][LJ_index]
-    LJ_radius[i] = pow(factor, 1.0/6.0) * 0.5
-    LJ_depth[i] = prmtop['LENNARD_JONES_BCOEF'][LJ_index] / 2 / factor
-# More useful for later calculations
-root_LJ_depth = numpy.sqrt(LJ_depth)
-LJ_diameter = LJ_radius*2
-del i, LJ_index, factor
-
-### Loads AMBER inpcrd file
-if (args.inpcrd_FN is not None) and os.path.isfile(args.inpcrd_FN):
-  inpcrdF = open(args.inpcrd_FN,'r')
-  inpcrd = inpcrdF.read().split('\n')
-  inpcrdF.close()
-  inpcrd.pop(0) # Title
-  NATOM = int(inpcrd.pop(0)) # Number of atoms
-  w = 12 # Width of field
-  coords = []
-  for line in inpcrd:
-        coords = coords + [float(line[x:x+w]) for x in range(0,len(line),w)]
-  del w, inpcrdF, inpcrd
-else:
-  coords = None
-
-### Writes database
-db_dir = os.path.dirname(args.db_FN)
-if not (db_dir=='' or os.path.exists(db_dir)):
-  os.system('mkdir -p '+db_dir)
-
-db = open(args.db_FN,'w')
-
-db.write("name='%s'\n"%os.path.basename(args.db_FN))
-
-for [name,mass] in zip(prmtop['ATOM_NAME'],prmtop['MASS']):
-  if mass in mass2symbols.keys():
-    db.write(name.strip()+" = Atom('"+mass2symbols[mass]+"')\n")
-  else:
-    raise Exception('Unknown atom with mass: %f!'%mass)
-    sys.exit()
-
-# The order of atoms in the prmtop file (not used by MMTK)
-db.write("prmtop_order = [" + ", ".join(["%s"%name.strip() \
-  for name in prmtop['ATOM_NAME']]) + "]\n")
-
-bondList = list(prmtop['BONDS_INC_HYDROGEN']) + \
-  list(prmtop['BONDS_WITHOUT_HYDROGEN'])
-db.write("bonds = [" + ", ".join(["Bond(%s, %s)"%(\
-  prmtop['ATOM_NAME'][bondList[i]/3].strip(),prmtop['ATOM_NAME'][bondList[i+1]/3].strip()) \
-  for i in range(0,len(bondList),3)]) + "]\n")
-
-db.write("amber12_atom_type = {" + ", ".join(["%s: '%s'"%(name.strip(),type.strip()) \
-  for (name,type) in zip(prmtop['ATOM_NAME'],prmtop['AMBER_ATOM_TYPE'])]) + "}\n")
-
-# Write the charge, converted to units of electric charge
-# AMBER prmtop files multiply the actual charge by 18.2223, hence the division
-db.write("amber_charge = {" + ", ".join(\
-  ["%s: '%f'"%(name.strip(),charge/18.2223) \
-   for (name,charge) in zip(prmtop['ATOM_NAME'],prmtop['CHARGE'])]) + "}\n")
-
-# Write the grid scaling factors
-# Because the grids are in units of kcal/mol, the scaling factors are multiplied by 4.184 to convert to kJ/mol
-db.write("scaling_factor_electrostatic = {" + \
-  ", ".join(["%s: %f"%(name.strip(),4.184*charge/18.2223) 
-    for (name,charge) in zip(prmtop['ATOM_NAME'],prmtop['CHARGE'])]) \
-  + "}\n")
-atom_type_indicies = [prmtop['ATOM_TYPE_INDEX'][atom_index]-1 \
-  for atom_index in range(NATOM)]
-db.write("scaling_factor_LJr = {" + \
-  ", ".join(["%s: %f"%(name.strip(),4.184*root_LJ_depth[type_index]*(LJ_diameter[type_index]**6)) \
-             for (name,type_index) in zip(prmtop['ATOM_NAME'],atom_type_indicies)]) + "}\n")
-db.write("scaling_factor_LJa = {" + \
-  ", ".join(["%s: %f"%(name.strip(),4.184*root_LJ_depth[type_index]*(LJ_diameter[type_index]**3)) \
-             for (name,type_index) in zip(prmtop['ATOM_NAME'],atom_type_indicies)]) + "}\n")
-
-# Write the generalized Born implicit solvent parameters.
-# The radii will be converted from Angstroms to nanometers.
-db.write("scaling_factor_BornRadii = {" + \
-  ", ".join(["%s: %f"%(name.strip(),radius/10.) \
-             for (name,radius) in zip(prmtop['ATOM_NAME'],prmtop['RADII'])]) + "}\n")
-db.write("scaling_factor_BornScreening = {" + \
-  ", ".join(["%s: %f"%(name.strip(),radius) \
-             for (name,radius) in zip(prmtop['ATOM_NAME'],prmtop['SCREEN'])]) + "}\n")
-
-# Write the coordinates, converted from Angstroms to nanometers
-if coords is not None:
-  db.write("configurations = {\n")
-  db.write("'default': Cartesian({" + ", ".join(["%s: (%f, %f, %f)"%(name.strip(), coords[i]/10.0, coords[i+1]/10.0, coords[i+2]/10.0) for (name,i) in zip(prmtop['ATOM_NAME'],range(0,NATOM*3,3))]) + "})}\n")
-
-db.close()
+
+jobs = []
+if args.prmtop_FN is not None:
+  if args.db_FN is None:
+    raise Exception('A database file name is required')
+  jobs.append((args.prmtop_FN, args.db_FN, args.inpcrd_FN))
+if args.batch is not None:
+  F = open(args.batch,'r')
+  for line in F:
+    fields = line.split()
+    if len(fields)>1:
+      jobs.append((fields[0], fields[1], \
+        fields[2] if len(fields)>2 else None))
+  F.close()
+if jobs==[]:
+  raise Exception('No prmtop files to convert')
+
+# In batch mode, a failed conversion does not stop the others
+nfailed = 0
+for (prmtop_FN, db_FN, inpcrd_FN) in jobs:
+  try:
+    convert(prmtop_FN, db_FN, inpcrd_FN, args.force)
+  except Exception as e:
+    if args.batch is None:
+      raise
+    print 'Error converting %s: %s'%(prmtop_FN, repr(e))
+    nfailed += 1
+if nfailed>0:
+  sys.exit(1)
@@ -60,12 +60,17 @@ for FN in FNs:
   print 'mv %s %s'%(FN, os.path.join(dirN, receptor+'.mol2.gz'))
 
 # Convert from mol2 to netcdf files
-FNs = glob.glob('%s/dock6/*/*/*.mol2.gz'%args.prefix)
-for FN in FNs:
-  if not os.path.isfile(FN[:-8]+'.nc'):
-    print 'Converting %s to nc'%FN
-    os.system('python $ALGDOCKHOME/Pipeline/dock6_to_nc.py '+FN)
-    # os.remove(FN)
+FNs = [FN for FN in glob.glob('%s/dock6/*/*/*.mol2.gz'%args.prefix) \
+  if not os.path.isfile(FN[:-8]+'.nc')]
+if len(FNs)>0:
+  print 'Converting %d files to nc'%len(FNs)
+  list_FN = os.path.join(args.prefix, 'dock6_to_nc.txt')
+  F = open(list_FN,'w')
+  F.write('\n'.join(FNs))
+  F.close()
+  os.system('python $ALGDOCKHOME/Pipeline/dock6_to_nc.py ' + \
+    '--list '+list_FN)
+  os.remove(list_FN)
 
 # Rename db files to lowercase 
 FNs = glob.glob('%s/ligand/AlGDock_in/*.db'%args.prefix)
@@ -13,6 +13,9 @@ parser.add_argument('--exclude_ligand', nargs='+', default=None, \
 parser.add_argument('--new_instance_per_ligand', action='store_true', \
   default=False, \
   help='Runs run_AlGDock.py for each ligand')
+parser.add_argument('--pack', type=int, default=None, \
+  help='Submits workers that each run up to PACK jobs ' + \
+       'for the same receptor and repetition in one process')
 parser.add_argument('--include_receptor', nargs='+', default=None, \
   help='Only runs AlGDock for these receptors')
 parser.add_argument('--exclude_receptor', nargs='+', default=None, \
@@ -60,6 +63,14 @@ parser.add_argument('--check_tarballs', action='store_true', default=False, \
   help='Check inside tarballs for files')
 parser.add_argument('--skip_onq', action='store_true', default=False, \
   help='Skips looking for the job on the queue')
+parser.add_argument('--job_index', default=None, \
+  help='SQLite file that caches file checks and stores job states')
+parser.add_argument('--list_pending', action='store_true', default=False, \
+  help='Lists jobs that were not complete in the latest scan ' + \
+       'stored in JOB_INDEX and exits')
+parser.add_argument('--scheduler', choices=['queue','fake'], default='queue', \
+  help='Submits jobs to the cluster queue or ' + \
+       'to a local fake queue stored in JOB_INDEX')
 # Arguments related to scoring and assessment
 parser.add_argument('--score', choices=['xtal','dock',None], default=None,
   help='Does a scoring rather than ab initio docking. ' + \
@@ -212,11 +223,45 @@ for path in ['ligand','receptor','receptor_grids','complex',\
              'tree_dock','tree_cool','dock6']:
   setattr(args_in,path,os.path.abspath(getattr(args_in,path)))
 
-if not args_in.skip_onq:
+if args_in.job_index is not None:
+  execfile(os.path.join(dirs['script'],'_job_index.py'))
+  index = JobIndex(args_in.job_index)
+  if args_in.list_pending:
+    # Jobs without docked configurations or dock6 files cannot run
+    pending = index.jobs(exclude_status=['complete','recently_redone', \
+      'no_configurations','no_dock6'])
+    for (jobname, status, directory) in pending:
+      print '%s\t%s\t%s'%(jobname, status, directory)
+    print '%d jobs pending'%len(pending)
+    import sys
+    sys.exit()
+  index.begin_scan()
+else:
+  index = None
+  if args_in.list_pending or (args_in.scheduler=='fake'):
+    raise Exception('A job index is required')
+
+if args_in.scheduler=='fake':
+  scheduler = FakeScheduler(index)
+  onq = scheduler.jobs_on_queue()
+elif not args_in.skip_onq:
   execfile(os.path.join(dirs['script'],'_jobs_on_queue.py'))
   onq = jobs_on_queue()
 else:
   onq = []
+if (args_in.pack is not None) and (args_in.scheduler=='queue') and \
+    os.path.exists('/stash'):
+  # As in qsub_command.py, files are staged on the Open Science Grid.
+  # Files from packed jobs would have the same names.
+  raise Exception('Packs are not supported on clusters that stage files')
+# Jobs in packs on the queue are also on the queue
+for packname in list(onq):
+  jobs_FN = os.path.join(dirs['current'],'packs',packname+'.json')
+  if os.path.isfile(jobs_FN):
+    import json
+    F = open(jobs_FN,'r')
+    onq += [str(job['jobname']) for job in json.load(F)]
+    F.close()
 command_paths = findPaths(['qsub_command','gaff'])
 algdock_path = findPath(search_paths['algdock'])
 
@@ -268,7 +313,10 @@ else:
 if os.path.isfile(args_in.ligand):
   ligand_FNs = [os.path.abspath(args_in.ligand)]
 elif os.path.isdir(args_in.ligand):
-  ligand_FNs = glob.glob(os.path.join(args_in.ligand,'*/*.tar.gz'))
+  if index is not None:
+    ligand_FNs = index.glob(args_in.ligand, ['*','*.tar.gz'])
+  else:
+    ligand_FNs = glob.glob(os.path.join(args_in.ligand,'*/*.tar.gz'))
   ligand_FNs = sorted([os.path.abspath(FN) for FN in ligand_FNs])
 else:
   raise Exception('Ligand input %s is not a file or directory!'%args_in.ligand)
@@ -324,7 +372,10 @@ receptor_FNs = [FN for FN in receptor_FNs if np.array(\
 if os.path.isfile(args_in.complex):
   complex_FNs = [args_in.complex]
 elif os.path.isdir(args_in.complex):
-  complex_FNs = glob.glob(os.path.join(args_in.complex,'*/*/*.tar.gz'))
+  if index is not None:
+    complex_FNs = index.glob(args_in.complex, ['*','*','*.tar.gz'])
+  else:
+    complex_FNs = glob.glob(os.path.join(args_in.complex,'*/*/*.tar.gz'))
 else:
   raise Exception('Complex input %s is not a file or directory!'%args_in.complex)
 # Require that complex tarball has nonzero size
@@ -356,6 +407,59 @@ job_status = {'submitted':0, 'skipped':0, 'no_complex':0, 'no_configurations':0,
 import tarfile
 checked = []
 
+def tar_names(FN):
+  if index is not None:
+    return index.tar_names(FN)
+  tarF = tarfile.open(FN)
+  return [m.name for m in tarF.getmembers()]
+
+packs = {}
+npacks = 0
+
+def submit_pack(pack_key):
+  # Submits a worker that runs all the jobs in a pack
+  global npacks
+  jobs = packs.pop(pack_key)
+  pack_dir = os.path.join(dirs['current'],'packs')
+  if not os.path.isdir(pack_dir):
+    os.system('mkdir -p '+pack_dir)
+  packname = '-'.join(dirs['current'].split('/')[-2:] + \
+    ['pack', pack_key[0], '%d'%pack_key[1], '%d'%npacks])
+  jobs_FN = os.path.join(pack_dir, packname+'.json')
+  import json
+  F = open(jobs_FN,'w')
+  json.dump([dict([(key, job[key]) \
+    for key in ['jobname','directory','arguments']]) for job in jobs], \
+    F, indent=2)
+  F.close()
+  command = 'python ' + os.path.join(dirs['script'],'run_AlGDock_pack.py') + \
+    ' ' + jobs_FN
+  print 'Pack %s with %d jobs'%(packname, len(jobs))
+  if args_in.scheduler=='fake':
+    if not args_in.dry:
+      scheduler.submit(packname, command, pack_dir)
+  else:
+    # The worker needs as much memory as the largest job
+    mem = max([job['mem'] for job in jobs])
+    outputFNs = [FN for job in jobs for FN in job['outputFNs']]
+    os.chdir(pack_dir)
+    import subprocess
+    subprocess.call(['python', command_paths['qsub_command'], \
+      packname, command, '--mem', '%d'%mem] + \
+      ['--input_files'] + outputFNs + \
+      ['--output_files'] + outputFNs + \
+      {True:['--dry'],False:[]}[args_in.dry] + \
+      {True:['--no_release'],False:[]}[args_in.no_release])
+    os.chdir(dirs['current'])
+  npacks += 1
+
+def record(status, directory=None):
+  # Counts the job status and stores it in the index
+  job_status[status] += 1
+  if index is not None:
+    index.set_job(jobname, status, labels['ligand'], labels['receptor'], \
+      rep, args_in.run_type, directory)
+
 for rep in range(args_in.reps[0],args_in.reps[1]):
   for ligand_FN in ligand_FNs[args_in.first_ligand:args_in.first_ligand+args_in.max_ligands]:
     labels = {}
@@ -377,9 +481,10 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
     for key in [('ligand_prmtop','prmtop'),('ligand_inpcrd','inpcrd'), \
                 ('frcmodList','frcmod')]:
       paths_in_tar[key[0]] = labels['ligand']+'.'+key[1]
+    if index is not None:
+      index.commit()
     if args_in.check_tarballs and (ligand_FN not in checked):
-      tarF = tarfile.open(ligand_FN)
-      names = [m.name for m in tarF.getmembers()]
+      names = tar_names(ligand_FN)
       not_found = [paths_in_tar[key] for key in paths_in_tar.keys() \
         if not paths_in_tar[key] in names]
       if len(not_found)>0:
@@ -393,11 +498,17 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
       os.system('mkdir -p '+paths['dir_cool'])
     if (args_in.run_type in ['initial_cool','cool']) and \
         nonzero(os.path.join(paths['dir_cool'],'f_L.pkl.gz')):
-      job_status['complete'] += 1
+      # Cooling does not depend on the receptor
+      jobname = '-'.join(dirs['current'].split('/')[-2:] + \
+        ['%s-%d'%(labels['ligand'],rep)])
+      labels['receptor'] = None
+      record('complete', paths['dir_cool'])
       continue # Cooling is already done
     for receptor_FN in receptor_FNs:
       labels['receptor'] = os.path.basename(receptor_FN)[:-7]
       labels['complex'] = labels['library']+'.'+labels['key']+'-'+labels['receptor']
+      labels['job'] = '%s-%d'%(labels['complex'],rep)
+      jobname = '-'.join(dirs['current'].split('/')[-2:]+[labels['job']])
       # Identify receptor files
       for key in ['prmtop','inpcrd']:
         paths['receptor_'+key] = os.path.abspath(receptor_FN[:-6]+key)
@@ -413,7 +524,7 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
         labels['lib_subdir'], labels['key'], labels['receptor']+'.tar.gz')
       if not (os.path.isfile(complex_tar_FN)):
         print 'No complex tarfile ' + complex_tar_FN
-        job_status['no_complex'] += 1
+        record('no_complex')
         continue # Complex files are missing
       paths['complex_tarball'] = complex_tar_FN
 
@@ -423,8 +534,7 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
       if 'receptor_fixed_atoms' in paths.keys():
         paths_in_tar['complex_fixed_atoms'] = labels['complex']+'.pdb'
       if args_in.check_tarballs and (complex_tar_FN not in checked):
-        tarF = tarfile.open(complex_tar_FN)
-        names = [m.name for m in tarF.getmembers()]
+        names = tar_names(complex_tar_FN)
         not_found = [paths_in_tar[key] for key in paths_in_tar.keys() \
           if key.startswith('complex') and not paths_in_tar[key] in names]
         if len(not_found)>0:
@@ -440,14 +550,13 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
         print 'Necessary files:'
         print paths
         print 'Files are missing: ' + ', '.join(np.array(input_FNs)[input_FNs_missing])
-        job_status['missing_file'] += 1
+        record('missing_file')
         continue # Files are missing
 
       # Convert relative path to absolute paths
       for key in paths.keys():
         paths[key] = os.path.abspath(paths[key])
 
-      labels['job'] = '%s-%d'%(labels['complex'],rep)
       paths['dir_dock'] = os.path.join(args_in.tree_dock, \
         labels['lib_subdir'], labels['key'], '%s-%d'%(labels['receptor'],rep))
       if not os.path.isdir(paths['dir_dock']):
@@ -460,41 +569,46 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
         if (args_in.run_type=='redo_free_energies') and \
             (args_in.older_than is not None) and \
             (time.time()-os.path.getmtime(f_RL_FN))/60./60.<args_in.older_than:
-          job_status['recently_redone'] += 1
+          record('recently_redone', paths['dir_dock'])
           continue
 
         if (args_in.run_type in \
             ['random_dock','initial_dock', 'dock','all','timed']):
           if args_in.check_complete:
-            import gzip, pickle
-            F = gzip.open(f_RL_FN,'r')
-            dat = pickle.load(F)
-            F.close()
-            try:
-              completed_cycles = np.min([len(dat[-1][p+'_MBAR']) for p in args_in.phases])
-              complete = (completed_cycles >= int(args_in.dock_repX_cycles))
-            except:
+            if index is not None:
+              completed_cycles = \
+                index.completed_cycles(f_RL_FN, args_in.phases)
+            else:
+              import gzip, pickle
+              F = gzip.open(f_RL_FN,'r')
+              dat = pickle.load(F)
+              F.close()
+              try:
+                completed_cycles = np.min(\
+                  [len(dat[-1][p+'_MBAR']) for p in args_in.phases])
+              except:
+                completed_cycles = None
+            if completed_cycles is None:
               print 'Error in '+f_RL_FN
               completed_cycles = 0
-              complete = False
+            complete = (completed_cycles >= int(args_in.dock_repX_cycles))
             if complete:
               # Docking is done
-              job_status['complete'] += 1
+              record('complete', paths['dir_dock'])
               continue
             else:
               print '%d/%d cycles in %s'%(\
                 completed_cycles, args_in.dock_repX_cycles, paths['dir_dock'])
           else:
               # Docking is done
-              job_status['complete'] += 1
+              record('complete', paths['dir_dock'])
               continue
       elif (args_in.run_type=='redo_free_energies'):
-        job_status['missing_file'] += 1
+        record('missing_file', paths['dir_dock'])
         continue
         
-      jobname = '-'.join(dirs['current'].split('/')[-2:]+[labels['job']])
       if jobname in onq:
-        job_status['onq'] += 1
+        record('onq', paths['dir_dock'])
         print jobname + ' is on the queue'
         continue # Job is on the queue
 
@@ -533,12 +647,12 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
               labels['lib_subdir'], labels['key'], labels['receptor'] + '.nc'))
             if not nonzero(val):
               if os.path.isfile(val[:-3]+'.mol2.gz'):
-                job_status['no_configurations'] += 1
+                record('no_configurations', paths['dir_dock'])
                 skip_job = True
                 break # No configurations in dock6
               else:
                 print 'No dock6 output in '+val
-                job_status['no_dock6'] += 1
+                record('no_dock6', paths['dir_dock'])
                 skip_job = True
                 break # Dock6 files are missing
         elif key=='frcmodList':
@@ -605,29 +719,47 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
           terminal_command = algdock_path + ' '
       terminal_command += ' \\\n  '.join(terminal_to_pass)
 
+      if args_in.run_type=='random_dock':
+        mem=16
+      else:
+        mem=4
+
       if args_in.interactive:
         print interactive_command
+      elif args_in.pack is not None:
+        # Jobs for the same receptor and repetition share a worker
+        pack_key = (labels['receptor'], rep)
+        if not pack_key in packs.keys():
+          packs[pack_key] = []
+        packs[pack_key].append({'jobname':jobname, \
+          'directory':paths['dir_cool'] \
+            if args_in.run_type in ['initial_cool','cool'] \
+            else paths['dir_dock'], \
+          'arguments':' '.join(terminal_to_pass).split(), \
+          'mem':mem, 'outputFNs':outputFNs.values()})
+        if len(packs[pack_key])==args_in.pack:
+          submit_pack(pack_key)
       else:
-        if args_in.run_type=='random_dock':
-          mem=16
-        else:
-          mem=4
         if args_in.run_type in ['initial_cool','cool']:
           os.chdir(paths['dir_cool'])
         else:
           os.chdir(paths['dir_dock'])
-        import subprocess
-        subprocess.call(['python', command_paths['qsub_command'], \
-          jobname, terminal_command, '--mem', '%d'%mem] + \
-          ['--input_files'] + outputFNs.values() + \
-          ['--output_files'] + list(outputFNs) + \
-          ['--output_remaps'] + transfer_output_remaps + \
-          ['--comment', interactive_command.replace(' \\\n','')] + \
-          {True:['--dry'],False:[]}[args_in.dry] + \
-          {True:['--no_release'],False:[]}[args_in.no_release])
+        if args_in.scheduler=='fake':
+          if not args_in.dry:
+            scheduler.submit(jobname, terminal_command, os.getcwd())
+        else:
+          import subprocess
+          subprocess.call(['python', command_paths['qsub_command'], \
+            jobname, terminal_command, '--mem', '%d'%mem] + \
+            ['--input_files'] + outputFNs.values() + \
+            ['--output_files'] + list(outputFNs) + \
+            ['--output_remaps'] + transfer_output_remaps + \
+            ['--comment', interactive_command.replace(' \\\n','')] + \
+            {True:['--dry'],False:[]}[args_in.dry] + \
+            {True:['--no_release'],False:[]}[args_in.no_release])
         os.chdir(dirs['current'])
       
-      job_status['submitted'] += 1
+      record('submitted', paths['dir_dock'])
 
       if (args_in.max_jobs is not None) and \
          (job_status['submitted']>=args_in.max_jobs):
@@ -639,9 +771,24 @@ for rep in range(args_in.reps[0],args_in.reps[1]):
      (job_status['submitted']>=args_in.max_jobs):
     break
 
+for pack_key in sorted(packs.keys()):
+  submit_pack(pack_key)
+
+if index is not None:
+  # The scan reached every job unless it was limited to
+  # a range of ligands or stopped at the maximum number of jobs
+  index.finish_scan(complete=\
+    (args_in.first_ligand==0) and \
+    (args_in.max_ligands>=len(ligand_FNs)) and \
+    not ((args_in.max_jobs is not None) and \
+         (job_status['submitted']>=args_in.max_jobs)))
+
 format_str = "Jobs: {submitted} submitted, {skipped} skipped, " + \
   "{no_complex} without complex files, {no_dock6} without dock6 files, " + \
   "{no_configurations} have no docked configurations, " + \
   "{missing_file} missing other files, {onq} on the queue, " + \
   "{recently_redone} recently redone, {complete} complete"
 print format_str.format(**job_status)
+
+if index is not None:
+  index.close()
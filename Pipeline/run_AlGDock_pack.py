@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+# Runs AlGDock for a pack of jobs in a single process.
+# MMTK is imported once and receptor grids and prmtop files are read once,
+# which is a large part of the time for short jobs like scoring.
+# Each job runs in its own directory and writes its output
+# to JOBNAME.out in that directory.
+# If a job fails, the traceback is written to its output and
+# the next job is run.
+
+import argparse
+parser = argparse.ArgumentParser(\
+  description='Runs AlGDock for several jobs in one process')
+parser.add_argument('jobs_FN', \
+  help='JSON file with a list of jobs. Each job is a dictionary with ' + \
+       'jobname, directory, and arguments ' + \
+       '(a list of command line arguments for BindingPMF.py)')
+args = parser.parse_args()
+
+import os, sys, json, time, traceback
+
+import AlGDock.IO
+AlGDock.IO.file_cache = {}
+from AlGDock.BindingPMF import BPMF, arguments
+
+BPMF_parser = argparse.ArgumentParser()
+for key in arguments.keys():
+  BPMF_parser.add_argument('--'+key, **arguments[key])
+
+F = open(args.jobs_FN,'r')
+jobs = json.load(F)
+F.close()
+
+status_FN = os.path.splitext(args.jobs_FN)[0] + '.status.json'
+status = {}
+start_dir = os.getcwd()
+
+for job in jobs:
+  jobname = str(job['jobname'])
+  start_time = time.time()
+  log = open(os.path.join(job['directory'], jobname+'.out'),'a')
+  sys.stdout = log
+  sys.stderr = log
+  try:
+    os.chdir(job['directory'])
+    job_args = BPMF_parser.parse_args([str(a) for a in job['arguments']])
+    self = BPMF(**vars(job_args))
+    del self
+    result = 'complete'
+  except (Exception, SystemExit):
+    # argparse exits on invalid arguments
+    traceback.print_exc(file=log)
+    result = 'failed'
+  finally:
+    sys.stdout = sys.__stdout__
+    sys.stderr = sys.__stderr__
+    log.close()
+    os.chdir(start_dir)
+
+  status[jobname] = {'status':result, 'time':time.time()-start_time}
+  print '%s %s in %.1f s'%(jobname, result, status[jobname]['time'])
+  F = open(status_FN,'w')
+  json.dump(status, F, indent=2)
+  F.close()
+
+nfailed = len([s for s in status.values() if s['status']=='failed'])
+print '%d jobs complete, %d failed'%(len(status)-nfailed, nfailed)
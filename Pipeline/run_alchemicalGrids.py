@@ -18,6 +18,10 @@ parser.add_argument('--spacing', nargs=3, type=float, \
   help='Grid spacing (overrides header)')
 parser.add_argument('--counts', nargs=3, type=int, help='Number of point in each direction (overrides header)')
 parser.add_argument('--max_jobs', default=None, type=int)
+parser.add_argument('--cores', default=1, type=int, \
+  help='Number of processes per job. ' + \
+    'With more than one, the Poisson-Boltzmann grid uses one core ' + \
+    'and the direct grids are divided among the rest.')
 parser.add_argument('--dry', action='store_true', default=False, \
   help='Does not actually submit the job to the queue')
 parser.add_argument('--pylab', action='store_true')
@@ -52,16 +56,17 @@ for prmtop_FN in prmtopFNs:
   command = 'python {0}/alchemicalGrids.py --prmtop_FN {1} --inpcrd_FN {2}' + \
     ' --pqr_FN {3}.pqr --PB_FN {3}.PB.nc --ele_FN {3}.ele.{4}.nc' + \
     ' --LJa_FN {3}.LJa.{4}.nc --LJr_FN {3}.LJr.{4}.nc' + \
-    ' --spacing {5[0]} {5[1]} {5[2]}' + \
+    ' --spacing {5[0]} {5[1]} {5[2]} --cores {7}' + \
     {True:'', False:' --counts {6[0]} {6[1]} {6[2]}'}[args.counts is None]
   command = command.format(dirs['script'], prmtop_FN, inpcrd_FN, prefix, \
-    int(args.spacing[0]*100), args.spacing, args.counts)
+    int(args.spacing[0]*100), args.spacing, args.counts, args.cores)
   print command
 
   print 'Submitting: ' + command
   import subprocess
   subprocess.call(['python',command_paths['qsub_command'],\
-    jobname, command, '--ambertools'] + {True:['--dry'],False:[]}[args.dry])
+    jobname, command, '--ambertools', '--ppn', str(args.cores)] + \
+    {True:['--dry'],False:[]}[args.dry])
 
   job_count += 1
   if (args.max_jobs is not None) and (job_count>=args.max_jobs):
@@ -6,6 +6,10 @@ parser.add_argument('--job_block', default=job_block, type=int, \
   help='Number of dockings per job')
 parser.add_argument('--dry', action='store_true', default=False, \
   help='Does not actually submit the job to the queue')  
+parser.add_argument('--cores', default=1, type=int, \
+  help='Number of processes in each job')
+parser.add_argument('--complevel', default=9, type=int, \
+  help='zlib compression level, from 0 (none) to 9')
 args = parser.parse_args()
 
 # Find dock6_to_nc.py
@@ -19,26 +23,18 @@ command_paths = findPaths(['qsub_command'])
 
 import glob
 
-# Convert from mol2 to netcdf files
-command_list = []
+# Convert from mol2 to netcdf files.
+# Each job converts a block of files in a single call to dock6_to_nc.py.
 FNs = [FN for FN in glob.glob('dock6/*/*/*.mol2.gz') \
-  if os.path.getsize(FN)>0]
-FNs_c = []
-outFNs_c = []
-for FN in FNs:
-  if not os.path.isfile(FN[:-8]+'.nc'):
-    command_list.append('python {0} {1}'.format(dock6_to_nc_script, FN))
-    FNs_c.append(FN)
-    outFNs_c.append(FN[:-8]+'.nc')
-  ncommands = len(command_list)
-  if ncommands==args.job_block or ((ncommands>0) and (FN==FNs[-1])):
-    command = '; '.join(command_list)
-    print command
-    os.system(' '.join(['python',command_paths['qsub_command'],\
-        'dock6_to_nc', "'"+command+"'", \
-        '--input_files', dock6_to_nc_script, ' '.join(FNs_c) + \
-        '--output_files', ' '.join(outFNs_c), \
-        {True:'--dry',False:''}[args.dry]]))
-    command_list = []
-    FNs_c = []
-    outFNs_c = []
+  if os.path.getsize(FN)>0 and not os.path.isfile(FN[:-8]+'.nc')]
+for start in range(0, len(FNs), args.job_block):
+  FNs_c = FNs[start:start+args.job_block]
+  outFNs_c = [FN[:-8]+'.nc' for FN in FNs_c]
+  command = 'python {0} --cores {1} --complevel {2} {3}'.format(\
+    dock6_to_nc_script, args.cores, args.complevel, ' '.join(FNs_c))
+  print command
+  os.system(' '.join(['python',command_paths['qsub_command'],\
+      'dock6_to_nc', "'"+command+"'", \
+      '--input_files', dock6_to_nc_script, ' '.join(FNs_c), \
+      '--output_files', ' '.join(outFNs_c), \
+      {True:'--dry',False:''}[args.dry]]))
@@ -120,6 +120,7 @@ paths = [os.path.join('AlGDock', 'ForceFields', 'Cylinder'),
          os.path.join('AlGDock', 'ForceFields', 'Pose'),
          os.path.join('AlGDock', 'ForceFields', 'ElectricField'),
          os.path.join('AlGDock', 'Integrators', 'ExternalMC'),
+         os.path.join('AlGDock', 'Integrators', 'GHMC'),
          os.path.join('AlGDock', 'Integrators', 'HamiltonianMonteCarlo'),
          os.path.join('AlGDock', 'Integrators', 'MixedHMC'),
          os.path.join('AlGDock', 'Integrators', 'NUTS'),
@@ -365,6 +366,7 @@ ext_module_name_and_path = [\
     ['AlGDock/ForceFields/ElectricField/MMTK_electric_field.c']), \
   ('MMTK_electric_field_z', \
     ['AlGDock/ForceFields/ElectricField/MMTK_electric_field_z.c']), \
+  ('HMC', ['AlGDock/Integrators/HamiltonianMonteCarlo/HMC.pyx']), \
   ('NUTS', ['AlGDock/Integrators/NUTS/NUTS.pyx']), \
   ('SmartDarting', ['AlGDock/Integrators/SmartDarting/SmartDarting.pyx']), \
   ('BAT', ['Src/BAT.pyx']),
@@ -427,6 +429,7 @@ rigid receptor.
                    'AlGDock.ForceFields.ElectricField',
                    'AlGDock.Integrators',
                    'AlGDock.Integrators.ExternalMC',
+                   'AlGDock.Integrators.GHMC',
                    'AlGDock.Integrators.HamiltonianMonteCarlo',
                    'AlGDock.Integrators.MixedHMC',
                    'AlGDock.Integrators.NUTS',